@@ -1,21 +1,84 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+from flask import Flask, Request, render_template, request, jsonify, redirect, url_for, flash, abort, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
-from datetime import datetime
+from flask.cli import AppGroup
+from sqlalchemy import bindparam, event, func, inspect, select, true
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import object_session, selectinload, validates
+from datetime import datetime, timedelta
 import os
 import requests
 from bs4 import BeautifulSoup
 import re
 import json
+import click
+import logging
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.utils import secure_filename
+from config.settings import Config as BaseConfig, config as app_configs
+from utils.people import (clean_participants, extract_participants, find_speaker, name_block, name_key,
+                          name_similarity, normalize_name)
+from utils.minhash import band_keys, decode_signature, encode_signature, signature as page_signature, similarity
+from utils.migrations import Migrations, add_column, create_indexes, drop_column, has_column
+from utils.scoring import (FEATURE_VERSION, ScoringModel, decode_features, encode_features, extract_features,
+                           format_engagement, format_priority_score)
+from utils.related import MAX_QUERY_TERMS, idf, term_weights, vector_norm
+from utils.search import (clear_index, create_search_table, index_document, index_documents, remove_document,
+                          search as search_documents)
+from utils.storage import apply_sqlite_pragmas, sqlite_pragma_values
+from utils.cache import ResponseCache
+from utils.serialization import (MeetingDetail, MeetingSummary, PersonMeeting, dumps_text, encode_body, load_column,
+                                 negotiate, variant_tag)
+from utils.blobs import blob_codec, blob_text, dump_blob, load_blob, train_dictionary
+from utils.bulk_import import ImportStats, batched, bulk_insert, bulk_update, iter_ndjson_records
+from utils.columnar import COLUMNAR_FORMATS, PartitionedWriter, pa, require_pyarrow
+from utils.dates import find_meeting_date, parse_meeting_date, parse_range_bound
+from utils.export import EXPORT_FORMATS, iter_csv, iter_ndjson
+from utils.memo import flush_mutations, forget, memoized
+from utils.olap import SNAPSHOT_MARKER, AnalyticsEngine, AnalyticsUnavailable, MetricError
+from utils.parsing import parse_duration, parse_percent
+from utils.singleflight import SingleFlight
+from utils.urls import normalize_url
 
 app = Flask(__name__)
-app.config['SECRET_KEY'] = 'civicscoop-secret-key-2024'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///civicscoop.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['UPLOAD_FOLDER'] = 'static/uploads'
+# Settings live in config/settings.py; FLASK_CONFIG=production selects the tuned storage profile
+app.config.from_object(app_configs[os.environ['FLASK_CONFIG']] if os.environ.get('FLASK_CONFIG') else BaseConfig)
+
+class AppRequest(Request):
+    """Request whose body limit is IMPORT_MAX_CONTENT_LENGTH on the streaming import endpoint"""
+
+    @property
+    def max_content_length(self):
+        if self.endpoint == 'import_meetings_endpoint':
+            return app.config['IMPORT_MAX_CONTENT_LENGTH']
+        return super().max_content_length
+
+app.request_class = AppRequest
 
 db = SQLAlchemy(app)
+logger = logging.getLogger('civicscoop')
+
+with app.app_context():
+    apply_sqlite_pragmas(db.engine, app.config.get('SQLITE_PRAGMAS'))
+
+# Serialized /api/meetings pages and /api/meeting/<id> payloads
+response_cache = ResponseCache(
+    max_bytes=app.config['RESPONSE_CACHE_MAX_BYTES'],
+    shared_url=app.config['CACHE_REDIS_URL']
+)
+
+# DuckDB over Parquet snapshots of the database, for /api/analytics/query
+analytics_engine = AnalyticsEngine(app.config['ANALYTICS_SNAPSHOT_DIR'])
+
+# Compression of the meeting_details blobs; trained dictionaries load from blob_dictionary on first use
+blob_codec.level = app.config.get('BLOB_COMPRESSION_LEVEL')
+
+# Priority score and engagement of analyzed meetings (`flask scores rescore` applies new weights)
+scoring_model = ScoringModel.from_file(app.config['SCORING_WEIGHTS']) if app.config.get('SCORING_WEIGHTS') else ScoringModel()
 
 # Enhanced CORS configuration for frontend integration
 CORS(app, origins=['*'],
@@ -24,41 +87,443 @@ CORS(app, origins=['*'],
 
 # Database Models
 class Meeting(db.Model):
+    __table_args__ = (
+        # Composite indexes matching the API's "filter by X, newest first" queries
+        db.Index('ix_meeting_location_created_at', 'location', 'created_at'),
+        db.Index('ix_meeting_priority_created_at', 'priority', 'created_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     location = db.Column(db.String(100), nullable=False)
-    date = db.Column(db.DateTime, nullable=False)
-    url = db.Column(db.String(500), nullable=False)
+    date = db.Column(db.DateTime, nullable=False, index=True)  # Meeting date parsed from the page, for range queries
+    url = db.Column(db.String(500), nullable=False, index=True)
+    canonical_url = db.Column(db.String(500), index=True)  # normalize_url(url), what analyses are deduplicated on
     priority = db.Column(db.String(20), default='medium')
     priority_score = db.Column(db.String(10), default='50%')
     segments = db.Column(db.String(50), default='0:0 high segments')
     engagement = db.Column(db.String(50), default='0% high engagement')
     ai_accuracy = db.Column(db.Float, default=95.0)
     status = db.Column(db.String(20), default='pending')
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    # Typed copies of the display strings above, for sorting and range filters
+    priority_score_value = db.Column(db.Float, default=50.0, index=True)  # "73%" -> 73.0
+    engagement_value = db.Column(db.Float, default=0.0, index=True)  # "73.2% high engagement" -> 73.2
+    high_segment_seconds = db.Column(db.Integer, default=0)  # "22:15 high segments" -> 1335
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # Drives ETags
+    analyzer_version = db.Column(db.Integer, index=True)  # MeetingAnalyzer.VERSION that produced the analysis
+    analyzed_at = db.Column(db.DateTime)  # When apply_analysis last ran; drives analysis reuse
 
     # JSON fields
     topics = db.Column(db.Text, default='[]')  # JSON array
-    quotes = db.Column(db.Text, default='[]')  # JSON array
-    analysis = db.Column(db.Text, default='{}')  # JSON object
 
+    # Normalized copy of `topics`, indexed for topic filters
+    topic_links = db.relationship('MeetingTopic', cascade='all, delete-orphan', lazy=True)
+
+    # Quotes and analysis, kept out of this row and loaded on first access
+    details = db.relationship('MeetingDetails', uselist=False, cascade='all, delete-orphan', lazy='select')
+
+    # Feature vector of the analyzed page, what the scores are computed from
+    features = db.relationship('MeetingFeatures', uselist=False, cascade='all, delete-orphan', lazy='select')
+
+    # MinHash signature of the analyzed page and its LSH buckets, for near-duplicate lookups
+    minhash = db.relationship('MeetingSignature', uselist=False, cascade='all, delete-orphan', lazy='select')
+    lsh_buckets = db.relationship('MeetingLSHBucket', cascade='all, delete-orphan', lazy='select')
+
+    # Other URLs whose pages matched this meeting's and were linked to it instead of analyzed
+    aliases = db.relationship('MeetingAlias', cascade='all, delete-orphan', lazy='select')
+
+    # People named on the page, resolved to Person rows
+    mentions = db.relationship('PersonMention', cascade='all, delete-orphan', lazy='select')
+
+    @validates('url')
+    def _set_canonical_url(self, key, url):
+        self.canonical_url = normalize_url(url)
+        return url
+
+    @validates('priority_score', 'engagement', 'segments')
+    def _set_typed_value(self, key, display):
+        field, parse = TYPED_DISPLAY_FIELDS[key]
+        setattr(self, field, parse(display))
+        return display
+
+    # get_* decode once per instance and return the same object; values mutated
+    # in place are written back by the before_flush hook (see utils/memo.py)
     def get_topics(self):
-        return json.loads(self.topics) if self.topics else []
+        return memoized(self, 'topics', lambda: load_column(self.topics, []), self.set_topics)
 
     def set_topics(self, topics_list):
-        self.topics = json.dumps(topics_list)
+        forget(self, ['topics'])
+        self.topics = dumps_text(topics_list)
+        existing = {link.topic: link for link in self.topic_links}
+        self.topic_links = [
+            existing.get(topic) or MeetingTopic(topic=topic)
+            for topic in dict.fromkeys(topics_list)
+        ]
 
     def get_quotes(self):
-        return json.loads(self.quotes) if self.quotes else []
+        return memoized(self, 'quotes', lambda: load_blob(self.details.quotes if self.details else None, []),
+                        self.set_quotes)
 
     def set_quotes(self, quotes_list):
-        self.quotes = json.dumps(quotes_list)
+        forget(self, ['quotes'])
+        self._writable_details().quotes = dump_blob(quotes_list)
 
     def get_analysis(self):
-        return json.loads(self.analysis) if self.analysis else {}
+        return memoized(self, 'analysis', lambda: load_blob(self.details.analysis if self.details else None, {}),
+                        self.set_analysis)
 
     def set_analysis(self, analysis_dict):
-        self.analysis = json.dumps(analysis_dict)
+        forget(self, ['analysis'])
+        self._writable_details().analysis = dump_blob(analysis_dict)
+
+    def set_features(self, vector):
+        if self.features is None:
+            self.features = MeetingFeatures()
+        self.features.version = FEATURE_VERSION
+        self.features.vector = encode_features(vector)
+
+    def set_signature(self, sig):
+        if self.minhash is None:
+            self.minhash = MeetingSignature()
+        self.minhash.signature = encode_signature(sig)
+        existing = {(bucket.band, bucket.bucket): bucket for bucket in self.lsh_buckets}
+        self.lsh_buckets = [
+            existing.get(key) or MeetingLSHBucket(band=key[0], bucket=key[1])
+            for key in band_keys(sig)
+        ]
+
+    def set_participants(self, participants):
+        """Record the people named on the page; ``participants`` are {'name', 'role', 'quoted'} dicts"""
+        mentions = participant_mentions(participants)
+        existing = {mention.person_id: mention for mention in self.mentions}
+        self.mentions = [existing.get(person_id) or PersonMention(person_id=person_id) for person_id in mentions]
+        for mention in self.mentions:
+            mention.role, mention.quoted = mentions[mention.person_id]['role'], mentions[mention.person_id]['quoted']
+
+    def get_participants(self):
+        """People named on the page, as {'id', 'name', 'role', 'quoted'} dicts, in one join query"""
+        if self.id is None:
+            return []
+        rows = (object_session(self) or db.session).execute(
+            select(PersonMention.person_id, Person.name, PersonMention.role, PersonMention.quoted)
+            .join(Person, Person.id == PersonMention.person_id)
+            .where(PersonMention.meeting_id == self.id)
+            .order_by(PersonMention.person_id)
+        )
+        return [{'id': person_id, 'name': name, 'role': role, 'quoted': quoted} for person_id, name, role, quoted in rows]
+
+    def _writable_details(self):
+        """Details row to write to; bumps updated_at so ETags and the search index see the change"""
+        if self.details is None:
+            self.details = MeetingDetails()
+        self.updated_at = datetime.utcnow()
+        return self.details
+
+    @property
+    def etag(self):
+        """Strong ETag for this meeting's current row version"""
+        return meeting_etag(self.id, self.updated_at)
+
+    def search_document(self):
+        """Text indexed for full-text search"""
+        return search_fields(self.title, self.location, self.get_topics(), self.get_quotes(), self.get_analysis())
+
+def search_fields(title, location, topics, quotes, analysis):
+    """Search document for decoded meeting values"""
+    return {
+        'title': title,
+        'location': location,
+        'topics': ' '.join(topics),
+        'quotes': ' '.join(quote.get('text', '') for quote in quotes),
+        'summary': analysis.get('summary', '')
+    }
+
+# Display string column -> (typed column, parser)
+TYPED_DISPLAY_FIELDS = {
+    'priority_score': ('priority_score_value', parse_percent),
+    'engagement': ('engagement_value', parse_percent),
+    'segments': ('high_segment_seconds', parse_duration)
+}
+
+# Columns needed for listings; selecting only these keeps the JSON blobs out of list queries
+LISTING_COLUMNS = (
+    Meeting.id, Meeting.title, Meeting.location, Meeting.date, Meeting.priority,
+    Meeting.priority_score, Meeting.engagement, Meeting.topics, Meeting.status, Meeting.url,
+    Meeting.priority_score_value, Meeting.engagement_value, Meeting.high_segment_seconds
+)
+
+# ?sort= keys of /api/meetings ("-" prefix for descending) and the ?min_/max_ range filters
+SORTABLE_COLUMNS = {
+    'created_at': Meeting.created_at,
+    'date': Meeting.date,
+    'priority_score': Meeting.priority_score_value,
+    'engagement': Meeting.engagement_value,
+    'segment_seconds': Meeting.high_segment_seconds
+}
+RANGE_FILTERS = ('priority_score', 'engagement', 'segment_seconds')
+
+class MeetingDetails(db.Model):
+    """
+    The large JSON blobs of a meeting, one row per meeting
+
+    Listing queries scan the meeting table; keeping these out of it keeps its
+    rows small enough to avoid overflow pages, so far more meetings fit in
+    SQLite's page cache. Values are compressed (see utils/blobs.py) and only
+    decompressed by the Meeting accessors.
+    """
+    __tablename__ = 'meeting_details'
+
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meeting.id'), primary_key=True)
+    quotes = db.Column(db.LargeBinary, default=b'[]')  # JSON array
+    analysis = db.Column(db.LargeBinary, default=b'{}')  # JSON object
+
+class MeetingFeatures(db.Model):
+    """Feature vector of a meeting's page (see utils/scoring.py), so scores can be recomputed without it"""
+    __tablename__ = 'meeting_features'
+
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meeting.id'), primary_key=True)
+    version = db.Column(db.Integer, nullable=False)  # FEATURE_VERSION the vector was extracted with
+    vector = db.Column(db.LargeBinary, nullable=False)  # Packed float32, in FEATURES order
+
+class MeetingSignature(db.Model):
+    """MinHash signature of a meeting's page (see utils/minhash.py)"""
+    __tablename__ = 'meeting_signature'
+
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meeting.id'), primary_key=True)
+    signature = db.Column(db.LargeBinary, nullable=False)  # NUM_PERM packed uint32
+
+class MeetingLSHBucket(db.Model):
+    """One row per (band, bucket) of a signature; the primary key is the lookup index"""
+    __tablename__ = 'meeting_lsh_bucket'
+    __table_args__ = (
+        db.Index('ix_meeting_lsh_bucket_meeting_id', 'meeting_id'),
+        {'sqlite_with_rowid': False},
+    )
+
+    band = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    bucket = db.Column(db.BigInteger, primary_key=True, autoincrement=False)
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meeting.id'), primary_key=True)
+
+class MeetingAlias(db.Model):
+    """A URL whose page near-duplicates an analyzed meeting, linked to it instead of analyzed again"""
+    __tablename__ = 'meeting_alias'
+
+    canonical_url = db.Column(db.String(500), primary_key=True)
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meeting.id'), nullable=False, index=True)
+    similarity = db.Column(db.Float, nullable=False)  # Estimated Jaccard similarity of the two pages
+    linked_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    meeting = db.relationship('Meeting', viewonly=True)
+
+class Person(db.Model):
+    """A council member, official or speaker, resolved from the names found in meeting pages"""
+    __tablename__ = 'person'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False)  # Fullest form seen, for display
+    name_key = db.Column(db.String(200), nullable=False, unique=True)  # name_key(name)
+    block = db.Column(db.String(10), nullable=False, index=True)  # name_block(name_key): who a new name is compared with
+    role = db.Column(db.String(50))  # Role of the latest titled mention
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class PersonMention(db.Model):
+    """One row per (person, meeting), clustered by person so their meetings are one range read"""
+    __tablename__ = 'person_mention'
+    __table_args__ = (
+        db.Index('ix_person_mention_meeting_id', 'meeting_id'),
+        {'sqlite_with_rowid': False},
+    )
+
+    person_id = db.Column(db.Integer, db.ForeignKey('person.id'), primary_key=True)
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meeting.id'), primary_key=True)
+    role = db.Column(db.String(50))  # Title the page gave them, if any
+    quoted = db.Column(db.Boolean, nullable=False, default=False)  # A key quote is attributed to them
+
+    person = db.relationship('Person', viewonly=True)
+
+def person_matches(key):
+    """People a name key may refer to, as (name_similarity, Person) pairs, best first"""
+    candidates = Person.query.filter(db.or_(Person.name_key == key, Person.block == name_block(key))).all()
+    scored = [(name_similarity(key, person.name_key), person) for person in candidates]
+    return sorted((match for match in scored if match[0] > 0), key=lambda match: (-match[0], match[1].id))
+
+def resolve_people(names, people=None):
+    """
+    Person for each name, matching known people or adding new ones
+
+    A name matches the person with the same name key, or else the best
+    name_similarity match among the people in its block (see utils/people.py).
+    A name that matches people who do not match each other (a bare surname
+    shared by two members) is ambiguous and gets a person of its own. A
+    matched person takes the fuller of the two names. Pass the result back
+    as ``people`` to reuse the names already resolved.
+
+    Returns:
+        dict: name key -> Person (new people are added to the session and flushed)
+    """
+    people = {} if people is None else people
+    for name in names:
+        key = name_key(name)
+        if key in people:
+            continue
+        block = name_block(key)
+        matches = [person for _, person in person_matches(key)]
+        if matches and (matches[0].name_key == key
+                        or all(name_similarity(matches[0].name_key, other.name_key) for other in matches[1:])):
+            person = matches[0]
+            if len(key) > len(person.name_key):
+                person.name, person.name_key, person.block = name, key, block
+        else:
+            person = Person(name=name, name_key=key, block=block)
+            db.session.add(person)
+            db.session.flush()
+        people[key] = person
+    return people
+
+def participant_mentions(participants, people=None):
+    """
+    Resolve a page's participants to people (``people`` as for resolve_people)
+
+    Returns:
+        dict: person id -> {'role', 'quoted'}, merged when several names
+        on the page resolve to one person ("Jane Smith" and "Smith")
+    """
+    people = resolve_people((participant['name'] for participant in participants), people)
+    mentions = {}
+    for participant in participants:
+        person = people[name_key(participant['name'])]
+        role, quoted = participant.get('role'), bool(participant.get('quoted'))
+        mention = mentions.setdefault(person.id, {'role': role, 'quoted': quoted})
+        mention['role'] = mention['role'] or role
+        mention['quoted'] = mention['quoted'] or quoted
+        if role:
+            person.role = role
+    return mentions
+
+def find_duplicate(sig, exclude_id=None):
+    """
+    The analyzed meeting whose page is most similar to ``sig``, if any reaches DUPLICATE_SIMILARITY
+
+    Candidates come from the LSH bucket index, so only meetings sharing a
+    band are compared.
+
+    Returns:
+        tuple: (Meeting or None, estimated similarity)
+    """
+    buckets = MeetingLSHBucket.__table__
+    candidates = select(buckets.c.meeting_id).where(
+        db.or_(*(db.and_(buckets.c.band == band, buckets.c.bucket == bucket) for band, bucket in band_keys(sig)))
+    )
+    if exclude_id is not None:
+        candidates = candidates.where(buckets.c.meeting_id != exclude_id)
+    rows = db.session.execute(
+        select(MeetingSignature.meeting_id, MeetingSignature.signature)
+        .where(MeetingSignature.meeting_id.in_(candidates.distinct()))
+    )
+    best_id, best = None, 0.0
+    for row in rows:
+        score = similarity(sig, decode_signature(row.signature))
+        if score > best or (score == best and best_id is not None and row.meeting_id < best_id):
+            best_id, best = row.meeting_id, score
+    if best_id is None or best < app.config['DUPLICATE_SIMILARITY']:
+        return None, best
+    return db.session.get(Meeting, best_id), best
+
+def duplicate_pairs(batch_size=1000):
+    """
+    Pairs of stored meetings whose pages near-duplicate each other, found through shared LSH buckets
+
+    Yields:
+        tuple: (meeting id, other meeting id, estimated similarity), lower id first
+    """
+    first, second = MeetingLSHBucket.__table__.alias('first'), MeetingLSHBucket.__table__.alias('second')
+    pairs = db.session.execute(
+        select(first.c.meeting_id, second.c.meeting_id.label('other_id')).distinct()
+        .join(second, db.and_(first.c.band == second.c.band, first.c.bucket == second.c.bucket,
+                              first.c.meeting_id < second.c.meeting_id))
+        .order_by(first.c.meeting_id, second.c.meeting_id)
+    )
+    for batch in batched(pairs, batch_size):
+        ids = {meeting_id for pair in batch for meeting_id in pair}
+        signatures = {
+            row.meeting_id: decode_signature(row.signature)
+            for row in db.session.execute(
+                select(MeetingSignature.meeting_id, MeetingSignature.signature)
+                .where(MeetingSignature.meeting_id.in_(ids)))
+        }
+        for meeting_id, other_id in batch:
+            score = similarity(signatures[meeting_id], signatures[other_id])
+            if score >= app.config['DUPLICATE_SIMILARITY']:
+                yield meeting_id, other_id, score
+
+class BlobDictionary(db.Model):
+    """zstd dictionaries trained on stored blobs; the newest one compresses new writes"""
+    __tablename__ = 'blob_dictionary'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # zstd dictionary id
+    data = db.Column(db.LargeBinary, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+def load_blob_dictionaries():
+    """Raw bytes of every stored dictionary, oldest first"""
+    table = BlobDictionary.__table__
+    try:
+        with db.engine.connect() as connection:
+            return [row.data for row in connection.execute(select(table.c.data).order_by(table.c.created_at, table.c.id))]
+    except OperationalError:  # Database not upgraded yet: no dictionaries
+        return []
+
+blob_codec.set_loader(load_blob_dictionaries)
+
+class MeetingTopic(db.Model):
+    """One row per (meeting, topic) so topic queries never decode the JSON column"""
+    __tablename__ = 'meeting_topic'
+    __table_args__ = (
+        db.Index('ix_meeting_topic_topic', 'topic', 'meeting_id'),
+    )
+
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meeting.id'), primary_key=True)
+    topic = db.Column(db.String(100), primary_key=True)
+
+class CollectionVersion(db.Model):
+    """Change counter per collection, bumped in the same transaction as each write"""
+    __tablename__ = 'collection_version'
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+def meeting_etag(meeting_id, updated_at):
+    stamp = updated_at.strftime('%Y%m%d%H%M%S%f') if updated_at else '0'
+    return f"meeting-{meeting_id}-{stamp}"
+
+def collection_version(name):
+    """Current change counter for a collection (0 if it was never written)"""
+    version = db.session.query(CollectionVersion.version).filter_by(name=name).scalar()
+    return version or 0
+
+def bump_collection_version(connection, name):
+    stmt = sqlite_insert(CollectionVersion.__table__).values(name=name, version=1)
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=['name'],
+        set_={'version': CollectionVersion.__table__.c.version + 1}
+    ))
+
+def backfill_topic_links(session):
+    """Populate meeting_topic from the JSON topics of meetings that have no links yet"""
+    topic = func.json_each(Meeting.topics).table_valued('value')
+    linked = select(MeetingTopic.meeting_id)
+    rows = (
+        select(Meeting.id, topic.c.value)
+        .select_from(Meeting)
+        .join(topic, true())
+        .where(func.json_valid(Meeting.topics), Meeting.id.not_in(linked))
+        .distinct()
+    )
+    return session.execute(
+        MeetingTopic.__table__.insert().from_select(['meeting_id', 'topic'], rows)
+    ).rowcount
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -73,33 +538,1267 @@ class Report(db.Model):
     type = db.Column(db.String(50), nullable=False)
     status = db.Column(db.String(20), default='pending')
     file_path = db.Column(db.String(500))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     config = db.Column(db.Text, default='{}')  # JSON object
 
+class AnalyticsRollup(db.Model):
+    """Pre-aggregated meeting counts, kept in step with every Meeting write"""
+    __tablename__ = 'analytics_rollup'
+
+    dimension = db.Column(db.String(20), primary_key=True)  # total/priority/location/topic/day
+    bucket = db.Column(db.String(200), primary_key=True)
+    meeting_count = db.Column(db.Integer, nullable=False, default=0)
+    accuracy_sum = db.Column(db.Float, nullable=False, default=0.0)
+
+class PageContent(db.Model):
+    """Last fetched body of each meeting page, so re-analysis does not refetch it"""
+    __tablename__ = 'page_content'
+
+    canonical_url = db.Column(db.String(500), primary_key=True)
+    content = db.Column(db.LargeBinary, nullable=False)  # Compressed with blob_codec
+    fetched_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class BackfillCheckpoint(db.Model):
+    """Progress of a batch job, committed with each batch it covers"""
+    __tablename__ = 'backfill_checkpoint'
+
+    job = db.Column(db.String(50), primary_key=True)
+    last_id = db.Column(db.Integer, nullable=False, default=0)  # Highest meeting id handled
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+    fetched = db.Column(db.Integer, nullable=False, default=0)  # Pages downloaded rather than read from page_content
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# Analytics rollup maintenance
+ROLLUP_FIELDS = ('priority', 'location', 'topics', 'date', 'ai_accuracy')
+
+def _rollup_buckets(priority, location, topics, date):
+    """List the (dimension, bucket) pairs a meeting with these values counts towards"""
+    topic_list = load_column(topics, [])
+    buckets = [('total', ''), ('priority', priority), ('location', location)]
+    buckets.extend(('topic', topic) for topic in sorted(set(topic_list)))
+    if date is not None:
+        buckets.append(('day', date.strftime('%Y-%m-%d')))
+    return buckets
+
+def _add_rollup_delta(deltas, values, sign):
+    """Accumulate one meeting's contribution (sign=1) or its removal (sign=-1) into ``deltas``"""
+    accuracy = (values['ai_accuracy'] or 0.0) * sign
+    for key in _rollup_buckets(values['priority'], values['location'], values['topics'], values['date']):
+        delta = deltas.setdefault(key, [0, 0.0])
+        delta[0] += sign
+        delta[1] += accuracy
+    return deltas
+
+def _apply_rollup_deltas(connection, deltas):
+    """Upsert accumulated (dimension, bucket) -> [count, accuracy] deltas in one executemany"""
+    rows = [
+        {'dimension': dimension, 'bucket': bucket, 'meeting_count': count, 'accuracy_sum': accuracy_sum}
+        for (dimension, bucket), (count, accuracy_sum) in deltas.items()
+        if count or accuracy_sum
+    ]
+    if not rows:
+        return
+
+    table = AnalyticsRollup.__table__
+    stmt = sqlite_insert(table)
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=['dimension', 'bucket'],
+        set_={
+            'meeting_count': table.c.meeting_count + stmt.excluded.meeting_count,
+            'accuracy_sum': table.c.accuracy_sum + stmt.excluded.accuracy_sum
+        }
+    ), rows)
+
+    if any(row['meeting_count'] < 0 for row in rows):
+        connection.execute(table.delete().where(table.c.meeting_count <= 0))
+
+def _apply_rollup(connection, values, sign):
+    """Add (sign=1) or remove (sign=-1) one meeting's contribution to the rollups"""
+    _apply_rollup_deltas(connection, _add_rollup_delta({}, values, sign))
+
+def _current_values(meeting):
+    return {field: getattr(meeting, field) for field in ROLLUP_FIELDS}
+
+def _previous_values(meeting):
+    state = inspect(meeting)
+    values = {}
+    for field in ROLLUP_FIELDS:
+        history = state.attrs[field].history
+        values[field] = history.deleted[0] if history.deleted else getattr(meeting, field)
+    return values
+
+# Mapper events run inside the flush, so rollups commit or roll back with the meeting itself
+@event.listens_for(Meeting, 'after_insert')
+def _rollup_meeting_insert(mapper, connection, meeting):
+    _apply_rollup(connection, _current_values(meeting), 1)
+
+@event.listens_for(Meeting, 'after_delete')
+def _rollup_meeting_delete(mapper, connection, meeting):
+    _apply_rollup(connection, _current_values(meeting), -1)
+
+@event.listens_for(Meeting, 'after_update')
+def _rollup_meeting_update(mapper, connection, meeting):
+    previous = _previous_values(meeting)
+    current = _current_values(meeting)
+    if previous != current:
+        deltas = _add_rollup_delta({}, previous, -1)
+        _apply_rollup_deltas(connection, _add_rollup_delta(deltas, current, 1))
+
+def compute_rollups():
+    """Aggregate the meetings table into rollup buckets (the source of truth)"""
+    rollups = {}
+
+    def collect(dimension, query):
+        for bucket, count, accuracy_sum in query.all():
+            if bucket is not None:
+                rollups[(dimension, bucket)] = (count, accuracy_sum or 0.0)
+
+    count = func.count(Meeting.id)
+    accuracy_sum = func.coalesce(func.sum(Meeting.ai_accuracy), 0.0)
+
+    total_count, total_accuracy = db.session.query(count, accuracy_sum).one()
+    if total_count:
+        rollups[('total', '')] = (total_count, total_accuracy)
+
+    collect('priority', db.session.query(Meeting.priority, count, accuracy_sum).group_by(Meeting.priority))
+    collect('location', db.session.query(Meeting.location, count, accuracy_sum).group_by(Meeting.location))
+
+    day = func.strftime('%Y-%m-%d', Meeting.date)
+    collect('day', db.session.query(day, count, accuracy_sum).group_by(day))
+
+    # Topics are a JSON array per row, so expand them with SQLite's json_each
+    topic = func.json_each(Meeting.topics).table_valued('value')
+    per_topic = (
+        db.session.query(Meeting.id.label('meeting_id'), Meeting.ai_accuracy.label('ai_accuracy'),
+                         topic.c.value.label('topic'))
+        .select_from(Meeting)
+        .join(topic, true())
+        .filter(func.json_valid(Meeting.topics))
+        .distinct()
+        .subquery()
+    )
+    collect('topic', db.session.query(
+        per_topic.c.topic, func.count(per_topic.c.meeting_id),
+        func.coalesce(func.sum(per_topic.c.ai_accuracy), 0.0)
+    ).group_by(per_topic.c.topic))
+
+    return rollups
+
+def rebuild_rollups():
+    """Recompute every rollup bucket from the meetings table"""
+    rollups = compute_rollups()
+    db.session.query(AnalyticsRollup).delete()
+    if rollups:
+        db.session.execute(AnalyticsRollup.__table__.insert(), [
+            {'dimension': dimension, 'bucket': bucket, 'meeting_count': count, 'accuracy_sum': accuracy_sum}
+            for (dimension, bucket), (count, accuracy_sum) in rollups.items()
+        ])
+    db.session.commit()
+    return len(rollups)
+
+def check_rollups():
+    """Compare stored rollups with a fresh aggregation and return the mismatches"""
+    expected = compute_rollups()
+    stored = {
+        (row.dimension, row.bucket): (row.meeting_count, row.accuracy_sum)
+        for row in AnalyticsRollup.query.all()
+    }
+
+    mismatches = []
+    for key in sorted(set(expected) | set(stored)):
+        want_count, want_accuracy = expected.get(key, (0, 0.0))
+        have_count, have_accuracy = stored.get(key, (0, 0.0))
+        if want_count != have_count or abs(want_accuracy - have_accuracy) > 1e-6 * max(want_count, 1):
+            mismatches.append({
+                'dimension': key[0],
+                'bucket': key[1],
+                'expected': want_count,
+                'stored': have_count
+            })
+    return mismatches
+
+# Collection versions for conditional GETs on /api/meetings
+@event.listens_for(Meeting, 'after_insert')
+@event.listens_for(Meeting, 'after_update')
+@event.listens_for(Meeting, 'after_delete')
+def _bump_meetings_version(mapper, connection, meeting):
+    bump_collection_version(connection, 'meetings')
+
+# Decoded JSON caches: write back values mutated in place, drop caches with the row version.
+# An in-place mutation flags its meeting dirty, so autoflush and commit reach before_flush.
+@event.listens_for(db.session, 'before_flush')
+def _flush_decoded_mutations(session, flush_context, instances):
+    flush_mutations(session)
+
+@event.listens_for(Meeting, 'expire')
+def _forget_decoded_on_expire(meeting, attrs):
+    forget(meeting)
+
+@event.listens_for(Meeting, 'refresh')
+def _forget_decoded_on_refresh(meeting, context, attrs):
+    forget(meeting)
+
+# Response cache invalidation: collect the affected cache tags during the flush
+# and drop them once the transaction commits
+def listing_cache_tag(location=None, priority=None, topic=None):
+    return f"meetings:{location or '*'}|{priority or '*'}|{topic or '*'}"
+
+def _meeting_cache_tags(meeting_id, *versions):
+    """Tags of the detail payload and every listing filter the meeting can appear under"""
+    tags = {f'meeting:{meeting_id}'}
+    locations = {None} | {values['location'] for values in versions}
+    priorities = {None} | {values['priority'] for values in versions}
+    topics = {None}
+    for values in versions:
+        topics.update(load_column(values['topics'], []))
+    for location in locations:
+        for priority in priorities:
+            for topic in topics:
+                tags.add(listing_cache_tag(location, priority, topic))
+    return tags
+
+def _queue_cache_invalidation(meeting, *versions):
+    session = object_session(meeting)
+    if session is not None:
+        session.info.setdefault('cache_tags', set()).update(_meeting_cache_tags(meeting.id, *versions))
+
+@event.listens_for(Meeting, 'after_insert')
+@event.listens_for(Meeting, 'after_delete')
+def _invalidate_meeting_write(mapper, connection, meeting):
+    _queue_cache_invalidation(meeting, _current_values(meeting))
+
+@event.listens_for(Meeting, 'after_update')
+def _invalidate_meeting_update(mapper, connection, meeting):
+    _queue_cache_invalidation(meeting, _previous_values(meeting), _current_values(meeting))
+
+@event.listens_for(db.session, 'after_commit')
+def _apply_cache_invalidation(session):
+    tags = session.info.pop('cache_tags', None)
+    if tags:
+        response_cache.invalidate_tags(tags)
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard_cache_invalidation(session):
+    session.info.pop('cache_tags', None)
+
+# Full-text search index maintenance
+SEARCH_FIELDS = ('title', 'location', 'topics')
+SEARCH_DETAIL_FIELDS = ('quotes', 'analysis')
+
+@event.listens_for(Meeting.__table__, 'after_create')
+def _create_search_table(table, connection, **kw):
+    create_search_table(connection)
+
+@event.listens_for(Meeting, 'after_insert')
+def _search_meeting_insert(mapper, connection, meeting):
+    index_document(connection, meeting.id, meeting.search_document())
+
+@event.listens_for(Meeting, 'after_update')
+def _search_meeting_update(mapper, connection, meeting):
+    if _search_fields_changed(meeting):
+        index_document(connection, meeting.id, meeting.search_document())
+
+def _search_fields_changed(meeting):
+    state = inspect(meeting)
+    if any(state.attrs[field].history.has_changes() for field in SEARCH_FIELDS):
+        return True
+    # Details that were never loaded cannot have changed
+    if 'details' in state.unloaded or meeting.details is None:
+        return False
+    details = inspect(meeting.details)
+    return any(details.attrs[field].history.has_changes() for field in SEARCH_DETAIL_FIELDS)
+
+@event.listens_for(Meeting, 'after_delete')
+def _search_meeting_delete(mapper, connection, meeting):
+    remove_document(connection, meeting.id)
+
+# Related meetings: a TF-IDF inverted index over each meeting's search document.
+# Meeting writes only queue the meeting id, in their own transaction;
+# sync_related_index brings the index up to date in the background.
+class RelatedTerm(db.Model):
+    __tablename__ = 'related_term'
+
+    id = db.Column(db.Integer, primary_key=True)
+    term = db.Column(db.String(100), nullable=False, unique=True)
+    df = db.Column(db.Integer, nullable=False, default=0)  # Indexed meetings containing the term
+
+class RelatedPosting(db.Model):
+    """Inverted index: one row per (term, meeting), clustered by term"""
+    __tablename__ = 'related_posting'
+    __table_args__ = (
+        db.Index('ix_related_posting_meeting_id', 'meeting_id'),
+        {'sqlite_with_rowid': False},
+    )
+
+    term_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    meeting_id = db.Column(db.Integer, primary_key=True, autoincrement=False)  # Kept until the indexer drops it
+    weight = db.Column(db.Float, nullable=False)  # 1 + log(term frequency)
+
+class RelatedDocument(db.Model):
+    __tablename__ = 'related_document'
+
+    meeting_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    norm = db.Column(db.Float, nullable=False)  # Length of the tf-idf vector when indexed
+    indexed_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class RelatedQueue(db.Model):
+    """Meetings inserted, changed or deleted since the related index last saw them"""
+    __tablename__ = 'related_queue'
+
+    meeting_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    queued_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+# Postings a query may read. Terms are taken in tf-idf order and any whose
+# posting list would exceed the budget is skipped: common terms barely move the
+# ranking but have the longest lists, and query time is linear in postings read.
+RELATED_MAX_POSTINGS = 5000
+
+# The df of this term counts the indexed meetings (every document "contains" it),
+# so queries never count related_document
+RELATED_CORPUS_TERM = ''
+
+def queue_related(connection, meeting_ids):
+    """Queue meetings for the related index; a requeued meeting gets a new queued_at"""
+    if not meeting_ids:
+        return
+    now = datetime.utcnow()
+    statement = sqlite_insert(RelatedQueue.__table__)
+    connection.execute(
+        statement.on_conflict_do_update(index_elements=['meeting_id'], set_={'queued_at': statement.excluded.queued_at}),
+        [{'meeting_id': meeting_id, 'queued_at': now} for meeting_id in meeting_ids]
+    )
+
+@event.listens_for(Meeting, 'after_insert')
+@event.listens_for(Meeting, 'after_delete')
+def _related_meeting_write(mapper, connection, meeting):
+    queue_related(connection, [meeting.id])
+
+@event.listens_for(Meeting, 'after_update')
+def _related_meeting_update(mapper, connection, meeting):
+    if _search_fields_changed(meeting):
+        queue_related(connection, [meeting.id])
+
+def _related_corpus_size(connection):
+    terms = RelatedTerm.__table__
+    return connection.execute(select(terms.c.df).where(terms.c.term == RELATED_CORPUS_TERM)).scalar() or 0
+
+def sync_related_index(batch_size=500):
+    """
+    Re-index a batch of queued meetings, oldest first, in one transaction
+
+    Old postings are removed and document frequencies adjusted, then the
+    current version of each meeting (if it still exists) is indexed. A
+    meeting queued again while the batch ran stays queued.
+
+    Returns:
+        int: meetings processed; 0 when the queue is empty
+    """
+    connection = db.session.connection()
+    queue, terms = RelatedQueue.__table__, RelatedTerm.__table__
+    postings, documents = RelatedPosting.__table__, RelatedDocument.__table__
+    queued = connection.execute(
+        select(queue.c.meeting_id, queue.c.queued_at).order_by(queue.c.queued_at, queue.c.meeting_id).limit(batch_size)
+    ).all()
+    if not queued:
+        db.session.rollback()
+        return 0
+    ids = [row.meeting_id for row in queued]
+
+    # Retract the previous versions
+    retracted = connection.execute(
+        select(postings.c.term_id, func.count().label('count'))
+        .where(postings.c.meeting_id.in_(ids)).group_by(postings.c.term_id)
+    ).all()
+    if retracted:
+        connection.execute(terms.update().where(terms.c.id == bindparam('term_id'))
+                           .values(df=terms.c.df - bindparam('count')),
+                           [{'term_id': row.term_id, 'count': row.count} for row in retracted])
+    connection.execute(postings.delete().where(postings.c.meeting_id.in_(ids)))
+    removed = connection.execute(documents.delete().where(documents.c.meeting_id.in_(ids))).rowcount
+
+    # Index the current versions
+    meetings = Meeting.query.options(selectinload(Meeting.details)).filter(Meeting.id.in_(ids)).all()
+    weights = {meeting.id: term_weights(' '.join(meeting.search_document().values())) for meeting in meetings}
+    frequencies = {RELATED_CORPUS_TERM: len(weights) - removed}
+    for vector in weights.values():
+        for term in vector:
+            frequencies[term] = frequencies.get(term, 0) + 1
+    term_ids, dfs = {}, {}
+    for chunk in batched(frequencies, 500):
+        connection.execute(sqlite_insert(terms).on_conflict_do_nothing(index_elements=['term']),
+                           [{'term': term, 'df': 0} for term in chunk])
+        connection.execute(terms.update().where(terms.c.term == bindparam('match_term'))
+                           .values(df=terms.c.df + bindparam('count')),
+                           [{'match_term': term, 'count': frequencies[term]} for term in chunk])
+        for row in connection.execute(select(terms.c.term, terms.c.id, terms.c.df).where(terms.c.term.in_(chunk))):
+            term_ids[row.term], dfs[row.term] = row.id, row.df
+
+    corpus = dfs.pop(RELATED_CORPUS_TERM)
+    term_ids.pop(RELATED_CORPUS_TERM)
+    bulk_insert(connection, postings, ('term_id', 'meeting_id', 'weight'), [
+        {'term_id': term_ids[term], 'meeting_id': meeting_id, 'weight': weight}
+        for meeting_id, vector in weights.items() for term, weight in vector.items()
+    ])
+    now = datetime.utcnow()
+    bulk_insert(connection, documents, ('meeting_id', 'norm', 'indexed_at'), [
+        {'meeting_id': meeting_id, 'norm': vector_norm(vector, dfs, corpus), 'indexed_at': now}
+        for meeting_id, vector in weights.items()
+    ])
+
+    connection.execute(queue.delete().where(queue.c.meeting_id == bindparam('match_id'),
+                                            queue.c.queued_at == bindparam('match_queued_at')),
+                       [{'match_id': row.meeting_id, 'match_queued_at': row.queued_at} for row in queued])
+    db.session.commit()
+    return len(ids)
+
+def related_meetings(meeting_id, limit=10):
+    """
+    Meetings most similar to ``meeting_id`` by tf-idf cosine
+
+    Only the postings of the meeting's most discriminative terms are read
+    (at most RELATED_MAX_POSTINGS) and summed, in one grouped query over the
+    inverted index.
+
+    Returns:
+        tuple: (list of (meeting id, score) pairs, best first; whether the meeting is indexed)
+    """
+    connection = db.session.connection()
+    postings, terms, documents = RelatedPosting.__table__, RelatedTerm.__table__, RelatedDocument.__table__
+    if connection.execute(select(documents.c.norm).where(documents.c.meeting_id == meeting_id)).scalar() is None:
+        return [], False
+
+    corpus = _related_corpus_size(connection)
+    rows = connection.execute(
+        select(postings.c.term_id, postings.c.weight, terms.c.df)
+        .join(terms, terms.c.id == postings.c.term_id)
+        .where(postings.c.meeting_id == meeting_id)
+    ).all()
+    # The stored norm used the dfs of its indexing time; the query side can use today's
+    norm = vector_norm({row.term_id: row.weight for row in rows}, {row.term_id: row.df for row in rows}, corpus)
+    candidates = sorted((row for row in rows if row.df > 1),  # A df of 1 is this meeting alone
+                        key=lambda row: row.weight * idf(row.df, corpus), reverse=True)
+    # Query tf-idf times idf, so summing it against stored tf weights gives the dot product
+    query_weights, budget = {}, RELATED_MAX_POSTINGS
+    for row in candidates:
+        if row.df <= budget:
+            query_weights[row.term_id] = row.weight * idf(row.df, corpus) ** 2
+            budget -= row.df
+            if len(query_weights) == MAX_QUERY_TERMS:
+                break
+    if not query_weights:
+        return [], True
+
+    query_weight = db.case(query_weights, value=postings.c.term_id)
+    dots = (select(postings.c.meeting_id, func.sum(postings.c.weight * query_weight).label('dot'))
+            .where(postings.c.term_id.in_(list(query_weights)), postings.c.meeting_id != meeting_id)
+            .group_by(postings.c.meeting_id)
+            .subquery())
+    score = (dots.c.dot / documents.c.norm).label('score')
+    matches = connection.execute(
+        select(dots.c.meeting_id, score)
+        .join(documents, documents.c.meeting_id == dots.c.meeting_id)
+        .order_by(score.desc())
+        .limit(limit)
+    ).all()
+    return [(row.meeting_id, row.score / norm) for row in matches], True
+
+def rebuild_related_index(batch_size=500, progress=None):
+    """Drop the related index and re-index every meeting; returns how many were indexed"""
+    connection = db.session.connection()
+    for model in (RelatedPosting, RelatedDocument, RelatedTerm, RelatedQueue):
+        connection.execute(model.__table__.delete())
+    connection.execute(RelatedQueue.__table__.insert().from_select(
+        ['meeting_id', 'queued_at'], select(Meeting.id, db.literal(datetime.utcnow())))
+    )
+    db.session.commit()
+    return drain_related_queue(batch_size, progress)
+
+def drain_related_queue(batch_size=500, progress=None):
+    """Process the related queue until it is empty; returns how many meetings were processed"""
+    total = 0
+    while True:
+        processed = sync_related_index(batch_size)
+        if not processed:
+            return total
+        total += processed
+        if progress is not None:
+            progress(total)
+
+def run_related_worker(interval, stop=None):
+    """Keep the related index in sync until ``stop`` (a threading.Event) is set; needs an app context"""
+    stop = stop or threading.Event()
+    while not stop.is_set():
+        try:
+            processed = sync_related_index()
+        except OperationalError as e:  # Database busy: try again next round
+            db.session.rollback()
+            logger.warning(f"Related index sync failed: {e}")
+            processed = 0
+        finally:
+            db.session.close()
+        if not processed:
+            stop.wait(interval)
+
+def start_related_worker():
+    """Run the related index worker on a daemon thread of this process"""
+    def run():
+        with app.app_context():
+            run_related_worker(app.config['RELATED_INDEX_INTERVAL'])
+
+    thread = threading.Thread(target=run, name='related-index', daemon=True)
+    thread.start()
+    return thread
+
+def rebuild_search_index(batch_size=1000):
+    """Re-index every meeting, streaming rows in batches"""
+    connection = db.session.connection()
+    create_search_table(connection)
+    clear_index(connection)
+    indexed = 0
+    query = Meeting.query.options(selectinload(Meeting.details)).order_by(Meeting.id)
+    for meeting in query.yield_per(batch_size):
+        index_document(connection, meeting.id, meeting.search_document())
+        indexed += 1
+    db.session.commit()
+    return indexed
+
+# Bulk import. Core executemany statements bypass the Meeting mapper events, so
+# each batch maintains topic links, details rows, the search index, rollups and
+# the collection version itself, in the same transaction as its rows.
+MEETING_PRIORITIES = ('low', 'medium', 'high', 'critical')
+IMPORT_TEXT_FIELDS = ('title', 'location', 'url', 'priority', 'priority_score', 'segments', 'engagement', 'status')
+IMPORT_COLUMNS = IMPORT_TEXT_FIELDS + ('canonical_url', 'date', 'ai_accuracy', 'topics', 'updated_at',
+                                      'priority_score_value', 'engagement_value', 'high_segment_seconds',
+                                      'analyzer_version', 'analyzed_at')
+IMPORT_DETAIL_COLUMNS = ('meeting_id', 'quotes', 'analysis')
+IMPORT_DEFAULTS = {
+    column.name: column.default.arg
+    for column in Meeting.__table__.c
+    if column.name in IMPORT_TEXT_FIELDS + ('ai_accuracy',) and column.default is not None
+}
+
+def _import_datetime(value, field):
+    parsed = parse_meeting_date(value) if isinstance(value, str) else None
+    if parsed is None:
+        raise ValueError(f"{field} must be a date")
+    return parsed
+
+def parse_meeting_record(record):
+    """
+    Validate one imported meeting
+
+    Accepts the shape written by /api/export/meetings.ndjson; ``id``,
+    ``canonical_url``, ``updated_at``, ``analyzer_version`` and the typed
+    value columns are derived and ignored.
+
+    Returns:
+        tuple: (column values, topics list, quotes list, analysis dict)
+
+    Raises:
+        ValueError: if the record is not a valid meeting
+    """
+    if not isinstance(record, dict):
+        raise ValueError("record must be a JSON object")
+
+    values = dict(IMPORT_DEFAULTS)
+    for field in IMPORT_TEXT_FIELDS:
+        value = record.get(field)
+        if value is not None:
+            if not isinstance(value, str):
+                raise ValueError(f"{field} must be a string")
+            values[field] = value
+    for field in ('title', 'location', 'url'):
+        if not values.get(field):
+            raise ValueError(f"{field} is required")
+    if values['priority'] not in MEETING_PRIORITIES:
+        raise ValueError(f"priority must be one of {', '.join(MEETING_PRIORITIES)}")
+
+    if record.get('date') is None:
+        raise ValueError("date is required")
+    values['date'] = _import_datetime(record['date'], 'date')
+    values['created_at'] = _import_datetime(record['created_at'], 'created_at') if record.get('created_at') else None
+
+    if record.get('ai_accuracy') is not None:
+        if isinstance(record['ai_accuracy'], bool) or not isinstance(record['ai_accuracy'], (int, float)):
+            raise ValueError("ai_accuracy must be a number")
+        values['ai_accuracy'] = float(record['ai_accuracy'])
+    # Records carry no feature vector or page signature, so imported meetings are
+    # stale whatever version analyzed them: `flask analyses backfill` rebuilds both
+    values['analyzer_version'] = None
+    values['analyzed_at'] = None
+
+    topics = record.get('topics') or []
+    quotes = record.get('quotes') or []
+    analysis = record.get('analysis') or {}
+    if not isinstance(topics, list) or not all(isinstance(topic, str) for topic in topics):
+        raise ValueError("topics must be a list of strings")
+    if not isinstance(quotes, list) or not all(isinstance(quote, dict) for quote in quotes):
+        raise ValueError("quotes must be a list of objects")
+    if not isinstance(analysis, dict):
+        raise ValueError("analysis must be an object")
+
+    values['canonical_url'] = normalize_url(values['url'])
+    for key, (field, parse) in TYPED_DISPLAY_FIELDS.items():
+        values[field] = parse(values[key])
+    values['topics'] = dumps_text(topics)
+    values['quotes'] = dump_blob(quotes)
+    values['analysis'] = dump_blob(analysis)
+    return values, topics, quotes, analysis
+
+def import_meetings(lines, batch_size=5000, progress=None):
+    """
+    Upsert meetings from NDJSON lines, keyed on their canonical URL
+
+    Each batch is validated, then written with one executemany insert and one
+    executemany update and committed as a single transaction. Invalid lines
+    are counted and skipped. ``progress(stats)`` is called after every batch.
+
+    Returns:
+        ImportStats: counters, rejected lines and throughput
+    """
+    stats = ImportStats()
+    for batch in batched(iter_ndjson_records(lines), batch_size):
+        parsed = {}
+        for line_number, record, error in batch:
+            stats.read += 1
+            if error is None:
+                try:
+                    item = parse_meeting_record(record)
+                except ValueError as e:
+                    error = str(e)
+            if error is not None:
+                stats.reject(line_number, error)
+                continue
+            canonical_url = item[0]['canonical_url']
+            if canonical_url in parsed:
+                stats.duplicates += 1
+            parsed[canonical_url] = item
+
+        if parsed:
+            _import_meeting_batch(db.session.connection(), parsed, stats)
+        db.session.commit()
+        if progress is not None:
+            progress(stats)
+    return stats
+
+def _import_meeting_batch(connection, parsed, stats):
+    table = Meeting.__table__
+    existing = {}
+    for chunk in batched(parsed, 10000):  # Stay under SQLite's bound parameter limit
+        rows = connection.execute(
+            select(table.c.id, table.c.canonical_url, *(table.c[field] for field in ROLLUP_FIELDS))
+            .where(table.c.canonical_url.in_(chunk))
+            .order_by(table.c.id)
+        )
+        existing.update((row.canonical_url, row) for row in rows)  # Newest duplicate wins
+
+    now = datetime.utcnow()
+    deltas = {}
+    inserts, updates, documents = [], [], {}
+    for canonical_url, (values, topics, quotes, analysis) in parsed.items():
+        _add_rollup_delta(deltas, values, 1)
+        values['updated_at'] = now
+        previous = existing.get(canonical_url)
+        if previous is None:
+            values['created_at'] = values['created_at'] or now
+            inserts.append(values)
+        else:
+            _add_rollup_delta(deltas, previous._mapping, -1)
+            values['id'] = documents[canonical_url] = previous.id
+            updates.append(values)
+
+    if updates:
+        bulk_update(connection, table, 'id', IMPORT_COLUMNS, updates)
+        updated_ids = [values['id'] for values in updates]
+        connection.execute(MeetingTopic.__table__.delete().where(MeetingTopic.meeting_id.in_(updated_ids)))
+        connection.execute(MeetingDetails.__table__.delete().where(MeetingDetails.meeting_id.in_(updated_ids)))
+        # Imported values replace the analysis the vector, signature and mentions were extracted from
+        for derived in (MeetingFeatures, MeetingSignature, MeetingLSHBucket, PersonMention):
+            connection.execute(derived.__table__.delete().where(derived.meeting_id.in_(updated_ids)))
+    if inserts:
+        bulk_insert(connection, table, IMPORT_COLUMNS + ('created_at',), inserts)
+        for chunk in batched((values['canonical_url'] for values in inserts), 10000):
+            rows = connection.execute(select(table.c.id, table.c.canonical_url).where(table.c.canonical_url.in_(chunk)))
+            documents.update((row.canonical_url, row.id) for row in rows)
+
+    links = []
+    details = []
+    search_docs = []
+    mentions, people = [], {}
+    for canonical_url, meeting_id in documents.items():
+        values, topics, quotes, analysis = parsed[canonical_url]
+        links.extend({'meeting_id': meeting_id, 'topic': topic} for topic in dict.fromkeys(topics))
+        details.append({'meeting_id': meeting_id, 'quotes': values['quotes'], 'analysis': values['analysis']})
+        search_docs.append((meeting_id, search_fields(values['title'], values['location'], topics, quotes, analysis)))
+        participants = clean_participants(analysis.get('participants'))
+        if participants:
+            mentions.extend(dict(mention, person_id=person_id, meeting_id=meeting_id)
+                            for person_id, mention in participant_mentions(participants, people).items())
+    bulk_insert(connection, MeetingTopic.__table__, ('meeting_id', 'topic'), links)
+    bulk_insert(connection, MeetingDetails.__table__, IMPORT_DETAIL_COLUMNS, details)
+    bulk_insert(connection, PersonMention.__table__, ('person_id', 'meeting_id', 'role', 'quoted'), mentions)
+    index_documents(connection, search_docs)
+    queue_related(connection, list(documents.values()))
+    _apply_rollup_deltas(connection, deltas)
+    bump_collection_version(connection, 'meetings')
+
+    stats.inserted += len(inserts)
+    stats.updated += len(updates)
+
+# Blob compression of meeting_details
+BLOB_FIELDS = ('quotes', 'analysis')
+
+def compress_meeting_details(connection, batch_size=1000):
+    """
+    Re-encode every stored blob with the current codec and dictionary
+
+    Rows are read in meeting_id order a batch at a time, and only values
+    whose encoding changes are written back.
+
+    Returns:
+        dict: rows scanned, values rewritten, and stored bytes before/after
+        next to the uncompressed size
+    """
+    table = MeetingDetails.__table__
+    report = {'rows': 0, 'rewritten': 0, 'raw_bytes': 0, 'bytes_before': 0, 'bytes_after': 0}
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(table.c.meeting_id, *(table.c[field] for field in BLOB_FIELDS))
+            .where(table.c.meeting_id > last_id)
+            .order_by(table.c.meeting_id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return report
+
+        updates = []
+        for row in rows:
+            values = {'details_id': row.meeting_id}
+            changed = 0
+            for field in BLOB_FIELDS:
+                stored = getattr(row, field)
+                if stored is None:
+                    values[field] = None
+                    continue
+                stored = stored.encode('utf-8') if isinstance(stored, str) else bytes(stored)
+                raw = blob_codec.decompress(stored)
+                values[field] = blob_codec.compress(raw)
+                report['raw_bytes'] += len(raw)
+                report['bytes_before'] += len(stored)
+                report['bytes_after'] += len(values[field])
+                changed += values[field] != stored
+            if changed:
+                updates.append(values)
+                report['rewritten'] += changed
+        if updates:
+            connection.execute(
+                table.update().where(table.c.meeting_id == bindparam('details_id'))
+                .values({field: bindparam(field) for field in BLOB_FIELDS}),
+                updates
+            )
+        report['rows'] += len(rows)
+        last_id = rows[-1].meeting_id
+
+def format_blob_report(report):
+    before, after = report['bytes_before'], report['bytes_after']
+    saved = 100.0 * (before - after) / before if before else 0.0
+    return (f"{report['rows']:,} meeting details, {report['rewritten']:,} values rewritten: "
+            f"{before:,} -> {after:,} bytes stored ({saved:.1f}% smaller, {report['raw_bytes']:,} bytes uncompressed)")
+
+# Versioned re-analysis. Pages are fetched and parsed on a thread pool (the work
+# is dominated by network waits); results are applied on the calling thread
+# through the ORM, so mapper events keep derived data in sync, and each batch
+# commits together with its checkpoint.
+def analysis_job_name():
+    return f'analyses-v{MeetingAnalyzer.VERSION}'
+
+def stale_analysis_filter():
+    """
+    Meetings analyzed by an older analyzer (NULL: before versioning or
+    imported), or missing the current feature vector or the page signature
+    """
+    current_features = select(MeetingFeatures.meeting_id).where(MeetingFeatures.meeting_id == Meeting.id,
+                                                                 MeetingFeatures.version == FEATURE_VERSION)
+    signed = select(MeetingSignature.meeting_id).where(MeetingSignature.meeting_id == Meeting.id)
+    return db.or_(Meeting.analyzer_version.is_(None), Meeting.analyzer_version < MeetingAnalyzer.VERSION,
+                  ~current_features.exists(), ~signed.exists())
+
+def _reanalyze(url, content):
+    """Worker: returns (analysis, fetched content or None, error or None)"""
+    fetched = None
+    if content is None:
+        try:
+            content = fetched = MeetingAnalyzer.fetch_page(url)
+        except requests.RequestException as e:
+            return None, None, str(e)
+    analysis = MeetingAnalyzer.analyze_meeting_url(url, content)
+    return analysis, fetched, analysis.get('error')
+
+def backfill_analyses(batch_size=50, workers=8, limit=None, refetch=False, restart=False, progress=None):
+    """
+    Re-analyze meetings whose analysis predates MeetingAnalyzer.VERSION
+
+    Meetings are visited in id order from the job's checkpoint, so an
+    interrupted run resumes where its last committed batch ended. Pages are
+    read from page_content when cached (unless ``refetch``) and downloaded
+    otherwise. Meetings that fail keep their old analysis and are skipped
+    until ``restart`` rewinds the checkpoint. ``progress(checkpoint)`` is
+    called after every batch.
+
+    Returns:
+        BackfillCheckpoint: the job's checkpoint after the run
+    """
+    job = analysis_job_name()
+    checkpoint = db.session.get(BackfillCheckpoint, job)
+    if checkpoint is None:
+        checkpoint = BackfillCheckpoint(job=job, last_id=0, processed=0, failed=0, fetched=0)
+        db.session.add(checkpoint)
+    elif restart:
+        checkpoint.last_id = checkpoint.processed = checkpoint.failed = checkpoint.fetched = 0
+    db.session.commit()
+
+    stale = stale_analysis_filter()
+    remaining = limit
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            meetings = (Meeting.query
+                        .filter(stale, Meeting.id > checkpoint.last_id)
+                        .order_by(Meeting.id)
+                        .limit(size)
+                        .all())
+            if not meetings:
+                break
+
+            pages = {}
+            if not refetch:
+                urls = {meeting.canonical_url for meeting in meetings}
+                rows = db.session.execute(
+                    select(PageContent.canonical_url, PageContent.content)
+                    .where(PageContent.canonical_url.in_(urls))
+                )
+                pages = {row.canonical_url: blob_codec.decompress(row.content) for row in rows}
+
+            results = executor.map(lambda meeting: _reanalyze(meeting.url, pages.get(meeting.canonical_url)),
+                                   meetings)
+            for meeting, (analysis, fetched, error) in zip(meetings, results):
+                if fetched is not None:
+                    store_page_content(meeting.canonical_url, fetched)
+                    checkpoint.fetched += 1
+                if error is None:
+                    apply_analysis(meeting, analysis)
+                    checkpoint.processed += 1
+                else:
+                    logger.warning(f"Meeting {meeting.id}: analysis failed: {error}")
+                    checkpoint.failed += 1
+                checkpoint.last_id = meeting.id
+
+            db.session.commit()
+            if remaining is not None:
+                remaining -= len(meetings)
+            if progress is not None:
+                progress(checkpoint)
+    return checkpoint
+
+# Model rescoring. Scores are recomputed from the stored feature vectors a batch
+# at a time with one matrix product, and only rows whose display strings change
+# are written, with Core executemany (which bypasses the mapper events; scores
+# feed no rollups or search fields, so only updated_at and the collection
+# version need maintaining).
+RESCORE_COLUMNS = ('priority_score', 'priority_score_value', 'engagement', 'engagement_value', 'updated_at')
+
+def rescore_meetings(model=None, batch_size=100000, dry_run=False, progress=None):
+    """
+    Recompute priority score and engagement of every meeting with a current feature vector
+
+    Returns:
+        dict: rows scored, rows changed, vectors skipped because they predate
+        FEATURE_VERSION, and meetings with no vector at all (both need re-analysis)
+    """
+    model = model or scoring_model
+    connection = db.session.connection()
+    features, meetings = MeetingFeatures.__table__, Meeting.__table__
+    report = {'scored': 0, 'changed': 0, 'outdated': 0, 'missing': 0}
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(features.c.meeting_id, features.c.vector, meetings.c.priority_score, meetings.c.engagement)
+            .join(meetings, meetings.c.id == features.c.meeting_id)
+            .where(features.c.meeting_id > last_id, features.c.version == FEATURE_VERSION)
+            .order_by(features.c.meeting_id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].meeting_id
+
+        scores = model.score(decode_features([row.vector for row in rows]))
+        priority_values = scores[:, 0].round().tolist()
+        engagement_values = scores[:, 1].round(1).tolist()
+
+        now = datetime.utcnow()
+        changed = []
+        for row, priority_value, engagement_value in zip(rows, priority_values, engagement_values):
+            priority_score = format_priority_score(priority_value)
+            engagement = f"{format_engagement(engagement_value)} high engagement"
+            if priority_score != row.priority_score or engagement != row.engagement:
+                changed.append({'id': row.meeting_id, 'priority_score': priority_score,
+                                'priority_score_value': priority_value, 'engagement': engagement,
+                                'engagement_value': engagement_value, 'updated_at': now})
+        if changed and not dry_run:
+            bulk_update(connection, meetings, 'id', RESCORE_COLUMNS, changed)
+            bump_collection_version(connection, 'meetings')
+        report['scored'] += len(rows)
+        report['changed'] += len(changed)
+        if progress is not None:
+            progress(report)
+
+    report['outdated'] = connection.execute(
+        select(func.count()).select_from(features).where(features.c.version != FEATURE_VERSION)
+    ).scalar()
+    report['missing'] = connection.execute(
+        select(func.count()).select_from(meetings)
+        .where(~select(features.c.meeting_id).where(features.c.meeting_id == meetings.c.id).exists())
+    ).scalar()
+    if dry_run:
+        db.session.rollback()
+    else:
+        db.session.commit()
+    return report
+
+# Columnar export for offline analysis (optional pyarrow)
+def columnar_schemas():
+    """Arrow schemas of the exported datasets, with the typed values in place of display strings"""
+    require_pyarrow()
+    timestamp = pa.timestamp('us')
+    return {
+        'meetings': pa.schema([
+            ('id', pa.int64()), ('title', pa.string()), ('location', pa.string()), ('date', timestamp),
+            ('url', pa.string()), ('canonical_url', pa.string()), ('priority', pa.string()),
+            ('priority_score', pa.float64()), ('engagement', pa.float64()), ('high_segment_seconds', pa.int64()),
+            ('ai_accuracy', pa.float64()), ('status', pa.string()), ('topics', pa.list_(pa.string())),
+            ('summary', pa.string()), ('created_at', timestamp), ('updated_at', timestamp)
+        ]),
+        'meeting_topics': pa.schema([('meeting_id', pa.int64()), ('topic', pa.string()), ('date', timestamp)]),
+        'analytics_rollup': pa.schema([
+            ('dimension', pa.string()), ('bucket', pa.string()), ('meeting_count', pa.int64()),
+            ('accuracy_sum', pa.float64()), ('avg_accuracy', pa.float64())
+        ])
+    }
+
+def export_columnar(root, fmt='parquet', batch_size=1000, row_group_size=64 * 1024):
+    """
+    Write meetings, topic links and analytics rollups as columnar datasets under ``root``
+
+    Meetings and topics are partitioned by the month of the meeting date
+    (``month=YYYY-MM``); rows are streamed with yield_per and written a row
+    group at a time.
+
+    Returns:
+        dict: dataset name -> {file path: rows}
+    """
+    schemas = columnar_schemas()
+    table = Meeting.__table__
+    written = {}
+
+    meetings = PartitionedWriter(os.path.join(root, 'meetings'), schemas['meetings'], fmt, 'month', row_group_size)
+    query = (select(*(table.c[name] for name in schemas['meetings'].names if name in table.c),
+                    table.c.priority_score_value, table.c.engagement_value, MeetingDetails.analysis)
+             .outerjoin(MeetingDetails, MeetingDetails.meeting_id == table.c.id)
+             .order_by(table.c.date, table.c.id)
+             .execution_options(yield_per=batch_size))
+    for row in db.session.execute(query):
+        values = dict(row._mapping)
+        values['priority_score'] = row.priority_score_value
+        values['engagement'] = row.engagement_value
+        values['topics'] = load_column(row.topics, [])
+        values['summary'] = load_blob(row.analysis, {}).get('summary')
+        meetings.write(values, row.date.strftime('%Y-%m'))
+    written['meetings'] = meetings.close()
+
+    topics = PartitionedWriter(os.path.join(root, 'meeting_topics'), schemas['meeting_topics'], fmt, 'month', row_group_size)
+    query = (select(MeetingTopic.meeting_id, MeetingTopic.topic, Meeting.date)
+             .join(Meeting, Meeting.id == MeetingTopic.meeting_id)
+             .order_by(Meeting.date, MeetingTopic.meeting_id)
+             .execution_options(yield_per=batch_size))
+    for row in db.session.execute(query):
+        topics.write(row._mapping, row.date.strftime('%Y-%m'))
+    written['meeting_topics'] = topics.close()
+
+    rollups = PartitionedWriter(os.path.join(root, 'analytics_rollup'), schemas['analytics_rollup'], fmt,
+                                row_group_size=row_group_size)
+    for rollup in AnalyticsRollup.query.order_by(AnalyticsRollup.dimension, AnalyticsRollup.bucket):
+        rollups.write({
+            'dimension': rollup.dimension,
+            'bucket': rollup.bucket,
+            'meeting_count': rollup.meeting_count,
+            'accuracy_sum': rollup.accuracy_sum,
+            'avg_accuracy': rollup.accuracy_sum / rollup.meeting_count if rollup.meeting_count else None
+        })
+    written['analytics_rollup'] = rollups.close()
+    return written
+
+def build_analytics_snapshot():
+    """
+    Export a fresh Parquet snapshot for the analytics engine and swap it in
+
+    The snapshot is written next to ANALYTICS_SNAPSHOT_DIR and renamed into
+    place, so queries keep reading the previous snapshot until it is complete.
+    """
+    target = app.config['ANALYTICS_SNAPSHOT_DIR']
+    building = f'{target}.building'
+    shutil.rmtree(building, ignore_errors=True)
+    written = export_columnar(building, 'parquet', app.config['EXPORT_BATCH_SIZE'])
+    with open(os.path.join(building, SNAPSHOT_MARKER), 'w') as f:
+        f.write(datetime.utcnow().isoformat())
+
+    retired = f'{target}.old'
+    shutil.rmtree(retired, ignore_errors=True)
+    if os.path.exists(target):
+        os.rename(target, retired)
+    os.rename(building, target)
+    shutil.rmtree(retired, ignore_errors=True)
+    return written
+
+# Schema migrations (applied in order by create_tables and `flask schema upgrade`)
+migrations = Migrations()
+
+@migrations.register(1, 'Backfill analytics rollups')
+def _migration_backfill_rollups(session):
+    return rebuild_rollups
+
+@migrations.register(2, 'Secondary indexes on meeting url, created_at, location and priority')
+def _migration_meeting_indexes(session):
+    create_indexes(session.connection(), Meeting.__table__, [
+        'ix_meeting_url', 'ix_meeting_created_at',
+        'ix_meeting_location_created_at', 'ix_meeting_priority_created_at'
+    ])
+
+@migrations.register(3, 'Backfill meeting_topic from the JSON topics column')
+def _migration_backfill_topics(session):
+    backfill_topic_links(session)
+
+@migrations.register(4, 'FTS5 full-text search index over meetings')
+def _migration_search_index(session):
+    create_search_table(session.connection())
+    return rebuild_search_index
+
+@migrations.register(5, 'Meeting updated_at for ETags')
+def _migration_meeting_updated_at(session):
+    connection = session.connection()
+    add_column(connection, Meeting.__table__, 'updated_at')
+    connection.execute(Meeting.__table__.update()
+                       .where(Meeting.updated_at.is_(None))
+                       .values(updated_at=func.coalesce(Meeting.created_at, datetime.utcnow())))
+    bump_collection_version(connection, 'meetings')
+
+@migrations.register(6, 'Meeting canonical_url for URL-deduplicated analysis')
+def _migration_meeting_canonical_url(session):
+    connection = session.connection()
+    table = Meeting.__table__
+    add_column(connection, table, 'canonical_url')
+    rows = connection.execute(select(table.c.id, table.c.url).where(table.c.canonical_url.is_(None))).all()
+    if rows:
+        connection.execute(
+            table.update().where(table.c.id == bindparam('meeting_id')).values(canonical_url=bindparam('canonical')),
+            [{'meeting_id': row.id, 'canonical': normalize_url(row.url)} for row in rows]
+        )
+    create_indexes(connection, table, ['ix_meeting_canonical_url'])
+
+@migrations.register(7, 'Typed priority score, engagement and segment columns')
+def _migration_meeting_typed_values(session):
+    connection = session.connection()
+    table = Meeting.__table__
+    for field, _ in TYPED_DISPLAY_FIELDS.values():
+        add_column(connection, table, field)
+
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            select(table.c.id, *(table.c[key] for key in TYPED_DISPLAY_FIELDS))
+            .where(table.c.id > last_id).order_by(table.c.id).limit(10000)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            table.update().where(table.c.id == bindparam('meeting_id')).values(**{
+                field: bindparam(field) for field, _ in TYPED_DISPLAY_FIELDS.values()
+            }),
+            [dict(meeting_id=row.id, **{
+                field: parse(row._mapping[key]) for key, (field, parse) in TYPED_DISPLAY_FIELDS.items()
+            }) for row in rows]
+        )
+        last_id = rows[-1].id
+    create_indexes(connection, table, ['ix_meeting_priority_score_value', 'ix_meeting_engagement_value'])
+    bump_collection_version(connection, 'meetings')
+
+@migrations.register(8, 'Index meeting dates and report creation times; backfill parsed meeting dates')
+def _migration_meeting_dates(session):
+    connection = session.connection()
+    table = Meeting.__table__
+    create_indexes(connection, table, ['ix_meeting_date'])
+    create_indexes(connection, Report.__table__, ['ix_report_created_at'])
+
+    # Bulk imports used to store datetimes without SQLAlchemy's microsecond
+    # suffix, which sorts them before equal bounds in range comparisons
+    for name in ('date', 'created_at', 'updated_at'):
+        column = func.cast(table.c[name], db.String)
+        connection.execute(
+            table.update().where(func.length(column) == 19).values({name: column + '.000000'})
+        )
+
+    # Meetings whose stored analysis carries the page's date were dated at analysis time.
+    # Analyses still live in the meeting row here; migration 9 moves them out.
+    analysis = db.column('analysis', db.Text)
+    analysis_date = func.json_extract(analysis, '$.date')
+    rows = connection.execute(
+        select(table.c.id, table.c.date, analysis_date.label('analysis_date'))
+        .select_from(table)
+        .where(func.json_valid(analysis), analysis_date.is_not(None))
+    ).all()
+    updates = [
+        {'meeting_id': row.id, 'date': parsed}
+        for row in rows
+        for parsed in [parse_meeting_date(str(row.analysis_date))]
+        if parsed is not None and parsed != row.date
+    ]
+    if updates:
+        connection.execute(
+            table.update().where(table.c.id == bindparam('meeting_id'))
+            .values(date=bindparam('date'), updated_at=datetime.utcnow()),
+            updates
+        )
+        bump_collection_version(connection, 'meetings')
+        return rebuild_rollups
+
+@migrations.register(9, 'Move meeting quotes and analysis into the meeting_details side table')
+def _migration_meeting_details(session):
+    connection = session.connection()
+    MeetingDetails.__table__.create(connection, checkfirst=True)
+    if not has_column(connection, 'meeting', 'analysis'):
+        return
+
+    table = Meeting.__table__
+    legacy = select(table.c.id, db.column('quotes', db.Text), db.column('analysis', db.Text)).select_from(table)
+    connection.execute(
+        MeetingDetails.__table__.insert().prefix_with('OR IGNORE')
+        .from_select(['meeting_id', 'quotes', 'analysis'], legacy)
+    )
+    # Rewrites the meeting table without the blobs; VACUUM returns the freed pages
+    drop_column(connection, 'meeting', 'quotes')
+    drop_column(connection, 'meeting', 'analysis')
+
+@migrations.register(10, 'Compress meeting_details blobs')
+def _migration_compress_details(session):
+    BlobDictionary.__table__.create(session.connection(), checkfirst=True)
+    report = compress_meeting_details(session.connection())
+    logger.info(f"Compressed {format_blob_report(report)}")
+
+@migrations.register(11, 'Meeting analyzer_version, page content cache and backfill checkpoints')
+def _migration_analyzer_version(session):
+    connection = session.connection()
+    add_column(connection, Meeting.__table__, 'analyzer_version')
+    create_indexes(connection, Meeting.__table__, ['ix_meeting_analyzer_version'])
+    PageContent.__table__.create(connection, checkfirst=True)
+    BackfillCheckpoint.__table__.create(connection, checkfirst=True)
+    # Existing analyses predate versioning and stay NULL, i.e. stale
+
+@migrations.register(12, 'Meeting feature vectors for model scoring')
+def _migration_meeting_features(session):
+    MeetingFeatures.__table__.create(session.connection(), checkfirst=True)
+    # Vectors are filled in as meetings are re-analyzed (`flask analyses backfill`)
+
+@migrations.register(13, 'MinHash signatures, LSH buckets and duplicate URL aliases')
+def _migration_meeting_signatures(session):
+    connection = session.connection()
+    for model in (MeetingSignature, MeetingLSHBucket, MeetingAlias):
+        model.__table__.create(connection, checkfirst=True)
+    # Signatures are filled in as meetings are re-analyzed (`flask analyses backfill`)
+
+@migrations.register(14, 'Related meetings TF-IDF index')
+def _migration_related_index(session):
+    connection = session.connection()
+    for model in (RelatedTerm, RelatedPosting, RelatedDocument, RelatedQueue):
+        model.__table__.create(connection, checkfirst=True)
+    # Queue every meeting; the related index worker indexes them in the background
+    queue_related(connection, [meeting_id for meeting_id, in connection.execute(select(Meeting.id))])
+
+@migrations.register(15, 'People and their meeting mentions')
+def _migration_people(session):
+    connection = session.connection()
+    for model in (Person, PersonMention):
+        model.__table__.create(connection, checkfirst=True)
+    # Mentions are filled in as meetings are re-analyzed (`flask analyses backfill`)
+
+@migrations.register(16, 'Meeting analysis time, separate from updated_at')
+def _migration_analyzed_at(session):
+    connection = session.connection()
+    table = Meeting.__table__
+    add_column(connection, table, 'analyzed_at')
+    # Best estimate for existing analyses: when their page was fetched, else their last update
+    fetched_at = (select(PageContent.fetched_at)
+                  .where(PageContent.canonical_url == table.c.canonical_url).scalar_subquery())
+    connection.execute(
+        table.update()
+        .where(table.c.status == 'analyzed', table.c.analyzed_at.is_(None))
+        .values(analyzed_at=func.coalesce(fetched_at, table.c.updated_at))
+    )
+
 # AI Analysis Functions
 class MeetingAnalyzer:
+    # Bump whenever extraction changes; meetings analyzed by an older version
+    # are re-analyzed by `flask analyses backfill`
+    # 1: original extraction, 2: meeting dates parsed from the page,
+    # 3: feature vectors, model priority score and engagement, 4: MinHash signatures,
+    # 5: participants and quote speakers
+    VERSION = 5
+
     @staticmethod
-    def analyze_meeting_url(url):
-        """Analyze a meeting URL and extract information"""
-        try:
-            response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+    def fetch_page(url):
+        """Download a meeting page and return its body"""
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+        return response.content
 
-            # Extract basic information
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else "Meeting Analysis"
+    @staticmethod
+    def read_page(content):
+        """Title and text of a fetched page"""
+        soup = BeautifulSoup(content, 'html.parser')
+        title = soup.find('title')
+        return (title.get_text().strip() if title else "Meeting Analysis"), soup.get_text()
 
-            # Try to find meeting-specific content
-            content = soup.get_text()
+    @staticmethod
+    def analyze_meeting_url(url, content=None, page=None):
+        """
+        Analyze a meeting URL and extract information, from ``content`` if the
+        page is already fetched, or from its ``read_page`` result if it is already parsed
+        """
+        try:
+            if page is None:
+                if content is None:
+                    content = MeetingAnalyzer.fetch_page(url)
+                page = MeetingAnalyzer.read_page(content)
+            title_text, content = page
 
             # Simple AI simulation - extract key information
+            meeting_date = find_meeting_date(content)
+            features = extract_features(title_text, content)
+            scores = scoring_model.score_one(features)
+            quotes = MeetingAnalyzer._extract_quotes(content)
             analysis_result = {
                 'title': title_text,
+                'date': meeting_date.strftime('%Y-%m-%d') if meeting_date else None,
                 'location': MeetingAnalyzer._extract_location(content),
                 'topics': MeetingAnalyzer._extract_topics(content),
                 'priority': MeetingAnalyzer._calculate_priority(content),
-                'engagement_estimate': MeetingAnalyzer._estimate_engagement(content),
-                'key_quotes': MeetingAnalyzer._extract_quotes(content),
+                'priority_score': format_priority_score(scores['priority_score']),
+                'engagement_estimate': format_engagement(scores['engagement']),
+                'key_quotes': quotes,
+                'participants': MeetingAnalyzer._extract_participants(content, quotes),
+                'features': features,
+                'signature': page_signature(content),
                 'ai_accuracy': 95.5
             }
 
@@ -161,20 +1860,6 @@ class MeetingAnalyzer:
         else:
             return 'medium'
 
-    @staticmethod
-    def _estimate_engagement(content):
-        """Estimate engagement based on content length and complexity"""
-        word_count = len(content.split())
-
-        if word_count > 5000:
-            return '85%'
-        elif word_count > 2000:
-            return '65%'
-        elif word_count > 1000:
-            return '45%'
-        else:
-            return '25%'
-
     @staticmethod
     def _extract_quotes(content):
         """Extract potential quotes from content"""
@@ -186,9 +1871,10 @@ class MeetingAnalyzer:
             sentence = sentence.strip()
             if len(sentence) > 50 and len(sentence) < 200:
                 if any(word in sentence.lower() for word in ['will', 'need', 'important', 'council', 'community']):
+                    speaker = find_speaker(sentence)
                     quotes.append({
                         'text': sentence,
-                        'speaker': 'Council Member',
+                        'speaker': f"{speaker['role']} {speaker['name']}" if speaker else 'Council Member',
                         'confidence': 85.0,
                         'timestamp': '00:00:00'
                     })
@@ -197,6 +1883,14 @@ class MeetingAnalyzer:
 
         return quotes
 
+    @staticmethod
+    def _extract_participants(content, quotes):
+        """People named in the content, flagged ``quoted`` when a key quote is attributed to them"""
+        speakers = {name_key(speaker['name']) for speaker in map(find_speaker, (quote['text'] for quote in quotes))
+                    if speaker is not None}
+        return [dict(participant, quoted=name_key(participant['name']) in speakers)
+                for participant in extract_participants(content)]
+
 # Routes
 @app.route('/')
 def dashboard():
@@ -207,9 +1901,19 @@ def dashboard():
 def add_meeting_page():
     return render_template('add_meeting.html')
 
+# Concurrent analyses of the same canonical URL share one fetch (per worker process)
+analysis_flights = SingleFlight()
+
 @app.route('/api/analyze_meeting', methods=['POST'])
 def analyze_meeting():
-    """API endpoint to analyze a meeting URL"""
+    """
+    API endpoint to analyze a meeting URL
+
+    URLs are deduplicated on their canonical form: a meeting analyzed within
+    ANALYSIS_TTL_SECONDS is returned as is, an older one is re-analyzed in
+    place, and concurrent requests for the same URL wait on a single analysis.
+    Pass ``"refresh": true`` to re-analyze regardless of age.
+    """
     try:
         data = request.get_json()
         url = data.get('url')
@@ -217,96 +1921,479 @@ def analyze_meeting():
         if not url:
             return jsonify({'error': 'URL is required'}), 400
 
-        # Analyze the meeting
-        analysis = MeetingAnalyzer.analyze_meeting_url(url)
-
-        if 'error' in analysis:
-            return jsonify({'error': analysis['error']}), 400
-
-        # Create meeting record
-        meeting = Meeting(
-            title=analysis['title'],
-            location=analysis['location'],
-            url=url,
-            priority=analysis['priority'],
-            priority_score=f"{min(95, max(20, len(analysis['title']) + 50))}%",
-            engagement=f"{analysis['engagement_estimate']} high engagement",
-            ai_accuracy=analysis['ai_accuracy'],
-            date=datetime.now(),
-            status='analyzed'
+        canonical_url = normalize_url(url)
+        (payload, status), shared = analysis_flights.do(
+            canonical_url, analyze_canonical_url, url, canonical_url, bool(data.get('refresh'))
         )
+        if status != 200:
+            return jsonify(payload), status
+        return api_response(dict(payload, coalesced=shared))
 
-        meeting.set_topics(analysis['topics'])
-        meeting.set_quotes(analysis['key_quotes'])
-        meeting.set_analysis(analysis)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
+def analyze_canonical_url(url, canonical_url, refresh=False):
+    """
+    Return the stored analysis for ``canonical_url`` if it is fresh, otherwise
+    analyze ``url`` and create or update its meeting
+
+    A URL seen for the first time whose page near-duplicates an analyzed
+    meeting (MinHash over the LSH index) is linked to that meeting as an
+    alias and gets its analysis, instead of being analyzed and stored again.
+
+    Returns:
+        tuple: (payload dict, HTTP status)
+    """
+    meeting = (Meeting.query
+               .filter_by(canonical_url=canonical_url)
+               .order_by(Meeting.updated_at.desc(), Meeting.id.desc())
+               .first())
+    alias = db.session.get(MeetingAlias, canonical_url) if meeting is None else None
+
+    if not refresh and is_fresh_analysis(meeting):
+        return analysis_payload(meeting, reused=True), 200
+    if not refresh and alias is not None and is_fresh_analysis(alias.meeting):
+        return duplicate_payload(alias), 200
+
+    # Analyze the meeting, keeping the page for later re-analysis
+    try:
+        content = MeetingAnalyzer.fetch_page(url)
+    except requests.RequestException as e:
+        return {'error': str(e)}, 400
+    page = MeetingAnalyzer.read_page(content)
+
+    if meeting is None:
+        original, score = find_duplicate(page_signature(page[1]))
+        if original is not None:
+            alias = alias or MeetingAlias(canonical_url=canonical_url)
+            alias.meeting_id, alias.similarity = original.id, score
+            db.session.add(alias)
+            db.session.commit()
+            return duplicate_payload(alias), 200
+        if alias is not None:  # The page no longer matches the meeting it was linked to
+            db.session.delete(alias)
+
+    analysis = MeetingAnalyzer.analyze_meeting_url(url, content, page)
+
+    if 'error' in analysis:
+        return {'error': analysis['error']}, 400
+
+    # Re-analysis updates the existing record instead of adding a duplicate
+    if meeting is None:
+        meeting = Meeting(url=url)
         db.session.add(meeting)
-        db.session.commit()
 
-        # Format analysis to match frontend expectations
-        formatted_analysis = {
-            'title': analysis['title'],
-            'location': analysis['location'],
-            'date': datetime.now().strftime('%B %d, %Y'),
-            'topics': analysis['topics'],
-            'priority': analysis['priority'],
-            'engagement_estimate': analysis['engagement_estimate'],
-            'key_quotes': analysis['key_quotes'],
-            'ai_accuracy': analysis['ai_accuracy'],
-            'summary': f"Meeting focused on {', '.join(analysis['topics'][:2])} with {analysis['priority']} priority level."
-        }
+    apply_analysis(meeting, analysis)
+    store_page_content(canonical_url, content)  # After the meeting is complete: merge() autoflushes
+    db.session.commit()
 
-        return jsonify({
-            'success': True,
-            'meeting_id': meeting.id,
-            'analysis': formatted_analysis
-        })
+    return analysis_payload(meeting, reused=False), 200
+
+def is_fresh_analysis(meeting):
+    """Whether ``meeting`` was analyzed by the current analyzer within ANALYSIS_TTL_SECONDS"""
+    ttl = timedelta(seconds=app.config['ANALYSIS_TTL_SECONDS'])
+    return (meeting is not None and meeting.status == 'analyzed'
+            and meeting.analyzer_version == MeetingAnalyzer.VERSION
+            and meeting.analyzed_at is not None and meeting.analyzed_at >= datetime.utcnow() - ttl)
+
+def duplicate_payload(alias):
+    """Stored analysis of the meeting an aliased URL was linked to"""
+    return dict(analysis_payload(alias.meeting, reused=True), duplicate_of=alias.meeting_id,
+                similarity=round(alias.similarity, 3))
+
+def store_page_content(canonical_url, content):
+    """Keep the fetched body of a meeting page for later re-analysis"""
+    db.session.merge(PageContent(canonical_url=canonical_url, content=blob_codec.compress(content),
+                                 fetched_at=datetime.utcnow()))
+
+def apply_analysis(meeting, analysis):
+    """Copy a MeetingAnalyzer result onto ``meeting``"""
+    # The page's own meeting date; fall back to when it was first analyzed
+    meeting.date = parse_meeting_date(analysis.get('date')) or meeting.date or datetime.now()
+    meeting.title = analysis['title']
+    meeting.location = analysis['location']
+    meeting.priority = analysis['priority']
+    meeting.priority_score = analysis['priority_score']
+    meeting.engagement = f"{analysis['engagement_estimate']} high engagement"
+    # Kept out of the stored analysis
+    meeting.set_features(analysis.pop('features'))
+    meeting.set_signature(analysis.pop('signature'))
+    meeting.ai_accuracy = analysis['ai_accuracy']
+    meeting.status = 'analyzed'
+    meeting.analyzer_version = MeetingAnalyzer.VERSION
+    meeting.analyzed_at = datetime.utcnow()
+
+    analysis['summary'] = f"Meeting focused on {', '.join(analysis['topics'][:2])} with {analysis['priority']} priority level."
+
+    meeting.set_topics(analysis['topics'])
+    meeting.set_quotes(analysis['key_quotes'])
+    meeting.set_analysis(analysis)
+    meeting.set_participants(analysis.get('participants', []))  # Last: resolving people autoflushes
+
+def analysis_payload(meeting, reused):
+    """Format a meeting's stored analysis to match frontend expectations"""
+    analysis = meeting.get_analysis()
+    return {
+        'success': True,
+        'meeting_id': meeting.id,
+        'reused': reused,
+        'analyzed_at': meeting.analyzed_at.isoformat() if meeting.analyzed_at else None,
+        'analysis': {
+            'title': meeting.title,
+            'location': meeting.location,
+            'date': meeting.date.strftime('%B %d, %Y') if meeting.date else None,
+            'topics': meeting.get_topics(),
+            'priority': meeting.priority,
+            # The column, which `flask scores rescore` keeps current
+            'engagement_estimate': (format_engagement(meeting.engagement_value)
+                                    if meeting.engagement_value is not None else analysis.get('engagement_estimate')),
+            'key_quotes': meeting.get_quotes(),
+            'participants': meeting.get_participants(),
+            'ai_accuracy': meeting.ai_accuracy,
+            'summary': analysis.get('summary')
+        }
+    }
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+def not_modified(etag):
+    """Return a 304 response if the request's If-None-Match already has this ETag"""
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    return None
+
+def encoded_response(body, mimetype, encoding=None, etag=None, status=200):
+    response = app.response_class(body, status=status, mimetype=mimetype)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.update(('Accept', 'Accept-Encoding'))
+    if etag:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def api_response(payload, status=200):
+    """Serialize an API payload as JSON or msgpack, compressed per Accept-Encoding"""
+    variant = negotiate(request)
+    body, encoding = encode_body(payload, variant)
+    return encoded_response(body, variant.mimetype, encoding, status=status)
+
+def date_range_args():
+    """
+    Parse the ``from``/``to`` query parameters shared by the list endpoints
+
+    Returns:
+        tuple: (start, end) datetimes or None; ``end`` is exclusive
+
+    Raises:
+        ValueError: if either value is not a recognizable date
+    """
+    return (parse_range_bound(request.args.get('from')),
+            parse_range_bound(request.args.get('to'), end=True))
+
+def cached_api_response(cache_key, etag, tags, build_payload):
+    """
+    Serve a versioned API payload through the response cache
+
+    ``etag`` identifies the current version of the data; each negotiated
+    representation gets its own ETag and cache entry derived from it, and
+    ``build_payload`` only runs on a cache miss.
+    """
+    variant = negotiate(request)
+    variant_etag = f"{etag}+{variant_tag(variant)}"
+    cached = not_modified(variant_etag)
+    if cached:
+        return cached
+
+    key = f"{cache_key}|{variant_tag(variant)}"
+    entry = response_cache.get(key)
+    if entry is not None and entry.etag == variant_etag:
+        return encoded_response(entry.body, entry.mimetype, entry.encoding, entry.etag)
+
+    body, encoding = encode_body(build_payload(), variant)
+    response_cache.set(key, body, variant_etag, tags=tags, mimetype=variant.mimetype, encoding=encoding)
+    return encoded_response(body, variant.mimetype, encoding, variant_etag)
 
 @app.route('/api/meetings')
 def get_meetings():
-    """API endpoint to get all meetings"""
-    meetings = Meeting.query.order_by(Meeting.created_at.desc()).all()
-
-    meetings_data = []
-    for meeting in meetings:
-        meetings_data.append({
-            'id': meeting.id,
-            'title': meeting.title,
-            'location': meeting.location,
-            'date': meeting.date.strftime('%Y-%m-%d'),
-            'priority': meeting.priority,
-            'priority_score': meeting.priority_score,
-            'engagement': meeting.engagement,
-            'topics': meeting.get_topics(),
-            'status': meeting.status,
-            'url': meeting.url
-        })
+    """
+    API endpoint to get meetings, optionally filtered by location, priority and topic and paginated
+
+    ``from``/``to`` bound the meeting date (a bare ``to`` date is inclusive).
+    ``sort`` orders by created_at (default), date, priority_score, engagement
+    or segment_seconds, descending with a "-" prefix; ``min_<name>`` and
+    ``max_<name>`` filter the typed priority_score, engagement and
+    segment_seconds values.
+    """
+    location = request.args.get('location') or None
+    priority = request.args.get('priority') or None
+    topic = request.args.get('topic') or None
+    page = request.args.get('page', type=int)
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
 
-    return jsonify(meetings_data)
+    try:
+        date_from, date_to = date_range_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    sort = request.args.get('sort') or '-created_at'
+    if sort.lstrip('-') not in SORTABLE_COLUMNS:
+        return jsonify({'error': f"sort must be one of {', '.join(SORTABLE_COLUMNS)} (prefix '-' for descending)"}), 400
+    ranges = {}
+    for name in RANGE_FILTERS:
+        for bound in ('min', 'max'):
+            raw = request.args.get(f'{bound}_{name}')
+            if raw:
+                try:
+                    ranges[(name, bound)] = float(raw)
+                except ValueError:
+                    return jsonify({'error': f"{bound}_{name} must be a number"}), 400
+
+    def build_payload():
+        query = db.session.query(*LISTING_COLUMNS)
+        if topic:
+            query = query.join(MeetingTopic, MeetingTopic.meeting_id == Meeting.id).filter(MeetingTopic.topic == topic)
+        if location:
+            query = query.filter(Meeting.location == location)
+        if priority:
+            query = query.filter(Meeting.priority == priority)
+        if date_from:
+            query = query.filter(Meeting.date >= date_from)
+        if date_to:
+            query = query.filter(Meeting.date < date_to)
+        for (name, bound), value in ranges.items():
+            column = SORTABLE_COLUMNS[name]
+            query = query.filter(column >= value if bound == 'min' else column <= value)
+        column = SORTABLE_COLUMNS[sort.lstrip('-')]
+        if sort.startswith('-'):
+            query = query.order_by(column.desc(), Meeting.id.desc())
+        else:
+            query = query.order_by(column.asc(), Meeting.id.asc())
+        if page:
+            query = query.limit(per_page).offset((max(page, 1) - 1) * per_page)
+        return [MeetingSummary.from_row(row) for row in query]
+
+    # Any meeting write bumps the collection version, so it identifies every listing
+    return cached_api_response(
+        f"meetings:{location}|{priority}|{topic}|{page}|{per_page}|{sort}|{sorted(ranges.items())}|{date_from}|{date_to}",
+        f"meetings-{collection_version('meetings')}",
+        [listing_cache_tag(location, priority, topic)],
+        build_payload
+    )
 
 @app.route('/api/meeting/<int:meeting_id>')
 def get_meeting(meeting_id):
     """API endpoint to get a specific meeting"""
-    meeting = Meeting.query.get_or_404(meeting_id)
+    # Check the row version first so unchanged meetings never load their JSON blobs
+    version = db.session.query(Meeting.updated_at).filter(Meeting.id == meeting_id).first()
+    if version is None:
+        abort(404)
+
+    def build_payload():
+        return MeetingDetail.from_meeting(Meeting.query.get_or_404(meeting_id))
+
+    cache_key = f'meeting:{meeting_id}'
+    return cached_api_response(cache_key, meeting_etag(meeting_id, version.updated_at), [cache_key], build_payload)
+
+# Exportable fields: the meeting row, then its details (joined only when requested)
+EXPORT_COLUMNS = dict(Meeting.__table__.c.items())
+EXPORT_DETAIL_FIELDS = ('quotes', 'analysis')
+EXPORT_COLUMNS.update(
+    (name, func.coalesce(column, column.default.arg).label(name))
+    for name, column in MeetingDetails.__table__.c.items() if name in EXPORT_DETAIL_FIELDS
+)
+
+# JSON text columns, embedded decoded in NDJSON exports
+MEETING_JSON_FIELDS = ('topics', 'quotes', 'analysis')
+
+def _decompress_fields(row, positions):
+    values = list(row)
+    for position in positions:
+        values[position] = blob_text(values[position])
+    return values
+
+@app.route('/api/export/meetings.<fmt>')
+def export_meetings(fmt):
+    """
+    Stream every meeting as NDJSON or CSV
+
+    Rows are read through a server-side cursor in batches of
+    EXPORT_BATCH_SIZE and written out as they arrive, so memory use does not
+    grow with the table. ``fields`` selects columns (comma separated), and the
+    location, priority, topic and from/to filters match /api/meetings.
+    """
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({'error': f"Unsupported export format '{fmt}'"}), 404
+
+    fields = [name.strip() for name in request.args.get('fields', '').split(',') if name.strip()] or list(EXPORT_COLUMNS)
+    unknown = [name for name in fields if name not in EXPORT_COLUMNS]
+    if unknown:
+        return jsonify({'error': f"Unknown fields: {', '.join(unknown)}"}), 400
+
+    query = select(*(EXPORT_COLUMNS[name] for name in fields)).select_from(Meeting)
+    if any(name in EXPORT_DETAIL_FIELDS for name in fields):
+        query = query.outerjoin(MeetingDetails, MeetingDetails.meeting_id == Meeting.id)
+    if request.args.get('topic'):
+        query = query.join(MeetingTopic, MeetingTopic.meeting_id == Meeting.id).where(MeetingTopic.topic == request.args['topic'])
+    if request.args.get('location'):
+        query = query.where(Meeting.location == request.args['location'])
+    if request.args.get('priority'):
+        query = query.where(Meeting.priority == request.args['priority'])
+    try:
+        date_from, date_to = date_range_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if date_from:
+        query = query.where(Meeting.date >= date_from)
+    if date_to:
+        query = query.where(Meeting.date < date_to)
+    query = query.order_by(Meeting.id).execution_options(yield_per=app.config['EXPORT_BATCH_SIZE'])
+
+    blobs = [position for position, name in enumerate(fields) if name in EXPORT_DETAIL_FIELDS]
+
+    def generate():
+        rows = db.session.execute(query)
+        if blobs:
+            rows = (_decompress_fields(row, blobs) for row in rows)
+        if fmt == 'csv':
+            yield from iter_csv(rows, fields)
+        else:
+            yield from iter_ndjson(rows, fields, MEETING_JSON_FIELDS)
+
+    response = app.response_class(stream_with_context(generate()), mimetype=EXPORT_FORMATS[fmt])
+    response.headers['Content-Disposition'] = f'attachment; filename=meetings.{fmt}'
+    return response
+
+@app.route('/api/import/meetings', methods=['POST'])
+def import_meetings_endpoint():
+    """
+    Bulk upsert meetings from an NDJSON request body
+
+    The body is read as a stream and written in batches of ``batch_size``
+    lines (default 5000); the response reports counts, rejected lines and
+    throughput.
+    """
+    batch_size = min(max(request.args.get('batch_size', 5000, type=int), 1), 50000)
+    stats = import_meetings(request.stream, batch_size=batch_size)
+    return api_response(stats.as_dict())
+
+@app.route('/api/cache/stats')
+def cache_stats():
+    """API endpoint exposing this worker's response cache counters"""
+    return api_response(response_cache.stats())
+
+@app.route('/api/search')
+def search_meetings():
+    """API endpoint for ranked full-text search over meetings"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': 'Query parameter q is required'}), 400
+
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    hits = search_documents(db.session.connection(), query, limit=limit, offset=offset)
+
+    # Fetch only the listing columns for the matched ids
+    rows = {
+        row.id: row for row in db.session.query(
+            Meeting.id, Meeting.title, Meeting.location, Meeting.date, Meeting.priority
+        ).filter(Meeting.id.in_([hit['id'] for hit in hits]))
+    }
+
+    results = []
+    for hit in hits:
+        row = rows.get(hit['id'])
+        if row is None:
+            continue
+        results.append({
+            'id': row.id,
+            'title': row.title,
+            'location': row.location,
+            'date': row.date.strftime('%Y-%m-%d'),
+            'priority': row.priority,
+            'score': round(-hit['score'], 4),
+            'snippet': hit['snippet']
+        })
 
-    return jsonify({
-        'id': meeting.id,
-        'title': meeting.title,
-        'location': meeting.location,
-        'date': meeting.date.strftime('%Y-%m-%d'),
-        'priority': meeting.priority,
-        'priority_score': meeting.priority_score,
-        'engagement': meeting.engagement,
-        'topics': meeting.get_topics(),
-        'quotes': meeting.get_quotes(),
-        'analysis': meeting.get_analysis(),
-        'status': meeting.status,
-        'url': meeting.url,
-        'ai_accuracy': meeting.ai_accuracy
-    })
+    return api_response({'query': query, 'results': results})
+
+@app.route('/api/meeting/<int:meeting_id>/related')
+def get_related_meetings(meeting_id):
+    """
+    API endpoint for the meetings most similar to this one
+
+    Scored by tf-idf cosine through the related index, which the background
+    worker keeps in sync; ``indexed`` is false until it has seen the meeting.
+    """
+    if db.session.query(Meeting.id).filter(Meeting.id == meeting_id).first() is None:
+        abort(404)
+
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
+    matches, indexed = related_meetings(meeting_id, limit)
+    rows = {
+        row.id: row for row in db.session.query(
+            Meeting.id, Meeting.title, Meeting.location, Meeting.date, Meeting.priority
+        ).filter(Meeting.id.in_([related_id for related_id, _ in matches]))
+    }
+
+    results = []
+    for related_id, score in matches:
+        row = rows.get(related_id)
+        if row is None:  # Deleted, not yet dropped from the index
+            continue
+        results.append({
+            'id': row.id,
+            'title': row.title,
+            'location': row.location,
+            'date': row.date.strftime('%Y-%m-%d'),
+            'priority': row.priority,
+            'score': round(score, 4)
+        })
+
+    return api_response({'meeting_id': meeting_id, 'indexed': indexed, 'related': results})
+
+def person_payload(person):
+    mentions = db.session.query(func.count()).filter(PersonMention.person_id == person.id).scalar()
+    return {'id': person.id, 'name': person.name, 'role': person.role, 'meetings': mentions}
+
+@app.route('/api/people')
+def find_people():
+    """
+    API endpoint for the people a name may refer to
+
+    ``name`` is matched the way names on pages are resolved (same block,
+    fuzzy surname, compatible given names), best match first.
+    """
+    key = name_key(normalize_name(request.args.get('name', '')))
+    if not key:
+        return jsonify({'error': 'Query parameter name is required'}), 400
+
+    return api_response({'name': request.args['name'],
+                         'people': [dict(person_payload(person), match=round(score, 3))
+                                    for score, person in person_matches(key)]})
+
+@app.route('/api/people/<int:person_id>/meetings')
+def get_person_meetings(person_id):
+    """
+    API endpoint for the meetings that name a person, newest meeting date first
+
+    Read from the person's range of the person_mention index; ``page`` and
+    ``per_page`` paginate as in /api/meetings.
+    """
+    person = db.session.get(Person, person_id)
+    if person is None:
+        abort(404)
+
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
+    rows = (db.session.query(*LISTING_COLUMNS, PersonMention.role, PersonMention.quoted)
+            .join(PersonMention, PersonMention.meeting_id == Meeting.id)
+            .filter(PersonMention.person_id == person_id)
+            .order_by(Meeting.date.desc(), Meeting.id.desc())
+            .limit(per_page).offset((page - 1) * per_page))
+    return api_response({'person': person_payload(person), 'page': page, 'per_page': per_page,
+                         'meetings': [PersonMeeting.from_row(row) for row in rows]})
 
 @app.route('/api/delete_meeting/<int:meeting_id>', methods=['DELETE'])
 def delete_meeting(meeting_id):
@@ -326,27 +2413,97 @@ def meeting_detail(meeting_id):
 @app.route('/analytics')
 def analytics():
     """Analytics dashboard"""
-    meetings = Meeting.query.all()
+    analytics_data = build_analytics()
+    meetings = Meeting.query.order_by(Meeting.created_at.desc()).limit(10).all()
 
-    # Calculate analytics
-    total_meetings = len(meetings)
-    avg_accuracy = sum(m.ai_accuracy for m in meetings) / total_meetings if meetings else 0
+    return render_template('analytics.html', analytics=analytics_data, meetings=meetings)
+
+def build_analytics():
+    """Read dashboard statistics from the rollup tables (O(buckets), not O(meetings))"""
+    distributions = {'priority': {}, 'location': {}, 'topic': {}, 'day': {}}
+    total_meetings, accuracy_sum = 0, 0.0
 
-    priority_counts = {}
-    location_counts = {}
+    for row in AnalyticsRollup.query.all():
+        if row.dimension == 'total':
+            total_meetings, accuracy_sum = row.meeting_count, row.accuracy_sum
+        elif row.dimension in distributions:
+            distributions[row.dimension][row.bucket] = row.meeting_count
 
-    for meeting in meetings:
-        priority_counts[meeting.priority] = priority_counts.get(meeting.priority, 0) + 1
-        location_counts[meeting.location] = location_counts.get(meeting.location, 0) + 1
+    monthly_counts = {}
+    for day, count in sorted(distributions['day'].items()):
+        monthly_counts[day[:7]] = monthly_counts.get(day[:7], 0) + count
 
-    analytics_data = {
+    topic_counts = dict(sorted(distributions['topic'].items(), key=lambda item: item[1], reverse=True))
+
+    return {
         'total_meetings': total_meetings,
-        'avg_accuracy': round(avg_accuracy, 1),
-        'priority_distribution': priority_counts,
-        'location_distribution': location_counts
+        'avg_accuracy': round(accuracy_sum / total_meetings, 1) if total_meetings else 0,
+        'priority_distribution': distributions['priority'],
+        'location_distribution': distributions['location'],
+        'topic_distribution': topic_counts,
+        'monthly_distribution': monthly_counts
     }
 
-    return render_template('analytics.html', analytics=analytics_data, meetings=meetings)
+@app.route('/api/analytics/query')
+def analytics_query():
+    """
+    Run a predefined analytics metric on the columnar snapshot
+
+    Query parameters: ``metric`` (kpis, trend, topic_distribution, heatmap,
+    location_performance, priority_engagement), optional ``from``/``to``
+    dates, ``location``, ``priority``, ``topic``, ``granularity`` (trend) and
+    ``limit``. Results are cached per snapshot.
+    """
+    metric = request.args.get('metric', '')
+    params = {name: request.args.get(name) or None
+              for name in ('location', 'priority', 'topic', 'granularity')}
+    try:
+        params['from'], params['to'] = date_range_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    params['limit'] = min(max(request.args.get('limit', 0, type=int), 0), 1000) or None
+
+    snapshot = analytics_engine.snapshot_info()
+    if snapshot is None:
+        return jsonify({'error': 'No analytics snapshot yet; run `flask --app app analytics snapshot`'}), 503
+
+    try:
+        return cached_api_response(
+            f"analytics:{request.query_string.decode()}",
+            f"analytics-{snapshot}",
+            [],
+            lambda: analytics_engine.query(metric, params)
+        )
+    except MetricError as e:
+        return jsonify({'error': str(e)}), 400
+    except AnalyticsUnavailable as e:
+        return jsonify({'error': str(e)}), 503
+
+@app.route('/api/reports')
+def get_reports():
+    """API endpoint to list reports, newest first, optionally within a from/to creation date range"""
+    try:
+        date_from, date_to = date_range_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    query = Report.query
+    if date_from:
+        query = query.filter(Report.created_at >= date_from)
+    if date_to:
+        query = query.filter(Report.created_at < date_to)
+    if request.args.get('type'):
+        query = query.filter(Report.type == request.args['type'])
+
+    return api_response([{
+        'id': report.id,
+        'name': report.name,
+        'type': report.type,
+        'status': report.status,
+        'file_path': report.file_path,
+        'config': load_column(report.config, {}),
+        'created_at': report.created_at.isoformat() if report.created_at else None
+    } for report in query.order_by(Report.created_at.desc()).limit(500)])
 
 @app.route('/reports')
 def reports():
@@ -359,43 +2516,319 @@ def settings():
     """Settings page"""
     return render_template('settings.html')
 
+# Maintenance commands (run with `flask --app app <command>`)
+rollup_cli = AppGroup('rollups', help='Maintain the analytics rollup tables.')
+
+@rollup_cli.command('rebuild')
+def rollups_rebuild_command():
+    """Recompute all analytics rollups from the meetings table"""
+    buckets = rebuild_rollups()
+    print(f"Rebuilt {buckets} rollup buckets")
+
+@rollup_cli.command('check')
+def rollups_check_command():
+    """Verify the analytics rollups against the meetings table"""
+    mismatches = check_rollups()
+    for mismatch in mismatches:
+        print(f"{mismatch['dimension']}:{mismatch['bucket']} expected {mismatch['expected']}, stored {mismatch['stored']}")
+    if mismatches:
+        raise SystemExit(f"{len(mismatches)} rollup buckets are inconsistent; run `flask --app app rollups rebuild`")
+    print("Analytics rollups are consistent")
+
+app.cli.add_command(rollup_cli)
+
+search_cli = AppGroup('search', help='Maintain the full-text search index.')
+
+@search_cli.command('rebuild')
+def search_rebuild_command():
+    """Re-index every meeting in the FTS5 search table"""
+    print(f"Indexed {rebuild_search_index()} meetings")
+
+app.cli.add_command(search_cli)
+
+related_cli = AppGroup('related', help='Maintain the related meetings index.')
+
+@related_cli.command('sync')
+@click.option('--batch-size', default=500, show_default=True, help='Meetings indexed per transaction.')
+def related_sync_command(batch_size):
+    """Index every queued meeting, then exit"""
+    print(f"Indexed {drain_related_queue(batch_size):,} queued meetings")
+
+@related_cli.command('worker')
+def related_worker_command():
+    """Keep the related index in sync, polling the queue every RELATED_INDEX_INTERVAL seconds"""
+    click.echo(f"Syncing the related index every {app.config['RELATED_INDEX_INTERVAL']}s (Ctrl+C to stop)")
+    try:
+        run_related_worker(app.config['RELATED_INDEX_INTERVAL'])
+    except KeyboardInterrupt:
+        pass
+
+@related_cli.command('rebuild')
+@click.option('--batch-size', default=500, show_default=True, help='Meetings indexed per transaction.')
+def related_rebuild_command(batch_size):
+    """Drop the related index and re-index every meeting"""
+    def report(total):
+        click.echo(f"\r{total:,} indexed", nl=False)
+
+    total = rebuild_related_index(batch_size, progress=report)
+    click.echo()
+    print(f"Indexed {total:,} meetings")
+
+app.cli.add_command(related_cli)
+
+import_cli = AppGroup('import', help='Bulk-load data from files.')
+
+@import_cli.command('meetings')
+@click.argument('source', type=click.File('rb'))
+@click.option('--batch-size', default=5000, show_default=True, help='Rows written per transaction.')
+def import_meetings_command(source, batch_size):
+    """Upsert meetings from an NDJSON file ('-' for stdin)"""
+    def report(stats):
+        click.echo(f"\r{stats.read:,} read, {stats.inserted:,} inserted, {stats.updated:,} updated, "
+                   f"{stats.rejected:,} rejected ({stats.rate:,.0f} rows/s)", nl=False)
+
+    stats = import_meetings(source, batch_size=batch_size, progress=report)
+    click.echo()
+    for error in stats.errors:
+        click.echo(f"line {error['line']}: {error['error']}")
+    if stats.rejected > len(stats.errors):
+        click.echo(f"... and {stats.rejected - len(stats.errors)} more rejected lines")
+    click.echo(f"Imported {stats.inserted + stats.updated:,} meetings in {stats.elapsed:.1f}s ({stats.rate:,.0f} rows/s)")
+
+app.cli.add_command(import_cli)
+
+export_cli = AppGroup('export', help='Write datasets for offline analysis.')
+
+@export_cli.command('columnar')
+@click.argument('directory', type=click.Path(file_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(sorted(COLUMNAR_FORMATS)), default='parquet', show_default=True)
+@click.option('--row-group-size', default=64 * 1024, show_default=True, help='Rows per row group / record batch.')
+def export_columnar_command(directory, fmt, row_group_size):
+    """Export meetings, topics and rollups as month-partitioned Parquet or Arrow files"""
+    if os.path.isdir(directory) and os.listdir(directory):
+        raise click.ClickException(f"{directory} is not empty")
+    try:
+        written = export_columnar(directory, fmt, app.config['EXPORT_BATCH_SIZE'], row_group_size)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    for dataset, files in written.items():
+        print(f"{dataset}: {sum(files.values()):,} rows in {len(files)} file(s)")
+
+app.cli.add_command(export_cli)
+
+analytics_cli = AppGroup('analytics', help='Maintain the analytics query snapshot.')
+
+@analytics_cli.command('snapshot')
+def analytics_snapshot_command():
+    """Rebuild the Parquet snapshot behind /api/analytics/query"""
+    try:
+        written = build_analytics_snapshot()
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    for dataset, files in written.items():
+        print(f"{dataset}: {sum(files.values()):,} rows in {len(files)} file(s)")
+    print(f"Snapshot written to {app.config['ANALYTICS_SNAPSHOT_DIR']}")
+
+app.cli.add_command(analytics_cli)
+
+blobs_cli = AppGroup('blobs', help='Manage compression of the meeting_details blobs.')
+
+@blobs_cli.command('stats')
+def blobs_stats_command():
+    """Show stored and uncompressed blob sizes without changing anything"""
+    table = MeetingDetails.__table__
+    stored = raw = rows = 0
+    query = select(*(table.c[field] for field in BLOB_FIELDS)).execution_options(yield_per=1000)
+    for row in db.session.execute(query):
+        rows += 1
+        for value in row:
+            if value is not None:
+                stored += len(value)
+                raw += len(blob_codec.decompress(value))
+    saved = 100.0 * (raw - stored) / raw if raw else 0.0
+    print(f"Codec: {blob_codec.algorithm}, dictionary: {blob_codec.dictionary_id or 'none'}")
+    print(f"{rows:,} meeting details: {stored:,} bytes stored, {raw:,} bytes uncompressed ({saved:.1f}% saved)")
+
+@blobs_cli.command('train')
+@click.option('--samples', default=5000, show_default=True, help='Blobs sampled to train on.')
+@click.option('--size', default=64 * 1024, show_default=True, help='Dictionary size in bytes.')
+def blobs_train_command(samples, size):
+    """Train a zstd dictionary on stored blobs, then recompress every blob with it"""
+    table = MeetingDetails.__table__
+    rows = db.session.execute(
+        select(*(table.c[field] for field in BLOB_FIELDS)).order_by(func.random()).limit(samples)
+    )
+    payloads = [blob_codec.decompress(value) for row in rows for value in row if value]
+    payloads = [payload.encode('utf-8') if isinstance(payload, str) else payload for payload in payloads]
+    try:
+        data = train_dictionary(payloads, size)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    dict_id = blob_codec.add_dictionary(data)
+    db.session.merge(BlobDictionary(id=dict_id, data=data))
+    db.session.commit()
+    print(f"Trained dictionary {dict_id} ({len(data):,} bytes) on {len(payloads):,} blobs")
+
+    report = compress_meeting_details(db.session.connection())
+    db.session.commit()
+    print(f"Recompressed {format_blob_report(report)}")
+
+@blobs_cli.command('compress')
+def blobs_compress_command():
+    """Re-encode every blob with the current codec, e.g. after installing zstandard"""
+    report = compress_meeting_details(db.session.connection())
+    db.session.commit()
+    print(f"Recompressed {format_blob_report(report)}")
+
+app.cli.add_command(blobs_cli)
+
+analyses_cli = AppGroup('analyses', help='Re-analyze meetings after analyzer upgrades.')
+
+@analyses_cli.command('backfill')
+@click.option('--batch-size', default=50, show_default=True, help='Meetings committed per batch.')
+@click.option('--workers', default=8, show_default=True, help='Pages fetched and parsed concurrently.')
+@click.option('--limit', type=int, help='Stop after this many meetings.')
+@click.option('--refetch', is_flag=True, help='Download pages even when a cached copy exists.')
+@click.option('--restart', is_flag=True, help='Start over from the first stale meeting, retrying failures.')
+def analyses_backfill_command(batch_size, workers, limit, refetch, restart):
+    """Re-analyze meetings analyzed by an older analyzer version, resuming from the last checkpoint"""
+    def report(checkpoint):
+        click.echo(f"\r{checkpoint.processed:,} re-analyzed, {checkpoint.failed:,} failed, "
+                   f"{checkpoint.fetched:,} pages fetched (last id {checkpoint.last_id})", nl=False)
+
+    stale = Meeting.query.filter(stale_analysis_filter()).count()
+    click.echo(f"Analyzer version {MeetingAnalyzer.VERSION}: {stale:,} stale meetings")
+    checkpoint = backfill_analyses(batch_size, workers, limit, refetch, restart, progress=report)
+    click.echo()
+    click.echo(f"Job {checkpoint.job}: {checkpoint.processed:,} re-analyzed, {checkpoint.failed:,} failed")
+
+app.cli.add_command(analyses_cli)
+
+scores_cli = AppGroup('scores', help='Recompute meeting scores from stored feature vectors.')
+
+@scores_cli.command('rescore')
+@click.option('--weights', type=click.Path(exists=True, dir_okay=False),
+              help='Weights file to score with (default: SCORING_WEIGHTS, else the built-in weights).')
+@click.option('--batch-size', default=100000, show_default=True, help='Vectors scored per batch.')
+@click.option('--dry-run', is_flag=True, help='Count the meetings whose scores would change without writing.')
+def scores_rescore_command(weights, batch_size, dry_run):
+    """Rescore every analyzed meeting in one batch pass, without fetching pages"""
+    try:
+        model = ScoringModel.from_file(weights) if weights else scoring_model
+    except (OSError, ValueError, KeyError) as e:
+        raise click.ClickException(f"Invalid weights file: {e}")
+
+    def report(progress):
+        click.echo(f"\r{progress['scored']:,} scored, {progress['changed']:,} changed", nl=False)
+
+    started = time.perf_counter()
+    result = rescore_meetings(model, batch_size, dry_run, progress=report)
+    click.echo()
+    verb = 'would change' if dry_run else 'changed'
+    click.echo(f"Scored {result['scored']:,} meetings in {time.perf_counter() - started:.1f}s, "
+               f"{result['changed']:,} {verb}")
+    if result['outdated'] or result['missing']:
+        click.echo(f"{result['outdated']:,} feature vectors predate version {FEATURE_VERSION} and "
+                   f"{result['missing']:,} meetings have none; "
+                   f"re-analyze them with `flask --app app analyses backfill`")
+    if weights and not dry_run and weights != app.config.get('SCORING_WEIGHTS'):
+        click.echo(f"Set SCORING_WEIGHTS={weights} so new analyses use the same weights")
+
+@scores_cli.command('weights')
+def scores_weights_command():
+    """Print the weights in effect, as a starting point for a SCORING_WEIGHTS file"""
+    click.echo(json.dumps(scoring_model.weights, indent=2))
+
+app.cli.add_command(scores_cli)
+
+duplicates_cli = AppGroup('duplicates', help='Inspect near-duplicate meeting pages.')
+
+@duplicates_cli.command('list')
+def duplicates_list_command():
+    """List stored meetings whose pages near-duplicate each other (read-only)"""
+    found = 0
+    for meeting_id, other_id, score in duplicate_pairs():
+        found += 1
+        click.echo(f"{meeting_id} ~ {other_id}: {score:.2f}")
+    aliases = MeetingAlias.query.count()
+    click.echo(f"{found:,} near-duplicate pair(s) at similarity >= {app.config['DUPLICATE_SIMILARITY']}; "
+               f"{aliases:,} URL(s) linked as aliases")
+
+app.cli.add_command(duplicates_cli)
+
+schema_cli = AppGroup('schema', help='Inspect and upgrade the database schema.')
+
+@schema_cli.command('upgrade')
+def schema_upgrade_command():
+    """Create missing tables and apply pending migrations"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')  # Show migration progress and reports
+    applied = upgrade_database()
+    print(f"Applied migrations: {', '.join(map(str, applied))}" if applied else "Schema is up to date")
+
+@schema_cli.command('status')
+def schema_status_command():
+    """List migrations that have not been applied yet"""
+    pending = migrations.pending(db.session)
+    for version, description in pending:
+        print(f"{version}: {description}")
+    print(f"{len(pending)} pending migration(s)")
+
+@schema_cli.command('storage')
+def schema_storage_command():
+    """Show the SQLite pragmas in effect for pooled connections"""
+    pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+    for name, value in sqlite_pragma_values(db.session.connection(), pragmas).items():
+        print(f"{name} = {value}")
+
+app.cli.add_command(schema_cli)
+
 # Initialize database
+def upgrade_database():
+    """Bring the database schema up to date, upgrading existing databases in place"""
+    fresh = not inspect(db.engine).has_table(Meeting.__tablename__)
+    db.create_all()
+    # A database created from the current models already has everything the migrations add
+    return migrations.upgrade(db.session, stamp_only=fresh)
+
 def create_tables():
     with app.app_context():
-        db.create_all()
+        upgrade_database()
 
         # Add sample data if no meetings exist
         if Meeting.query.count() == 0:
-        sample_meetings = [
-            {
-                'title': 'Austin City Council Meeting: Housing Crisis Response',
-                'location': 'Austin',
-                'date': datetime(2024, 8, 15),
-                'url': 'https://austin.gov/meetings/housing-crisis',
-                'priority': 'critical',
-                'priority_score': '95%',
-                'engagement': '85.3% high engagement',
-                'topics': ['Housing', 'Crisis Response', 'Public Policy']
-            },
-            {
-                'title': 'Seattle City Council Session: 2025 Budget Allocation',
-                'location': 'Seattle',
-                'date': datetime(2024, 7, 22),
-                'url': 'https://seattle.gov/meetings/budget-2025',
-                'priority': 'high',
-                'priority_score': '73%',
-                'engagement': '73.2% high engagement',
-                'topics': ['Budget', 'Finance', 'Public Services']
-            }
-        ]
-
-        for meeting_data in sample_meetings:
-            meeting = Meeting(**meeting_data)
-            meeting.set_topics(meeting_data['topics'])
-            db.session.add(meeting)
-
-        db.session.commit()
+            sample_meetings = [
+                {
+                    'title': 'Austin City Council Meeting: Housing Crisis Response',
+                    'location': 'Austin',
+                    'date': datetime(2024, 8, 15),
+                    'url': 'https://austin.gov/meetings/housing-crisis',
+                    'priority': 'critical',
+                    'priority_score': '95%',
+                    'engagement': '85.3% high engagement',
+                    'topics': ['Housing', 'Crisis Response', 'Public Policy']
+                },
+                {
+                    'title': 'Seattle City Council Session: 2025 Budget Allocation',
+                    'location': 'Seattle',
+                    'date': datetime(2024, 7, 22),
+                    'url': 'https://seattle.gov/meetings/budget-2025',
+                    'priority': 'high',
+                    'priority_score': '73%',
+                    'engagement': '73.2% high engagement',
+                    'topics': ['Budget', 'Finance', 'Public Services']
+                }
+            ]
+
+            for meeting_data in sample_meetings:
+                meeting = Meeting(**meeting_data)
+                meeting.set_topics(meeting_data['topics'])
+                db.session.add(meeting)
+
+            db.session.commit()
 
 if __name__ == '__main__':
     create_tables()
+    # The reloader runs this script twice; only its child serves requests
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_related_worker()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
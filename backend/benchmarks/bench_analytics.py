@@ -0,0 +1,105 @@
+"""
+Benchmark for the /analytics aggregation.
+
+Compares three ways of producing the dashboard numbers:
+  legacy  - hydrate every Meeting and count in Python (the original route)
+  sql     - GROUP BY/AVG over the meetings table (compute_rollups)
+  rollup  - read the incrementally maintained rollup table (build_analytics)
+
+Usage (from the backend folder):
+    python benchmarks/bench_analytics.py --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix='civicscoop-bench-'), 'bench.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DB_PATH}'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, Meeting, build_analytics, compute_rollups, rebuild_rollups  # noqa: E402
+
+LOCATIONS = ['Austin', 'Seattle', 'Miami', 'Denver', 'Portland', 'Richmond', 'Houston', 'Phoenix']
+PRIORITIES = ['critical', 'high', 'medium', 'low']
+TOPICS = ['Housing', 'Budget', 'Climate', 'Transit', 'Public Safety', 'Education']
+
+
+def populate(count, start_id):
+    """Insert `count` synthetic meetings using batched Core inserts, then refresh the rollups"""
+    base_date = datetime(2020, 1, 1)
+    batch = []
+    for i in range(start_id, start_id + count):
+        batch.append({
+            'id': i,
+            'title': f'City Council Meeting {i}',
+            'location': random.choice(LOCATIONS),
+            'date': base_date + timedelta(days=i % 1800),
+            'url': f'https://example.gov/meetings/{i}',
+            'priority': random.choice(PRIORITIES),
+            'ai_accuracy': random.uniform(80, 99),
+            'status': 'analyzed',
+            'created_at': datetime.utcnow(),
+            'topics': '["%s", "%s"]' % tuple(random.sample(TOPICS, 2))
+        })
+        if len(batch) == 50000:
+            db.session.execute(Meeting.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Meeting.__table__.insert(), batch)
+    db.session.commit()
+    # Core inserts bypass the ORM events that maintain the rollups
+    rebuild_rollups()
+
+
+def legacy_analytics():
+    """The original implementation: load every row, count in Python"""
+    meetings = Meeting.query.all()
+    total = len(meetings)
+    avg_accuracy = sum(m.ai_accuracy for m in meetings) / total if meetings else 0
+    priority_counts = {}
+    location_counts = {}
+    for meeting in meetings:
+        priority_counts[meeting.priority] = priority_counts.get(meeting.priority, 0) + 1
+        location_counts[meeting.location] = location_counts.get(meeting.location, 0) + 1
+    db.session.expunge_all()
+    return total, avg_accuracy, priority_counts, location_counts
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--legacy-max', type=int, default=100000,
+                        help='skip the ORM implementation above this many rows')
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        loaded = 0
+        print(f"{'meetings':>10} {'legacy (s)':>12} {'sql (s)':>10} {'rollup (s)':>12}")
+        for size in sorted(args.sizes):
+            populate(size - loaded, loaded + 1)
+            loaded = size
+            legacy = timed(legacy_analytics, repeat=1) if size <= args.legacy_max else None
+            sql = timed(compute_rollups)
+            rollup = timed(build_analytics)
+            legacy_text = f'{legacy:12.3f}' if legacy is not None else f"{'skipped':>12}"
+            print(f'{size:>10} {legacy_text} {sql:10.3f} {rollup:12.4f}')
+
+    os.remove(DB_PATH)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Storage size versus read latency of the meeting_details blob encodings.
+
+Generates analysis payloads shaped like the analyzer's (agenda items,
+participants, quotes, metadata), stores them in one SQLite table per encoding
+and reports, for each: bytes stored, pages read, and the latency of fetching
+random blobs by id and decoding them (decompression + JSON), with a small
+page cache so the table does not sit in memory.
+
+Encodings: plain JSON, zlib, and, when zstandard is installed, zstd with and
+without a dictionary trained on a sample of the payloads.
+
+Usage (from the backend folder):
+    python benchmarks/bench_blobs.py --blobs 20000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import blobs  # noqa: E402
+from utils.blobs import BlobCodec, load_blob, train_dictionary  # noqa: E402
+from utils.serialization import dumps  # noqa: E402
+
+TOPICS = ['Housing', 'Budget', 'Climate', 'Transit', 'Public Safety', 'Education', 'Development']
+NAMES = ['Mayor Adler', 'Council Member Ellis', 'Council Member Pool', 'City Manager Cronk', 'Clerk Garza']
+PHRASES = ['affordable housing', 'budget allocation', 'public comment', 'zoning variance', 'stormwater bond',
+           'second reading', 'consent agenda', 'transit corridor', 'police oversight', 'library hours']
+
+
+class PlainCodec:
+    """Stores JSON uncompressed, the layout before compression"""
+
+    algorithm = 'plain'
+
+    def compress(self, data):
+        return data
+
+    def decompress(self, value):
+        return value
+
+
+def payload(rng, i):
+    return {
+        'title': f'City Council Meeting {i}',
+        'summary': f"Meeting focused on {', '.join(rng.sample(TOPICS, 2))} with {rng.choice(['high', 'medium'])} priority level.",
+        'agenda_items': [
+            {'number': str(n), 'description': f'{rng.choice(PHRASES).capitalize()} discussion and {rng.choice(PHRASES)}',
+             'status': rng.choice(['pending', 'approved', 'tabled'])}
+            for n in range(rng.randint(5, 20))
+        ],
+        'participants': [{'name': name, 'role': 'council'} for name in rng.sample(NAMES, 3)],
+        'key_quotes': [
+            {'text': f"We need to act on {rng.choice(PHRASES)} now, not after another {rng.choice(PHRASES)}.",
+             'speaker': rng.choice(NAMES), 'confidence': round(rng.uniform(70, 95), 1)}
+            for _ in range(3)
+        ],
+        'metadata': {'source': 'agenda', 'language': 'en', 'word_count': rng.randint(2000, 20000)}
+    }
+
+
+def codecs(samples):
+    available = [('plain', PlainCodec()), ('zlib-6', BlobCodec(level=6, algorithm='zlib'))]
+    if blobs.zstandard is not None:
+        available.append(('zstd-3', BlobCodec(level=3)))
+        with_dictionary = BlobCodec(level=3)
+        with_dictionary.add_dictionary(train_dictionary(samples))
+        available.append(('zstd-3+dict', with_dictionary))
+    else:
+        print("zstandard is not installed: measuring plain JSON and zlib only")
+    return available
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--blobs', type=int, default=20000)
+    parser.add_argument('--reads', type=int, default=2000)
+    parser.add_argument('--cache-pages', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    payloads = [dumps(payload(rng, i)) for i in range(args.blobs)]
+    raw_bytes = sum(len(data) for data in payloads)
+    print(f"{args.blobs:,} payloads, {raw_bytes:,} bytes of JSON ({raw_bytes // args.blobs:,} per blob)")
+
+    path = os.path.join(tempfile.mkdtemp(prefix='civicscoop-bench-'), 'blobs.db')
+    encodings = codecs(payloads[:2000])
+    print(f"{'encoding':<12} {'stored bytes':>14} {'ratio':>7} {'pages':>8} {'encode µs':>10} {'read+decode µs':>15}")
+    for name, codec in encodings:
+        table = 'blobs_' + name.replace('-', '_').replace('+', '_')
+        connection = sqlite3.connect(path)
+        connection.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, analysis BLOB)")
+        start = time.perf_counter()
+        encoded = [codec.compress(data) for data in payloads]
+        encode_us = (time.perf_counter() - start) / len(payloads) * 1e6
+        connection.executemany(f"INSERT INTO {table} VALUES (?, ?)", enumerate(encoded, 1))
+        connection.commit()
+        stored = sum(len(value) for value in encoded)
+        pages = connection.execute(f"SELECT count(*) FROM dbstat WHERE name = '{table}'").fetchone()[0] \
+            if _has_dbstat(connection) else None
+        connection.close()
+
+        # Fresh connection with a small cache, so reads go through the OS like a cold detail view
+        connection = sqlite3.connect(path)
+        connection.execute(f"PRAGMA cache_size = {args.cache_pages}")
+        ids = [rng.randint(1, args.blobs) for _ in range(args.reads)]
+        start = time.perf_counter()
+        for blob_id in ids:
+            value = connection.execute(f"SELECT analysis FROM {table} WHERE id = ?", (blob_id,)).fetchone()[0]
+            load_blob(value, {}, codec=codec)
+        read_us = (time.perf_counter() - start) / len(ids) * 1e6
+        connection.close()
+
+        print(f"{name:<12} {stored:>14,} {raw_bytes / stored:>6.2f}x {pages if pages is not None else '-':>8} "
+              f"{encode_us:>10.1f} {read_us:>15.1f}")
+
+
+def _has_dbstat(connection):
+    try:
+        connection.execute("SELECT 1 FROM dbstat LIMIT 1")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+if __name__ == '__main__':
+    main()
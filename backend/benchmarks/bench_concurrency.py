@@ -0,0 +1,137 @@
+"""
+Concurrent read/write benchmark for the SQLite storage profiles.
+
+Mirrors a multi-worker deployment (e.g. gunicorn -w N): one writer process
+keeps committing batches of new meetings (each commit also updates the rollup
+and search tables) while reader processes poll /api/meeting/<id>. With the
+default rollback journal readers are locked out while a commit is written;
+under the production profile (WAL + pragmas) they read the last committed
+snapshot instead. Whether that shows up as lower read latency depends on the
+host: on a single CPU the processes time-slice and both profiles measure the
+same (see "Storage Profile" in the README), so run it on a multi-core host
+before drawing conclusions.
+
+Usage (from the backend folder):
+    python benchmarks/bench_concurrency.py --seconds 10 --readers 4
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_app():
+    sys.path.insert(0, BACKEND_DIR)
+    import app as app_module
+    return app_module
+
+
+def seed_database(count):
+    app_module = load_app()
+    with app_module.app.app_context():
+        app_module.db.create_all()
+        app_module.db.session.execute(app_module.Meeting.__table__.insert(), [
+            {'title': f'Seed meeting {i}', 'location': 'Austin', 'date': datetime(2024, 1, 1),
+             'url': f'https://example.gov/seed/{i}', 'topics': '["Housing"]',
+             'created_at': datetime.utcnow()}
+            for i in range(count)
+        ])
+        app_module.db.session.commit()
+
+
+def writer(seconds, start, batch, results):
+    app_module = load_app()
+    Meeting, db = app_module.Meeting, app_module.db
+    commits = 0
+    with app_module.app.app_context():
+        start.wait()
+        deadline = time.time() + seconds
+        while time.time() < deadline:
+            for i in range(batch):
+                meeting = Meeting(title=f'Live meeting {commits}-{i}', location='Seattle',
+                                  date=datetime.utcnow(), url=f'https://example.gov/live/{commits}/{i}',
+                                  status='analyzed')
+                meeting.set_topics(['Budget', 'Transit'])
+                db.session.add(meeting)
+            db.session.commit()
+            commits += 1
+    results.put(('commits', commits))
+
+
+def reader(seconds, start, worker, seed, results):
+    client = load_app().app.test_client()
+    latencies, errors = [], 0
+    meeting_id = worker + 1
+    start.wait()
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        start = time.perf_counter()
+        response = client.get(f'/api/meeting/{meeting_id}')
+        if response.status_code == 200:
+            latencies.append(time.perf_counter() - start)
+        else:
+            errors += 1
+        meeting_id = (meeting_id * 7919) % seed + 1
+    results.put(('reads', latencies, errors))
+
+
+def run_profile(profile, args):
+    workdir = tempfile.mkdtemp(prefix='civicscoop-bench-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.pop('FLASK_CONFIG', None)
+    if profile == 'production':
+        os.environ['FLASK_CONFIG'] = 'production'
+
+    context = multiprocessing.get_context('spawn')
+    seeding = context.Process(target=seed_database, args=(args.seed,))
+    seeding.start()
+    seeding.join()
+
+    results = context.Queue()
+    start = context.Barrier(args.readers + 1)  # Start the clock once every worker has imported the app
+    processes = [context.Process(target=writer, args=(args.seconds, start, args.batch, results))]
+    processes += [context.Process(target=reader, args=(args.seconds, start, n, args.seed, results))
+                  for n in range(args.readers)]
+    for process in processes:
+        process.start()
+
+    latencies, errors, commits = [], 0, 0
+    for _ in processes:
+        result = results.get()
+        if result[0] == 'commits':
+            commits = result[1]
+        else:
+            latencies.extend(result[1])
+            errors += result[2]
+    for process in processes:
+        process.join()
+
+    if not latencies:
+        print(f"{profile:<12} {'no successful reads':>10} {errors:>7} {commits:>8}")
+        return
+    latencies.sort()
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+    print(f"{profile:<12} {len(latencies) / args.seconds:>10.0f} {pick(0.5):>9.2f} {pick(0.99):>9.2f} "
+          f"{latencies[-1] * 1000:>9.1f} {errors:>7} {commits:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--batch', type=int, default=200, help='meetings per write transaction')
+    parser.add_argument('--seed', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'profile':<12} {'reads/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} {'errors':>7} {'commits':>8}")
+    for profile in ('default', 'production'):
+        run_profile(profile, args)
+
+
+if __name__ == '__main__':
+    main()
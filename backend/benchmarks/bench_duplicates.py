@@ -0,0 +1,85 @@
+"""
+Near-duplicate lookups through the LSH bucket index versus a full scan.
+
+Stores random MinHash signatures (and their LSH buckets) for synthetic
+meetings, then times `find_duplicate` for signatures that closely match a
+stored one and for unrelated ones, against comparing the query with every
+stored signature.
+
+Usage (from the backend folder):
+    python benchmarks/bench_duplicates.py --meetings 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BENCH_DIR = tempfile.mkdtemp(prefix='civicscoop-bench-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (MeetingLSHBucket, MeetingSignature, app, db, find_duplicate, import_meetings,  # noqa: E402
+                 upgrade_database)
+from utils.bulk_import import batched, bulk_insert  # noqa: E402
+from utils.minhash import NUM_PERM, band_keys, decode_signature, encode_signature, similarity  # noqa: E402
+
+
+def generate(count):
+    for i in range(count):
+        yield json.dumps({'title': f'Meeting {i}', 'location': 'Austin', 'date': '2024-01-01',
+                          'url': f'https://example.gov/meetings/{i}'})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    with app.app_context():
+        upgrade_database()
+        import_meetings(generate(args.meetings), batch_size=20000)
+        connection = db.session.connection()
+        signatures = rng.integers(0, 1 << 32, size=(args.meetings, NUM_PERM), dtype=np.uint32)
+        for ids in batched(range(1, args.meetings + 1), 20000):
+            bulk_insert(connection, MeetingSignature.__table__, ('meeting_id', 'signature'), [
+                {'meeting_id': meeting_id, 'signature': encode_signature(signatures[meeting_id - 1])}
+                for meeting_id in ids
+            ])
+            bulk_insert(connection, MeetingLSHBucket.__table__, ('band', 'bucket', 'meeting_id'), [
+                {'band': band, 'bucket': bucket, 'meeting_id': meeting_id}
+                for meeting_id in ids for band, bucket in band_keys(signatures[meeting_id - 1])
+            ])
+        db.session.commit()
+        print(f"Stored {args.meetings:,} signatures")
+
+        # Near duplicates: a stored signature with ~8% of its values changed
+        targets = rng.integers(0, args.meetings, size=args.queries)
+        near = signatures[targets].copy()
+        mask = rng.random(near.shape) < 0.08
+        near[mask] = rng.integers(0, 1 << 32, size=int(mask.sum()), dtype=np.uint32)
+        unrelated = rng.integers(0, 1 << 32, size=(args.queries, NUM_PERM), dtype=np.uint32)
+
+        for label, queries in (('near duplicate', near), ('unrelated', unrelated)):
+            start = time.perf_counter()
+            found = sum(1 for query in queries if find_duplicate(query)[0] is not None)
+            elapsed = (time.perf_counter() - start) / len(queries) * 1000
+            print(f"LSH lookup, {label:<15} {elapsed:8.2f} ms/query ({found}/{len(queries)} matched)")
+
+        start = time.perf_counter()
+        sample = near[:10]
+        for query in sample:
+            best = 0.0
+            for row in db.session.execute(MeetingSignature.__table__.select()):
+                best = max(best, similarity(query, decode_signature(row.signature)))
+        elapsed = (time.perf_counter() - start) / len(sample) * 1000
+        print(f"Full scan, near duplicate      {elapsed:8.2f} ms/query")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Throughput of the bulk NDJSON meeting import.
+
+Generates an NDJSON file of synthetic meetings, imports it into an empty
+database (insert path), then imports it again (update path) and checks that
+the derived tables match a full rebuild.
+
+Usage (from the backend folder):
+    FLASK_CONFIG=production python benchmarks/bench_import.py --rows 200000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from itertools import islice
+
+BENCH_DIR = tempfile.mkdtemp(prefix='civicscoop-bench-')
+DB_PATH = os.path.join(BENCH_DIR, 'bench.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DB_PATH}'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, check_rollups, import_meetings, upgrade_database, Meeting  # noqa: E402
+from utils.bulk_import import iter_ndjson_records  # noqa: E402
+
+LOCATIONS = ['Austin', 'Seattle', 'Miami', 'Denver', 'Portland', 'Richmond', 'Houston', 'Phoenix']
+TOPICS = ['Housing', 'Budget', 'Climate', 'Transit', 'Public Safety', 'Education']
+PRIORITIES = ['low', 'medium', 'high', 'critical']
+
+
+def write_ndjson(path, rows):
+    rng = random.Random(42)
+    with open(path, 'w') as f:
+        for i in range(rows):
+            f.write(json.dumps({
+                'title': f'City Council Meeting {i}',
+                'location': rng.choice(LOCATIONS),
+                'date': f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+                'url': f'https://example.gov/meetings/{i}',
+                'priority': rng.choice(PRIORITIES),
+                'priority_score': f'{rng.randint(20, 95)}%',
+                'engagement': f'{rng.randint(10, 90)}% high engagement',
+                'ai_accuracy': 95.5,
+                'status': 'analyzed',
+                'topics': rng.sample(TOPICS, 2),
+                'quotes': [{'text': 'We need to act on housing affordability now', 'speaker': 'Council Member'}],
+                'analysis': {'summary': 'Meeting focused on Housing and Budget.'}
+            }) + '\n')
+
+
+def run(path, batch_size):
+    with open(path, 'rb') as f:
+        stats = import_meetings(f, batch_size=batch_size)
+    return stats
+
+
+def run_orm(path, rows):
+    """One ORM add/commit per meeting, as analyze_meeting does"""
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        for _, record, _ in iter_ndjson_records(islice(f, rows)):
+            meeting = Meeting(
+                title=record['title'], location=record['location'], date=datetime.fromisoformat(record['date']),
+                url=record['url'].replace('/meetings/', '/orm/'), priority=record['priority'],
+                priority_score=record['priority_score'], engagement=record['engagement'],
+                ai_accuracy=record['ai_accuracy'], status=record['status']
+            )
+            meeting.set_topics(record['topics'])
+            meeting.set_quotes(record['quotes'])
+            meeting.set_analysis(record['analysis'])
+            db.session.add(meeting)
+            db.session.commit()
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--orm-rows', type=int, default=2000, help='rows for the per-row ORM baseline')
+    args = parser.parse_args()
+
+    path = os.path.join(BENCH_DIR, 'meetings.ndjson')
+    write_ndjson(path, args.rows)
+    print(f"{args.rows:,} rows, batch size {args.batch_size:,}, "
+          f"profile {os.environ.get('FLASK_CONFIG', 'default')}")
+
+    with app.app_context():
+        upgrade_database()
+        for label in ('insert', 'update'):
+            stats = run(path, args.batch_size)
+            print(f"{label:>7}: {stats.elapsed:7.2f}s  {stats.rate:10,.0f} rows/s  "
+                  f"(inserted {stats.inserted:,}, updated {stats.updated:,}, rejected {stats.rejected:,})")
+        print(f"    orm: {run_orm(path, args.orm_rows):10,.0f} rows/s  (add/commit per row, {args.orm_rows:,} rows)")
+        mismatches = check_rollups()
+        print(f"rollups consistent: {not mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Listing scans with meeting blobs inline versus in the meeting_details side table.
+
+Loads synthetic meetings with realistic quotes and analysis through the bulk
+importer, copies them into a table with the blobs inline (the layout before
+the split), then times the same listing-column scans against both with a
+small page cache, the way a busy server sees them.
+
+Usage (from the backend folder):
+    python benchmarks/bench_listing.py --meetings 100000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCH_DIR = tempfile.mkdtemp(prefix='civicscoop-bench-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, import_meetings, upgrade_database  # noqa: E402
+
+LOCATIONS = ['Austin', 'Seattle', 'Miami', 'Denver', 'Portland', 'Richmond', 'Houston', 'Phoenix']
+TOPICS = ['Housing', 'Budget', 'Climate', 'Transit', 'Public Safety', 'Education', 'Development']
+LISTING = ('id, title, location, date, priority, priority_score, engagement, topics, status, url, '
+           'priority_score_value, engagement_value, high_segment_seconds')
+
+QUERIES = {
+    'full listing scan': f"SELECT {LISTING} FROM {{table}}",
+    'location filter, newest 50': f"SELECT {LISTING} FROM {{table}} WHERE location = 'Austin' ORDER BY created_at DESC LIMIT 50",
+    'count by priority': "SELECT priority, count(*) FROM {table} GROUP BY priority",
+}
+
+
+def generate(count):
+    rng = random.Random(7)
+    start = datetime(2020, 1, 1)
+    for i in range(count):
+        yield json.dumps({
+            'title': f'City Council Meeting {i}',
+            'location': rng.choice(LOCATIONS),
+            'date': (start + timedelta(days=rng.randrange(1800))).isoformat(),
+            'url': f'https://example.gov/meetings/{i}',
+            'topics': rng.sample(TOPICS, 2),
+            'quotes': [{'text': 'We need to act on housing affordability now. ' * 4, 'speaker': 'Council Member',
+                        'confidence': 85.0} for _ in range(3)],
+            'analysis': {'summary': 'Meeting focused on Housing and Budget.', 'agenda_items': [
+                {'number': str(n), 'description': f'Agenda item {n} discussion', 'status': 'pending'} for n in range(12)
+            ]}
+        })
+
+
+def table_pages(connection, table):
+    try:
+        return connection.exec_driver_sql("SELECT count(*) FROM dbstat WHERE name = ?", (table,)).scalar()
+    except Exception:  # dbstat is a compile-time option
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--cache-pages', type=int, default=2000)
+    args = parser.parse_args()
+
+    with app.app_context():
+        upgrade_database()
+        stats = import_meetings(generate(args.meetings), batch_size=10000)
+        print(f"Loaded {stats.inserted:,} meetings in {stats.elapsed:.1f}s")
+
+        connection = db.session.connection()
+        connection.exec_driver_sql(
+            "CREATE TABLE meeting_inline AS SELECT meeting.*, meeting_details.quotes, meeting_details.analysis "
+            "FROM meeting JOIN meeting_details ON meeting_details.meeting_id = meeting.id"
+        )
+        connection.exec_driver_sql("CREATE INDEX ix_inline_location_created_at ON meeting_inline (location, created_at)")
+        db.session.commit()
+        connection = db.session.connection()
+        connection.exec_driver_sql(f"PRAGMA cache_size = {args.cache_pages}")
+
+        for table in ('meeting_inline', 'meeting'):
+            pages = table_pages(connection, table)
+            print(f"{table}: {pages:,} pages" if pages is not None else f"{table}: (dbstat unavailable)")
+
+        for name, sql in QUERIES.items():
+            for table in ('meeting_inline', 'meeting'):
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    connection.exec_driver_sql(sql.format(table=table)).fetchall()
+                    timings.append((time.perf_counter() - start) * 1000)
+                print(f"{name:<30} {table:<15} {min(timings):9.1f} ms (best of {args.repeat})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Latency of the predefined /api/analytics/query metrics over a large history.
+
+Loads synthetic meetings spread over ten years through the bulk importer,
+builds the Parquet snapshot, then times every metric through the test client
+(cache bypassed) next to the equivalent row-by-row pass over the ORM.
+
+Usage (from the backend folder):
+    python benchmarks/bench_olap.py --meetings 500000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCH_DIR = tempfile.mkdtemp(prefix='civicscoop-bench-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+os.environ['ANALYTICS_SNAPSHOT_DIR'] = os.path.join(BENCH_DIR, 'snapshot')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, build_analytics_snapshot, import_meetings, response_cache, upgrade_database, Meeting  # noqa: E402
+from utils.parsing import parse_percent  # noqa: E402
+
+LOCATIONS = ['Austin', 'Seattle', 'Miami', 'Denver', 'Portland', 'Richmond', 'Houston', 'Phoenix']
+TOPICS = ['Housing', 'Budget', 'Climate', 'Transit', 'Public Safety', 'Education', 'Development']
+PRIORITIES = ['low', 'medium', 'high', 'critical']
+
+QUERIES = [
+    'metric=kpis',
+    'metric=trend&granularity=month',
+    'metric=trend&granularity=day&from=2023-01-01&to=2024-01-01',
+    'metric=topic_distribution',
+    'metric=heatmap',
+    'metric=location_performance',
+    'metric=trend&granularity=week&topic=Housing&location=Austin',
+]
+
+
+def generate(count):
+    rng = random.Random(7)
+    start = datetime(2015, 1, 1)
+    for i in range(count):
+        date = start + timedelta(minutes=rng.randrange(10 * 365 * 24 * 60))
+        yield json.dumps({
+            'title': f'City Council Meeting {i}',
+            'location': rng.choice(LOCATIONS),
+            'date': date.isoformat(),
+            'created_at': (date + timedelta(minutes=rng.randrange(3 * 24 * 60))).isoformat(),  # Added after the meeting
+            'url': f'https://example.gov/meetings/{i}',
+            'priority': rng.choice(PRIORITIES),
+            'priority_score': f'{rng.randint(20, 95)}%',
+            'engagement': f'{rng.uniform(5, 95):.1f}% high engagement',
+            'ai_accuracy': round(rng.uniform(90, 99), 1),
+            'topics': rng.sample(TOPICS, 2)
+        })
+
+
+def orm_location_performance():
+    """The dashboard's per-location table computed by walking every meeting"""
+    totals = {}
+    for meeting in Meeting.query.yield_per(1000):
+        entry = totals.setdefault(meeting.location, [0, 0.0])
+        entry[0] += 1
+        entry[1] += parse_percent(meeting.engagement) or 0.0
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=500000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with app.app_context():
+        upgrade_database()
+        stats = import_meetings(generate(args.meetings), batch_size=10000)
+        print(f"Loaded {stats.inserted:,} meetings in {stats.elapsed:.1f}s")
+        start = time.perf_counter()
+        build_analytics_snapshot()
+        print(f"Snapshot built in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        orm_location_performance()
+        print(f"{'ORM location_performance':<60} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    client = app.test_client()
+    for query in QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            response_cache.clear()
+            start = time.perf_counter()
+            response = client.get(f'/api/analytics/query?{query}')
+            timings.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.data
+        print(f"{query:<60} {min(timings):9.1f} ms (best of {args.repeat}), {len(response.get_json()['rows'])} rows")
+
+
+if __name__ == '__main__':
+    main()
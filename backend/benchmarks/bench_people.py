@@ -0,0 +1,94 @@
+"""
+Meetings per person through the person_mention index versus the stored analyses.
+
+Imports synthetic meetings whose analyses name a few of a pool of council
+members, written in varying forms ("Jane Smith", "J. Smith", "Smith"), so
+the import resolves every name to a person (reporting its throughput).
+Then times a page of /api/people/<id>/meetings for random people against
+finding the same meetings by decoding the participants of every stored
+analysis.
+
+Usage (from the backend folder):
+    python benchmarks/bench_people.py --meetings 100000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = tempfile.mkdtemp(prefix='civicscoop-bench-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import MeetingDetails, Person, app, db, import_meetings, upgrade_database  # noqa: E402
+from utils.blobs import load_blob  # noqa: E402
+from utils.people import name_key  # noqa: E402
+
+GIVEN = ['Jane', 'Tom', 'Ann', 'Luis', 'Maria', 'Kevin', 'Priya', 'Omar', 'Grace', 'Daniel', 'Rosa', 'Wei']
+SURNAMES = ['Smith', 'Lee', 'Wu', 'Diaz', 'Patel', 'Okafor', 'Nguyen', 'Garcia', 'Kowalski', 'Haddad',
+            'Johansson', 'Moreno', 'Fischer', 'Tanaka', 'Brennan', 'Adeyemi', 'Castillo', 'Novak', 'Rossi', 'Singh']
+LOCATIONS = ['Austin', 'Seattle', 'Miami', 'Denver', 'Portland', 'Richmond', 'Houston', 'Phoenix']
+
+
+def generate(count, people):
+    rng = random.Random(7)
+    for i in range(count):
+        participants = []
+        for given, surname in rng.sample(people, 6):
+            form = rng.random()
+            name = f'{given} {surname}' if form < 0.7 else f'{given[0]}. {surname}'
+            participants.append({'name': name, 'role': 'Council Member', 'quoted': form < 0.1})
+        yield json.dumps({
+            'title': f'Council meeting {i}',
+            'location': rng.choice(LOCATIONS),
+            'date': f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'url': f'https://example.gov/meetings/{i}',
+            'analysis': {'participants': participants},
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=100000)
+    parser.add_argument('--people', type=int, default=200, help='Distinct people in the pool.')
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    pool = sorted({(rng.choice(GIVEN), rng.choice(SURNAMES)) for _ in range(args.people * 3)})[:args.people]
+
+    with app.app_context():
+        upgrade_database()
+        stats = import_meetings(generate(args.meetings, pool), batch_size=10000)
+        print(f"Imported {stats.inserted:,} meetings, resolving names to {Person.query.count():,} people, "
+              f"in {stats.elapsed:.1f}s ({stats.inserted / stats.elapsed:,.0f}/s)")
+
+        client = app.test_client()
+        people = [person.id for person in Person.query.all()]
+        timings = []
+        for _ in range(args.queries):
+            start = time.perf_counter()
+            client.get(f'/api/people/{rng.choice(people)}/meetings?per_page=50')
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        print(f"/api/people/<id>/meetings, 50 per page: p50 {statistics.median(timings):.2f} ms, "
+              f"p95 {timings[int(len(timings) * 0.95)]:.2f} ms")
+
+        person = db.session.get(Person, people[0])
+        start = time.perf_counter()
+        matches = [
+            row.meeting_id for row in db.session.execute(
+                MeetingDetails.__table__.select().with_only_columns(MeetingDetails.meeting_id, MeetingDetails.analysis))
+            if any(name_key(participant['name']) == person.name_key
+                   for participant in load_blob(row.analysis, {}).get('participants', []))
+        ]
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Scan of every analysis for one exact name: {elapsed:.0f} ms ({len(matches):,} meetings)")
+
+
+if __name__ == '__main__':
+    main()
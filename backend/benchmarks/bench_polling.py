@@ -0,0 +1,87 @@
+"""
+Poll-heavy load test for conditional GETs on the meeting read endpoints.
+
+Simulates dashboards that poll /api/meetings and /api/meeting/<id> while the
+data rarely changes, once without validators and once replaying the ETag
+from the previous response in If-None-Match.
+
+Usage (from the backend folder):
+    python benchmarks/bench_polling.py --meetings 2000 --polls 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix='civicscoop-bench-'), 'bench.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DB_PATH}'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, Meeting, MeetingDetails  # noqa: E402
+from utils.blobs import dump_blob  # noqa: E402
+
+
+def populate(count):
+    quotes = dump_blob([{'text': 'We need to act on housing affordability now, ' * 3,
+                          'speaker': 'Council Member', 'confidence': 85.0}] * 3)
+    analysis = dump_blob({'summary': 'Meeting focused on Housing.', 'agenda_items': [
+        {'number': str(n), 'description': f'Agenda item {n} discussion', 'status': 'pending'} for n in range(10)
+    ]})
+    db.session.execute(Meeting.__table__.insert(), [
+        {'id': i, 'title': f'City Council Meeting {i}', 'location': 'Austin', 'date': datetime(2024, 1, 1),
+         'url': f'https://example.gov/meetings/{i}', 'topics': '["Housing", "Budget"]',
+         'created_at': datetime.utcnow(), 'updated_at': datetime.utcnow()}
+        for i in range(1, count + 1)
+    ])
+    db.session.execute(MeetingDetails.__table__.insert(), [
+        {'meeting_id': i, 'quotes': quotes, 'analysis': analysis} for i in range(1, count + 1)
+    ])
+    db.session.commit()
+
+
+def poll(client, path, polls, conditional, write_every):
+    etag = None
+    transferred = 0
+    not_modified = 0
+    cpu_start = time.process_time()
+    for n in range(polls):
+        if write_every and n and n % write_every == 0:
+            with app.app_context():
+                meeting = db.session.get(Meeting, 1)
+                meeting.title = f'City Council Meeting 1 (rev {n})'
+                db.session.commit()
+        headers = {'If-None-Match': etag} if conditional and etag else {}
+        response = client.get(path, headers=headers)
+        transferred += len(response.data)
+        if response.status_code == 304:
+            not_modified += 1
+        etag = response.headers.get('ETag', etag)
+    return transferred, not_modified, time.process_time() - cpu_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=2000)
+    parser.add_argument('--polls', type=int, default=500)
+    parser.add_argument('--write-every', type=int, default=100, help='change one meeting every N polls')
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        populate(args.meetings)
+
+    client = app.test_client()
+    print(f"{'endpoint':<18} {'mode':<12} {'KB sent':>10} {'304s':>6} {'CPU (s)':>8}")
+    for path in ('/api/meetings', '/api/meeting/1'):
+        for conditional in (False, True):
+            sent, hits, cpu = poll(client, path, args.polls, conditional, args.write_every)
+            mode = 'conditional' if conditional else 'plain'
+            print(f"{path:<18} {mode:<12} {sent / 1024:>10.0f} {hits:>6} {cpu:>8.2f}")
+
+    os.remove(DB_PATH)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Top-k quote extraction over long transcripts.
+
+Builds a synthetic transcript of the given size, with qualifying sentences
+spread through it, and times `MeetingAnalyzer._extract_quotes` (one pass,
+bounded heap) against splitting the content into a sentence list and
+sorting every scored candidate. Peak memory of each is measured with
+tracemalloc, and both must agree on the quotes.
+
+Usage (from the backend folder):
+    python benchmarks/bench_quotes.py --megabytes 20
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ai_analyzer import QUOTE_INDICATORS, MeetingAnalyzer  # noqa: E402
+
+SENTENCES = [
+    'The clerk read the consent agenda into the record',
+    'Council Member Lee said the corridor plan will need significant new funding, starting this year',
+    'Public comment continued with residents from the east side',
+    'We must act on the housing crisis, it is important for every family in this city',
+    'The motion to approve the minutes carried without objection',
+    'Staff should return with a revised budget, including the audit findings',
+    'A short recess was called',
+]
+
+
+def transcript(megabytes):
+    rng = random.Random(7)
+    parts, size = [], 0
+    while size < megabytes * 1024 * 1024:
+        sentence = rng.choice(SENTENCES) + f' {rng.randint(0, 10 ** 6)}. '
+        parts.append(sentence)
+        size += len(sentence)
+    return ''.join(parts)
+
+
+def split_and_sort(analyzer, content, limit=3):
+    """Reference: every sentence in a list, every candidate scored and sorted"""
+    candidates = []
+    for sentence in re.split(r'[.!?]+', content):
+        sentence = sentence.strip()
+        if 30 <= len(sentence) <= 200 and QUOTE_INDICATORS.search(sentence):
+            candidates.append({'text': sentence, 'confidence': analyzer._calculate_quote_confidence(sentence)})
+    return sorted(candidates, key=lambda quote: quote['confidence'], reverse=True)[:limit]
+
+
+def measure(function, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--megabytes', type=float, default=20)
+    args = parser.parse_args()
+
+    content = transcript(args.megabytes)
+    analyzer = MeetingAnalyzer()
+    print(f"Transcript: {len(content) / 1024 / 1024:.1f} MB")
+
+    heap, heap_time, heap_peak = measure(analyzer._extract_quotes, content)
+    reference, sort_time, sort_peak = measure(split_and_sort, analyzer, content)
+    assert [quote['text'] for quote in heap] == [quote['text'] for quote in reference]
+    for label, elapsed, peak in (('bounded heap', heap_time, heap_peak), ('split and sort', sort_time, sort_peak)):
+        print(f"{label:<15} {elapsed:7.2f}s  {len(content) / 1024 / 1024 / elapsed:6.1f} MB/s  "
+              f"peak {peak / 1024 / 1024:8.2f} MB")
+
+
+if __name__ == '__main__':
+    main()
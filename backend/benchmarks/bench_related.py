@@ -0,0 +1,97 @@
+"""
+Related-meeting lookups over the TF-IDF inverted index.
+
+Loads synthetic meetings whose titles and summaries mix a few topic
+vocabularies with a long Zipf tail of rarer words, indexes them with the
+related index sync (reporting its throughput), then reports the latency
+percentiles of `related_meetings` for random meetings.
+
+Usage (from the backend folder):
+    python benchmarks/bench_related.py --meetings 200000
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = tempfile.mkdtemp(prefix='civicscoop-bench-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, drain_related_queue, import_meetings, related_meetings, upgrade_database  # noqa: E402
+
+LOCATIONS = ['Austin', 'Seattle', 'Miami', 'Denver', 'Portland', 'Richmond', 'Houston', 'Phoenix']
+TOPICS = {
+    'Housing': 'housing affordable rent tenants eviction zoning density shelter homeless',
+    'Budget': 'budget funding allocation revenue deficit audit bonds taxes spending',
+    'Transit': 'transit rail buses ridership corridor fares parking bikes traffic',
+    'Climate': 'climate emissions carbon solar flooding stormwater trees heat',
+    'Education': 'schools teachers students tuition libraries literacy enrollment',
+    'Public Safety': 'police firefighters response oversight violence patrols',
+}
+
+
+def _word(number):
+    """Letters-only rare word (the tokenizer drops digits)"""
+    letters = ''
+    while True:
+        number, digit = divmod(number, 26)
+        letters += chr(ord('a') + digit)
+        if not number:
+            return 'zq' + letters
+
+
+def generate(count):
+    rng = random.Random(7)
+    tail = [_word(i) for i in range(50000)]
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(tail))))
+    for i in range(count):
+        topics = rng.sample(sorted(TOPICS), 2)
+        words = [rng.choice(TOPICS[topic].split()) for topic in topics for _ in range(8)]
+        words += rng.choices(tail, cum_weights=cum_weights, k=25)
+        rng.shuffle(words)
+        yield json.dumps({
+            'title': f"{topics[0]} {' '.join(words[:6])}",
+            'location': rng.choice(LOCATIONS),
+            'date': '2024-01-01',
+            'url': f'https://example.gov/meetings/{i}',
+            'topics': topics,
+            'analysis': {'summary': ' '.join(words[6:])},
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=200000)
+    parser.add_argument('--queries', type=int, default=500)
+    args = parser.parse_args()
+
+    with app.app_context():
+        upgrade_database()
+        stats = import_meetings(generate(args.meetings), batch_size=20000)
+        print(f"Loaded {stats.inserted:,} meetings in {stats.elapsed:.1f}s")
+
+        start = time.perf_counter()
+        indexed = drain_related_queue(batch_size=2000)
+        elapsed = time.perf_counter() - start
+        print(f"Indexed {indexed:,} meetings in {elapsed:.1f}s ({indexed / elapsed:,.0f}/s)")
+
+        rng = random.Random(11)
+        timings = []
+        for _ in range(args.queries):
+            meeting_id = rng.randint(1, args.meetings)
+            start = time.perf_counter()
+            related_meetings(meeting_id, 10)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        print(f"related_meetings, top 10: p50 {statistics.median(timings):.2f} ms, "
+              f"p95 {timings[int(len(timings) * 0.95)]:.2f} ms, max {timings[-1]:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Batch rescoring of stored feature vectors.
+
+Loads synthetic meetings through the bulk importer, gives each a random
+feature vector, then times `rescore_meetings` with new weights (every row
+changes) and again with the same weights (nothing to write). For
+comparison it also times scoring the same vectors one at a time, the way
+the analyzer scores a single page.
+
+Usage (from the backend folder):
+    python benchmarks/bench_scoring.py --meetings 1000000
+"""
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BENCH_DIR = tempfile.mkdtemp(prefix='civicscoop-bench-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import MeetingFeatures, app, db, import_meetings, rescore_meetings, upgrade_database  # noqa: E402
+from utils.bulk_import import batched, bulk_insert  # noqa: E402
+from utils.scoring import (DEFAULT_WEIGHTS, FEATURE_VERSION, FEATURES, ScoringModel, decode_features,  # noqa: E402
+                           encode_features)
+
+LOCATIONS = ['Austin', 'Seattle', 'Miami', 'Denver', 'Portland', 'Richmond', 'Houston', 'Phoenix']
+
+
+def generate(count):
+    rng = random.Random(7)
+    for i in range(count):
+        yield json.dumps({
+            'title': f'City Council Meeting {i}',
+            'location': rng.choice(LOCATIONS),
+            'date': '2024-01-01',
+            'url': f'https://example.gov/meetings/{i}',
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=1000000)
+    parser.add_argument('--per-row-sample', type=int, default=20000, help='Vectors scored one at a time.')
+    args = parser.parse_args()
+
+    with app.app_context():
+        upgrade_database()
+        stats = import_meetings(generate(args.meetings), batch_size=20000)
+        print(f"Loaded {stats.inserted:,} meetings in {stats.elapsed:.1f}s")
+
+        rng = np.random.default_rng(7)
+        connection = db.session.connection()
+        for ids in batched(range(1, args.meetings + 1), 100000):
+            vectors = rng.gamma(1.5, 1.0, size=(len(ids), len(FEATURES)))
+            bulk_insert(connection, MeetingFeatures.__table__, ('meeting_id', 'version', 'vector'), [
+                {'meeting_id': meeting_id, 'version': FEATURE_VERSION, 'vector': encode_features(vector)}
+                for meeting_id, vector in zip(ids, vectors)
+            ])
+        db.session.commit()
+
+        weights = copy.deepcopy(DEFAULT_WEIGHTS)
+        weights['engagement']['bias'] += 0.5
+        model = ScoringModel(weights)
+        for label in ('new weights', 'unchanged weights'):
+            start = time.perf_counter()
+            report = rescore_meetings(model)
+            elapsed = time.perf_counter() - start
+            print(f"rescore, {label:<18} {elapsed:7.2f}s  {report['scored']:,} scored, {report['changed']:,} written")
+
+        vectors = decode_features(row.vector for row in db.session.execute(
+            MeetingFeatures.__table__.select().limit(args.per_row_sample)))
+        start = time.perf_counter()
+        model.score(vectors)
+        batch_us = (time.perf_counter() - start) / len(vectors) * 1e6
+        start = time.perf_counter()
+        for vector in vectors:
+            model.score_one(vector)
+        row_us = (time.perf_counter() - start) / len(vectors) * 1e6
+        print(f"scoring only: {batch_us:.3f} µs/vector batched, {row_us:.1f} µs/vector one at a time")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark for the FTS5-backed /api/search endpoint.
+
+Usage (from the backend folder):
+    python benchmarks/bench_search.py --meetings 200000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix='civicscoop-bench-'), 'bench.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DB_PATH}'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, Meeting, MeetingDetails, rebuild_search_index  # noqa: E402
+from utils.blobs import dump_blob  # noqa: E402
+
+LOCATIONS = ['Austin', 'Seattle', 'Miami', 'Denver', 'Portland', 'Richmond', 'Houston', 'Phoenix']
+TOPICS = ['Housing', 'Budget', 'Climate', 'Transit', 'Public Safety', 'Education']
+# A Zipf-like vocabulary: a few very common civic words and a long tail,
+# which is roughly how real transcripts are distributed
+COMMON = ('council community rezoning ordinance affordable resident hearing motion vote '
+          'allocation sidewalk stormwater library police emergency bond contract permit').split()
+VOCABULARY = COMMON + [f'term{i}' for i in range(20000)]
+WEIGHTS = [1.0 / (rank + 1) for rank in range(len(VOCABULARY))]
+QUERIES = ['housing', 'budget allocation', 'stormwater bond', 'affordable hous', 'library permit vote', 'term1234']
+
+
+def sentence():
+    return ' '.join(random.choices(VOCABULARY, weights=WEIGHTS, k=14)).capitalize()
+
+
+def populate(count):
+    base_date = datetime(2020, 1, 1)
+    batch, details = [], []
+    for i in range(1, count + 1):
+        topics = random.sample(TOPICS, 2)
+        batch.append({
+            'id': i,
+            'title': f'{random.choice(LOCATIONS)} City Council: {topics[0]} {random.choice(COMMON)}',
+            'location': random.choice(LOCATIONS),
+            'date': base_date + timedelta(days=i % 1800),
+            'url': f'https://example.gov/meetings/{i}',
+            'priority': 'medium',
+            'status': 'analyzed',
+            'created_at': datetime.utcnow(),
+            'topics': json.dumps(topics)
+        })
+        details.append({
+            'meeting_id': i,
+            'quotes': dump_blob([{'text': sentence()} for _ in range(3)]),
+            'analysis': dump_blob({'summary': sentence()})
+        })
+        if len(batch) == 20000:
+            db.session.execute(Meeting.__table__.insert(), batch)
+            db.session.execute(MeetingDetails.__table__.insert(), details)
+            batch, details = [], []
+    if batch:
+        db.session.execute(Meeting.__table__.insert(), batch)
+        db.session.execute(MeetingDetails.__table__.insert(), details)
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--meetings', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        populate(args.meetings)
+        start = time.perf_counter()
+        rebuild_search_index()
+        print(f'Indexed {args.meetings} meetings in {time.perf_counter() - start:.1f}s')
+
+    client = app.test_client()
+    print(f"{'query':<22} {'hits':>5} {'median (ms)':>12}")
+    for query in QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            response = client.get('/api/search', query_string={'q': query, 'limit': 20})
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        print(f"{query:<22} {len(response.get_json()['results']):>5} {timings[len(timings) // 2]:12.2f}")
+
+    os.remove(DB_PATH)
+
+
+if __name__ == '__main__':
+    main()
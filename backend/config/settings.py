@@ -1,12 +1,26 @@
 import os
 from datetime import timedelta
 
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 class Config:
-    """Base configuration class"""
+    """Base configuration class, used as is when FLASK_CONFIG is unset"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'civicscoop-secret-key-2024'
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///civicscoop.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     UPLOAD_FOLDER = 'static/uploads'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file upload
+    IMPORT_MAX_CONTENT_LENGTH = int(os.environ.get('IMPORT_MAX_CONTENT_LENGTH', 0)) or None  # /api/import/meetings streams; no limit if unset
+    SQLITE_PRAGMAS = {}  # Applied to every new SQLite connection
+    RESPONSE_CACHE_MAX_BYTES = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')  # Optional shared cache tier
+    ANALYSIS_TTL_SECONDS = int(os.environ.get('ANALYSIS_TTL_SECONDS', 24 * 3600))  # Reuse analyses younger than this
+    BLOB_COMPRESSION_LEVEL = int(os.environ.get('BLOB_COMPRESSION_LEVEL', 0)) or None  # zstd/zlib level; codec default if unset
+    SCORING_WEIGHTS = os.environ.get('SCORING_WEIGHTS')  # JSON weights for the scoring model; built-in if unset
+    DUPLICATE_SIMILARITY = float(os.environ.get('DUPLICATE_SIMILARITY', 0.85))  # Page similarity that links a mirror URL
+    RELATED_INDEX_INTERVAL = float(os.environ.get('RELATED_INDEX_INTERVAL', 2))  # Seconds between related index syncs
+    EXPORT_BATCH_SIZE = 1000  # Rows fetched per round trip by streaming exports
+    ANALYTICS_SNAPSHOT_DIR = os.environ.get('ANALYTICS_SNAPSHOT_DIR') or os.path.join(BACKEND_DIR, 'analytics_snapshot')
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -17,9 +31,29 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///civicscoop.db'
     CORS_ORIGINS = []  # Configure for production domains
 
+    # SQLite storage profile for multi-worker deployments. In WAL mode readers
+    # see the last committed snapshot while a commit is written; writers queue
+    # on busy_timeout instead of failing. Measure with bench_concurrency.py
+    # before relying on it for latency (see "Storage Profile" in the README).
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+        'synchronous': 'NORMAL',  # Durable across app crashes; fsync only at checkpoints in WAL mode
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        'cache_size': -64000,  # ~64MB page cache per connection
+        'temp_store': 'MEMORY'
+    }
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': 30,
+        'pool_recycle': 3600,
+        'pool_pre_ping': True,
+        'connect_args': {'timeout': 5, 'check_same_thread': False}
+    }
+
 class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
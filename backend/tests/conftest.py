@@ -0,0 +1,73 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+# app.py reads the database URL when it is imported
+DB_PATH = os.path.join(tempfile.mkdtemp(prefix='civicscoop-test-'), 'test.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DB_PATH}'
+os.environ.pop('FLASK_CONFIG', None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app as flask_app, db, response_cache, upgrade_database  # noqa: E402
+
+
+@pytest.fixture
+def database():
+    """An app context on an empty database; the file is removed afterwards, search table included"""
+    with flask_app.app_context():
+        yield flask_app
+        db.session.remove()
+        db.engine.dispose()
+    response_cache.clear()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+
+
+@pytest.fixture
+def app(database):
+    """The app on a fresh database created from the current models"""
+    upgrade_database()
+    return database
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+PAGE = """<html><head><title>City Council Meeting</title></head><body>
+City Council Meeting, March 5, 2024.
+Council Member Jane Smith said the housing budget is important for every family in this city.
+The council will vote on the affordable housing ordinance next week.
+</body></html>"""
+
+
+class Fetches:
+    """Stands in for requests.get, counting page fetches"""
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, url, **kwargs):
+        with self._lock:
+            self.urls.append(url)
+        time.sleep(self.delay)
+        response = mock.Mock(status_code=200, text=PAGE, content=PAGE.encode(),
+                             headers={'Content-Type': 'text/html'})
+        response.raise_for_status = lambda: None
+        return response
+
+
+@pytest.fixture
+def fetches():
+    """Page fetches stubbed with PAGE and recorded"""
+    fetches = Fetches()
+    with mock.patch('requests.get', fetches):
+        yield fetches
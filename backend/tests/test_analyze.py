@@ -0,0 +1,93 @@
+import threading
+from datetime import datetime, timedelta
+from unittest import mock
+
+import requests
+
+from app import Meeting, MeetingAnalyzer, analysis_flights, db
+
+
+def analyze(client, url, **fields):
+    response = client.post('/api/analyze_meeting', json=dict(fields, url=url))
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def age_analysis(meeting_id, seconds):
+    meeting = db.session.get(Meeting, meeting_id)
+    meeting.analyzed_at = datetime.utcnow() - timedelta(seconds=seconds)
+    db.session.commit()
+
+
+def test_fresh_analysis_is_reused_for_any_form_of_the_url(client, fetches):
+    first = analyze(client, 'https://example.gov/meetings/1')
+    again = analyze(client, 'https://WWW.example.gov/meetings/1/?utm_source=mail#agenda')
+    assert (first['reused'], again['reused']) == (False, True)
+    assert again['meeting_id'] == first['meeting_id']
+    assert len(fetches.urls) == 1
+    assert Meeting.query.count() == 1
+
+
+def test_ttl_expiry_forces_reanalysis(app, client, fetches):
+    first = analyze(client, 'https://example.gov/meetings/1')
+    ttl = app.config['ANALYSIS_TTL_SECONDS']
+
+    age_analysis(first['meeting_id'], ttl - 60)
+    assert analyze(client, 'https://example.gov/meetings/1')['reused'] is True
+
+    age_analysis(first['meeting_id'], ttl + 60)
+    refreshed = analyze(client, 'https://example.gov/meetings/1')
+    assert refreshed['reused'] is False
+    assert refreshed['meeting_id'] == first['meeting_id']  # Re-analyzed in place
+    assert refreshed['analyzed_at'] > first['analyzed_at']
+    assert len(fetches.urls) == 2
+    assert Meeting.query.count() == 1
+
+
+def test_updates_do_not_extend_the_ttl(app, client, fetches):
+    first = analyze(client, 'https://example.gov/meetings/1')
+    age_analysis(first['meeting_id'], app.config['ANALYSIS_TTL_SECONDS'] + 60)
+    meeting = db.session.get(Meeting, first['meeting_id'])
+    meeting.updated_at = datetime.utcnow()  # As rescoring and imports do
+    db.session.commit()
+
+    assert analyze(client, 'https://example.gov/meetings/1')['reused'] is False
+
+
+def test_refresh_and_older_analyzer_versions_reanalyze(client, fetches):
+    first = analyze(client, 'https://example.gov/meetings/1')
+    assert analyze(client, 'https://example.gov/meetings/1', refresh=True)['reused'] is False
+
+    meeting = db.session.get(Meeting, first['meeting_id'])
+    meeting.analyzer_version = MeetingAnalyzer.VERSION - 1
+    db.session.commit()
+    assert analyze(client, 'https://example.gov/meetings/1')['reused'] is False
+    assert len(fetches.urls) == 3
+
+
+def test_concurrent_identical_requests_run_one_analysis(app, fetches):
+    fetches.delay = 0.3  # Long enough for every request to reach the flight
+    responses = []
+
+    def request():
+        with app.test_client() as client:
+            responses.append(analyze(client, 'https://example.gov/meetings/1'))
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(fetches.urls) == 1
+    assert sorted(response['coalesced'] for response in responses) == [False, True, True, True]
+    assert len({response['meeting_id'] for response in responses}) == 1
+    assert Meeting.query.count() == 1
+    assert analysis_flights.in_flight() == 0
+
+
+def test_fetch_errors_are_reported(client):
+    with mock.patch('requests.get', side_effect=requests.ConnectionError('unreachable')):
+        response = client.post('/api/analyze_meeting', json={'url': 'https://example.gov/meetings/1'})
+    assert response.status_code == 400
+    assert Meeting.query.count() == 0
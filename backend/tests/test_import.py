@@ -0,0 +1,109 @@
+import json
+
+from app import Meeting, MeetingTopic, Person, PersonMention, check_rollups, db, import_meetings
+
+
+def record(n=1, **fields):
+    values = {
+        'title': f'Council meeting {n}',
+        'location': 'Austin',
+        'date': '2024-03-05',
+        'url': f'https://example.gov/meetings/{n}',
+        'priority': 'medium',
+        'topics': ['Budget'],
+        'quotes': [{'text': 'We will fund the corridor plan', 'speaker': 'Mayor'}],
+        'analysis': {'summary': 'Budget hearing'},
+    }
+    values.update(fields)
+    return values
+
+
+def lines(*records):
+    return [record if isinstance(record, str) else json.dumps(record) for record in records]
+
+
+def search_ids(client, query):
+    return [result['id'] for result in client.get(f'/api/search?q={query}').get_json()['results']]
+
+
+def topics_of(meeting_id):
+    return sorted(link.topic for link in MeetingTopic.query.filter_by(meeting_id=meeting_id))
+
+
+def test_duplicate_canonical_url_updates_the_meeting(app):
+    stats = import_meetings(lines(record(title='Budget hearing', url='https://example.gov/meetings/1')))
+    assert (stats.inserted, stats.updated) == (1, 0)
+    meeting_id = Meeting.query.one().id
+
+    # Same canonical URL: host case, www., tracking parameters and trailing slash differ
+    stats = import_meetings(lines(record(title='Rescheduled budget hearing',
+                                         url='https://WWW.example.gov/meetings/1/?utm_source=mail')))
+    assert (stats.inserted, stats.updated) == (0, 1)
+    meeting = Meeting.query.one()
+    assert meeting.id == meeting_id
+    assert meeting.title == 'Rescheduled budget hearing'
+
+
+def test_later_line_of_a_batch_wins(app):
+    stats = import_meetings(lines(record(title='First'), record(title='Second')))
+    assert (stats.inserted, stats.duplicates) == (1, 1)
+    assert Meeting.query.one().title == 'Second'
+
+
+def test_malformed_lines_are_skipped_and_reported(app):
+    stats = import_meetings(lines(
+        record(1),
+        '{"title": "Truncated',
+        record(2),
+        record(3, location=None),
+        '',
+        record(4, priority='urgent'),
+        record(5),
+    ), batch_size=10)
+
+    assert (stats.read, stats.inserted, stats.rejected) == (6, 3, 3)
+    assert [error['line'] for error in stats.errors] == [2, 4, 6]
+    assert 'invalid JSON' in stats.errors[0]['error']
+    assert stats.errors[1]['error'] == 'location is required'
+    assert sorted(meeting.title for meeting in Meeting.query) == [
+        'Council meeting 1', 'Council meeting 2', 'Council meeting 5']
+    assert check_rollups() == []
+
+
+def test_endpoint_reports_counts(client):
+    body = '\n'.join(lines(record(1), 'not json', record(2))).encode()
+    response = client.post('/api/import/meetings?batch_size=1', data=body, content_type='application/x-ndjson')
+    assert response.status_code == 200
+    report = response.get_json()
+    assert (report['inserted'], report['rejected']) == (2, 1)
+    assert report['errors'][0]['line'] == 2
+
+
+def test_derived_tables_follow_an_update(app, client):
+    participants = [{'name': 'Council Member Jane Smith', 'role': 'Council Member', 'quoted': True},
+                    {'name': 'Mayor Lee', 'role': 'Mayor'}]
+    import_meetings(lines(
+        record(1, location='Austin', topics=['Budget', 'Housing'], title='Stormwater bond hearing',
+               analysis={'summary': 'Bonds', 'participants': participants}),
+        record(2, location='Denver', topics=['Transit']),
+    ))
+    first = Meeting.query.filter_by(url='https://example.gov/meetings/1').one()
+    assert topics_of(first.id) == ['Budget', 'Housing']
+    assert search_ids(client, 'stormwater') == [first.id]
+    assert sorted(person.name for person in Person.query) == ['Jane Smith', 'Lee']
+    assert PersonMention.query.filter_by(meeting_id=first.id).count() == 2
+    assert check_rollups() == []
+
+    # Re-import with a new location, topics, title and one participant fewer
+    import_meetings(lines(
+        record(1, location='Seattle', topics=['Climate'], title='Library permit hearing',
+               analysis={'summary': 'Permits', 'participants': participants[:1]}),
+    ))
+    assert topics_of(first.id) == ['Climate']
+    assert search_ids(client, 'stormwater') == []
+    assert search_ids(client, 'library') == [first.id]
+    mentions = PersonMention.query.filter_by(meeting_id=first.id).all()
+    assert [db.session.get(Person, mention.person_id).name for mention in mentions] == ['Jane Smith']
+    assert mentions[0].quoted
+    assert Meeting.query.count() == 2
+    assert check_rollups() == []
@@ -0,0 +1,125 @@
+from datetime import datetime
+
+from app import AnalyticsRollup, Meeting, MeetingTopic, check_rollups, db
+from utils.memo import flush_mutations, memoized
+
+
+class Row:
+    """Stand-in for a model instance: a column and a setter that counts writes"""
+
+    def __init__(self, stored):
+        self.stored = stored
+        self.writes = 0
+
+    def get(self):
+        return memoized(self, 'value', lambda: {key: list(value) for key, value in self.stored.items()}, self.set)
+
+    def set(self, value):
+        self.stored = value
+        self.writes += 1
+
+
+class Session:
+    def __init__(self, *instances):
+        self.identity_map = {id(instance): instance for instance in instances}
+        self.new = []
+
+
+def add_meeting(**fields):
+    meeting = Meeting(title='Council meeting', location='Austin', date=datetime(2024, 3, 5),
+                      url='https://example.gov/meetings/1', status='analyzed', **fields)
+    meeting.set_topics(['Budget'])
+    meeting.set_quotes([{'text': 'We will fund the corridor plan', 'speaker': 'Mayor'}])
+    meeting.set_analysis({'summary': 'Budget hearing', 'topics': ['Budget']})
+    db.session.add(meeting)
+    db.session.commit()
+    return meeting.id
+
+
+def reload(meeting_id):
+    db.session.expunge_all()
+    return db.session.get(Meeting, meeting_id)
+
+
+def topic_count(topic):
+    rollup = db.session.get(AnalyticsRollup, ('topic', topic))
+    return rollup.meeting_count if rollup else 0
+
+
+def test_clean_entries_are_not_written():
+    row = Row({'topics': ['Budget']})
+    row.get()
+    assert flush_mutations(Session(row)) == 0
+    assert row.writes == 0
+
+
+def test_nested_mutation_is_written_once():
+    row = Row({'topics': ['Budget']})
+    value = row.get()
+    value['topics'].append('Housing')
+    assert flush_mutations(Session(row)) == 1
+    assert row.stored == {'topics': ['Budget', 'Housing']}
+    assert flush_mutations(Session(row)) == 0
+    value['topics'].remove('Budget')  # The value stays tracked after it is written back
+    assert flush_mutations(Session(row)) == 1
+    assert row.stored == {'topics': ['Housing']}
+    assert row.writes == 2
+
+
+def test_in_place_topic_mutation_updates_links_and_rollups(app):
+    meeting_id = add_meeting()
+    assert topic_count('Housing') == 0
+
+    meeting = reload(meeting_id)
+    meeting.get_topics().append('Housing')
+    db.session.commit()
+
+    meeting = reload(meeting_id)
+    assert meeting.get_topics() == ['Budget', 'Housing']
+    links = MeetingTopic.query.filter_by(meeting_id=meeting_id).order_by(MeetingTopic.topic).all()
+    assert [link.topic for link in links] == ['Budget', 'Housing']
+    assert topic_count('Housing') == 1
+    assert check_rollups() == []
+
+    meeting.get_topics().remove('Budget')
+    db.session.commit()
+    assert [link.topic for link in MeetingTopic.query.filter_by(meeting_id=meeting_id)] == ['Housing']
+    assert topic_count('Budget') == 0
+    assert check_rollups() == []
+
+
+def test_in_place_details_mutation_is_written_back(app):
+    meeting_id = add_meeting()
+
+    meeting = reload(meeting_id)
+    etag = meeting.etag
+    meeting.get_quotes()[0]['speaker'] = 'Council Member Lee'
+    meeting.get_analysis()['participants'] = [{'name': 'Lee', 'role': 'Council Member'}]
+    db.session.commit()
+
+    meeting = reload(meeting_id)
+    assert meeting.get_quotes()[0]['speaker'] == 'Council Member Lee'
+    assert meeting.get_analysis()['participants'] == [{'name': 'Lee', 'role': 'Council Member'}]
+    assert meeting.etag != etag
+
+
+def test_autoflush_writes_back_before_queries(app):
+    meeting_id = add_meeting()
+
+    meeting = reload(meeting_id)
+    meeting.get_topics().append('Housing')
+    # The query autoflushes, so it sees the topic link of the in-place append
+    assert MeetingTopic.query.filter_by(meeting_id=meeting_id, topic='Housing').count() == 1
+    db.session.rollback()
+    assert reload(meeting_id).get_topics() == ['Budget']
+
+
+def test_reads_write_nothing(app):
+    meeting_id = add_meeting()
+
+    meeting = reload(meeting_id)
+    updated_at = meeting.updated_at
+    meeting.get_topics(), meeting.get_quotes(), meeting.get_analysis()
+    assert flush_mutations(db.session) == 0
+    db.session.commit()
+    assert reload(meeting_id).updated_at == updated_at
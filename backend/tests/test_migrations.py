@@ -0,0 +1,136 @@
+import json
+
+import pytest
+from sqlalchemy import inspect, text
+
+from app import (BackfillCheckpoint, Meeting, MeetingFeatures, MeetingSignature, MeetingTopic, PersonMention,
+                 backfill_analyses, check_rollups, db, migrations, stale_analysis_filter, upgrade_database)
+
+# The schema created by the app before migrations were introduced
+LEGACY_SCHEMA = """
+CREATE TABLE meeting (
+    id INTEGER NOT NULL,
+    title VARCHAR(200) NOT NULL,
+    location VARCHAR(100) NOT NULL,
+    date DATETIME NOT NULL,
+    url VARCHAR(500) NOT NULL,
+    priority VARCHAR(20),
+    priority_score VARCHAR(10),
+    segments VARCHAR(50),
+    engagement VARCHAR(50),
+    ai_accuracy FLOAT,
+    status VARCHAR(20),
+    created_at DATETIME,
+    topics TEXT,
+    quotes TEXT,
+    analysis TEXT,
+    PRIMARY KEY (id)
+);
+CREATE TABLE user (
+    id INTEGER NOT NULL,
+    username VARCHAR(80) NOT NULL,
+    email VARCHAR(120) NOT NULL,
+    role VARCHAR(20),
+    created_at DATETIME,
+    PRIMARY KEY (id),
+    UNIQUE (username),
+    UNIQUE (email)
+);
+CREATE TABLE report (
+    id INTEGER NOT NULL,
+    name VARCHAR(200) NOT NULL,
+    type VARCHAR(50) NOT NULL,
+    status VARCHAR(20),
+    file_path VARCHAR(500),
+    created_at DATETIME,
+    config TEXT,
+    PRIMARY KEY (id)
+);
+"""
+
+LEGACY_MEETINGS = [
+    {'id': 1, 'title': 'Austin City Council: Housing Crisis Response', 'location': 'Austin',
+     'date': '2024-01-15 18:00:00.000000', 'url': 'https://www.austintexas.gov/meetings/1/?utm_source=mail',
+     'priority': 'critical', 'priority_score': '92%', 'segments': '22:15 high segments',
+     'engagement': '85.3% high engagement', 'ai_accuracy': 98.7, 'status': 'analyzed',
+     'created_at': '2024-01-15 20:00:00', 'topics': '["Housing", "Budget"]',
+     'quotes': json.dumps([{'text': 'We need affordable housing now', 'speaker': 'Mayor'}]),
+     'analysis': json.dumps({'summary': 'Housing emergency', 'date': 'January 16, 2024'})},
+    {'id': 2, 'title': 'Seattle Transit Committee', 'location': 'Seattle',
+     'date': '2024-02-01 09:00:00.000000', 'url': 'https://seattle.gov/meetings/2', 'priority': 'medium',
+     'priority_score': '50%', 'segments': '0:0 high segments', 'engagement': '0% high engagement',
+     'ai_accuracy': 95.0, 'status': 'analyzed', 'created_at': '2024-02-01 12:00:00.000000',
+     'topics': '["Transit"]', 'quotes': '[]', 'analysis': '{}'},
+    {'id': 3, 'title': 'Denver Budget Hearing', 'location': 'Denver', 'date': '2024-03-05 18:30:00.000000',
+     'url': 'https://denvergov.org/meetings/3#agenda', 'priority': 'high', 'priority_score': '73%',
+     'segments': '5:30 high segments', 'engagement': '41.5% high engagement', 'ai_accuracy': 96.1,
+     'status': 'pending', 'created_at': '2024-03-05 19:00:00.000000', 'topics': 'not json',
+     'quotes': None, 'analysis': None},
+]
+
+
+@pytest.fixture
+def legacy(database):
+    """A database at the legacy schema holding a few meetings"""
+    with db.engine.begin() as connection:
+        for statement in LEGACY_SCHEMA.split(';'):
+            if statement.strip():
+                connection.exec_driver_sql(statement)
+        columns = list(LEGACY_MEETINGS[0])
+        connection.execute(
+            text(f"INSERT INTO meeting ({', '.join(columns)}) VALUES ({', '.join(':' + c for c in columns)})"),
+            LEGACY_MEETINGS
+        )
+        connection.exec_driver_sql("INSERT INTO report (name, type, status, created_at, config) "
+                                   "VALUES ('Weekly digest', 'summary', 'ready', '2024-03-01 00:00:00', '{}')")
+    return database
+
+
+def stale_count():
+    return Meeting.query.filter(stale_analysis_filter()).count()
+
+
+def test_upgrade_from_the_legacy_schema(legacy):
+    applied = upgrade_database()
+    assert applied == list(range(1, migrations.latest_version + 1))
+    assert migrations.pending(db.session) == []
+    assert upgrade_database() == []  # Nothing left to apply
+
+    columns = {column['name'] for column in inspect(db.engine).get_columns('meeting')}
+    assert {'quotes', 'analysis'}.isdisjoint(columns)
+    assert {column.name for column in Meeting.__table__.c} <= columns
+
+    housing = db.session.get(Meeting, 1)
+    assert housing.canonical_url == 'https://austintexas.gov/meetings/1'
+    assert (housing.priority_score_value, housing.engagement_value, housing.high_segment_seconds) == (92.0, 85.3, 1335)
+    assert housing.date.date().isoformat() == '2024-01-16'  # From the stored analysis
+    assert housing.get_quotes() == [{'text': 'We need affordable housing now', 'speaker': 'Mayor'}]
+    assert housing.get_analysis()['summary'] == 'Housing emergency'
+    assert housing.updated_at is not None
+    assert housing.analyzer_version is None and housing.analyzed_at is not None
+    assert db.session.get(Meeting, 3).get_topics() == []
+    assert sorted((link.meeting_id, link.topic) for link in MeetingTopic.query) == [
+        (1, 'Budget'), (1, 'Housing'), (2, 'Transit')]
+
+    client = legacy.test_client()
+    assert [result['id'] for result in client.get('/api/search?q=transit').get_json()['results']] == [2]
+    assert check_rollups() == []
+    assert stale_count() == 3
+
+
+def test_backfill_after_upgrade_is_resumable(legacy, fetches):
+    upgrade_database()
+    checkpoint = backfill_analyses(batch_size=1, workers=1, limit=2)
+    assert (checkpoint.processed, checkpoint.last_id) == (2, 2)
+    assert stale_count() == 1
+
+    checkpoint = backfill_analyses(batch_size=1, workers=1)  # Resumes after meeting 2
+    assert (checkpoint.processed, checkpoint.failed, checkpoint.fetched) == (3, 0, 3)
+    assert len(fetches.urls) == 3
+    assert BackfillCheckpoint.query.count() == 1
+
+    assert stale_count() == 0
+    assert MeetingFeatures.query.count() == MeetingSignature.query.count() == 3
+    assert PersonMention.query.count() > 0
+    assert all(meeting.analyzed_at is not None for meeting in Meeting.query)
+    assert check_rollups() == []
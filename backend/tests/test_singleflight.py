@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from utils.singleflight import SingleFlight
+
+
+def run_concurrently(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+
+def test_concurrent_calls_share_one_run():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls, results = [], []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return 'page'
+
+    def caller():
+        results.append(flights.do('https://example.gov/1', work))
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    while flights.in_flight() == 0:
+        time.sleep(0.001)
+    followers = threading.Thread(target=run_concurrently, args=(4, caller))
+    followers.start()
+    time.sleep(0.05)  # Let the followers reach the wait
+    release.set()
+    leader.join(5)
+    followers.join(5)
+
+    assert len(calls) == 1
+    assert sorted(results) == [('page', False)] + [('page', True)] * 4
+    assert flights.in_flight() == 0
+
+
+def test_waiters_receive_the_error():
+    flights = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def work():
+        release.wait(5)
+        raise ValueError('fetch failed')
+
+    def caller():
+        try:
+            flights.do('key', work)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    while flights.in_flight() == 0:
+        time.sleep(0.001)
+    followers = threading.Thread(target=run_concurrently, args=(2, caller))
+    followers.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    followers.join(5)
+
+    assert errors == ['fetch failed'] * 3
+    assert flights.in_flight() == 0
+
+
+def test_nothing_is_cached_after_a_call():
+    flights = SingleFlight()
+    calls = []
+    results = [flights.do('key', lambda: calls.append(1) or len(calls)) for _ in range(2)]
+    assert results == [(1, False), (2, False)]
+
+
+def test_distinct_keys_run_separately():
+    flights = SingleFlight()
+    assert flights.do('a', lambda: 1) == (1, False)
+    assert flights.do('b', lambda: 2) == (2, False)
+    with pytest.raises(KeyError):
+        flights.do('c', lambda: {}['missing'])
+    assert flights.in_flight() == 0
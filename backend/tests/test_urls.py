@@ -0,0 +1,33 @@
+import pytest
+
+from utils.urls import normalize_url
+
+
+@pytest.mark.parametrize('url, canonical', [
+    ('https://example.gov/meetings/1', 'https://example.gov/meetings/1'),
+    ('HTTPS://WWW.Example.GOV/meetings/1', 'https://example.gov/meetings/1'),
+    ('https://example.gov/meetings/1/', 'https://example.gov/meetings/1'),
+    ('https://example.gov/meetings/1#agenda', 'https://example.gov/meetings/1'),
+    ('https://example.gov/meetings/1/?utm_source=mail&utm_campaign=x#top', 'https://example.gov/meetings/1'),
+    ('https://example.gov/meetings?fbclid=abc&id=7&gclid=def', 'https://example.gov/meetings?id=7'),
+    ('https://example.gov/meetings?year=2024&id=7', 'https://example.gov/meetings?id=7&year=2024'),
+    ('https://example.gov/meetings?draft=', 'https://example.gov/meetings?draft='),
+    ('https://example.gov:443/meetings', 'https://example.gov/meetings'),
+    ('http://example.gov:8080/meetings', 'http://example.gov:8080/meetings'),
+    ('https://example.gov', 'https://example.gov/'),
+    ('https://example.gov///', 'https://example.gov/'),
+    ('example.gov/meetings/1', 'https://example.gov/meetings/1'),
+    ('  https://example.gov/meetings/1  ', 'https://example.gov/meetings/1'),
+])
+def test_normalize_url(url, canonical):
+    assert normalize_url(url) == canonical
+
+
+def test_path_and_scheme_are_significant():
+    assert normalize_url('https://example.gov/Meetings/1') != normalize_url('https://example.gov/meetings/1')
+    assert normalize_url('http://example.gov/meetings/1') != normalize_url('https://example.gov/meetings/1')
+
+
+def test_empty_url():
+    assert normalize_url('') == ''
+    assert normalize_url(None) == ''
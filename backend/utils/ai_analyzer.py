@@ -1,5 +1,6 @@
 import requests
 from bs4 import BeautifulSoup
+import heapq
 import re
 import json
 from datetime import datetime
@@ -7,10 +8,24 @@ import time
 from urllib.parse import urlparse, urljoin
 import logging
 
+from utils.dates import find_meeting_date, parse_meeting_date
+from utils.people import extract_participants, find_speaker
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sentences are matched one at a time instead of split into a list up front
+SENTENCE_PATTERN = re.compile(r'[^.!?]+')
+
+# Words that make a sentence a candidate quote
+QUOTE_INDICATORS = re.compile(
+    r'\b(?:said|stated|announced|declared|emphasized|noted'
+    r'|will|must|need|should|committed|plan'
+    r'|important|critical|significant|essential)\b',
+    re.IGNORECASE
+)
+
 class MeetingAnalyzer:
     """Advanced AI-powered meeting content analyzer"""
 
@@ -153,29 +168,16 @@ class MeetingAnalyzer:
         return "Unknown"
 
     def _extract_date(self, content, soup):
-        """Extract meeting date from content"""
-        # Look for date patterns
-        date_patterns = [
-            r'(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}',
-            r'\d{1,2}[/-]\d{1,2}[/-]\d{4}',
-            r'\d{4}-\d{2}-\d{2}',
-        ]
-
-        content_lower = content.lower()
+        """Extract the meeting date from content, normalized to YYYY-MM-DD"""
+        # Prefer a machine-readable <time datetime="..."> element when the page has one
+        time_tag = soup.find('time', attrs={'datetime': True}) if soup else None
+        meeting_date = parse_meeting_date(time_tag['datetime']) if time_tag else None
 
-        for pattern in date_patterns:
-            matches = re.findall(pattern, content_lower, re.IGNORECASE)
-            if matches:
-                try:
-                    # Try to parse the first match
-                    date_str = matches[0]
-                    # This is a simplified parser - in production you'd use dateutil
-                    return date_str
-                except:
-                    continue
+        if meeting_date is None:
+            meeting_date = find_meeting_date(content)
 
         # Default to today if no date found
-        return datetime.now().strftime('%B %d, %Y')
+        return (meeting_date or datetime.now()).strftime('%Y-%m-%d')
 
     def _extract_topics(self, content):
         """Extract relevant topics from content using keyword analysis"""
@@ -314,41 +316,46 @@ class MeetingAnalyzer:
 
         return f"{engagement_percentage}%"
 
-    def _extract_quotes(self, content):
-        """Extract potential key quotes from content"""
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', content)
-        quotes = []
+    def _extract_quotes(self, content, limit=3):
+        """
+        Extract the highest-confidence key quotes from content
 
-        # Look for impactful sentences
-        quote_indicators = [
-            r'\b(?:said|stated|announced|declared|emphasized|noted)\b',
-            r'\b(?:will|must|need|should|committed|plan)\b',
-            r'\b(?:important|critical|significant|essential)\b'
+        Every sentence is scored in one pass over the content, keeping only the
+        best ``limit`` in a min-heap, so long transcripts are read to the end
+        in linear time and O(limit) memory. Ties go to the earlier sentence.
+        """
+        best = []  # (confidence, -position, sentence); the root is the weakest kept
+        for position, match in enumerate(SENTENCE_PATTERN.finditer(content)):
+            sentence = match.group().strip()
+
+            # Filter by length and content quality, then check for quote indicators
+            if not 30 <= len(sentence) <= 200 or not QUOTE_INDICATORS.search(sentence):
+                continue
+
+            candidate = (self._calculate_quote_confidence(sentence), -position, sentence)
+            if len(best) < limit:
+                heapq.heappush(best, candidate)
+            elif candidate > best[0]:
+                heapq.heapreplace(best, candidate)
+
+        # Speakers only for the quotes kept
+        return [
+            {
+                'text': sentence,
+                'speaker': self._identify_speaker(sentence),
+                'confidence': confidence,
+                'timestamp': '00:00:00',  # Placeholder
+                'context': 'extracted_from_content'
+            }
+            for confidence, _, sentence in sorted(best, reverse=True)
         ]
 
-        for sentence in sentences:
-            sentence = sentence.strip()
-
-            # Filter by length and content quality
-            if 30 <= len(sentence) <= 200:
-                # Check for quote indicators
-                if any(re.search(pattern, sentence, re.IGNORECASE) for pattern in quote_indicators):
-                    quotes.append({
-                        'text': sentence,
-                        'speaker': self._identify_speaker(sentence),
-                        'confidence': self._calculate_quote_confidence(sentence),
-                        'timestamp': '00:00:00',  # Placeholder
-                        'context': 'extracted_from_content'
-                    })
-
-            if len(quotes) >= 5:  # Limit to top 5 quotes
-                break
-
-        return sorted(quotes, key=lambda x: x['confidence'], reverse=True)[:3]
-
     def _identify_speaker(self, quote):
         """Identify potential speaker from quote context"""
+        speaker = find_speaker(quote)
+        if speaker:
+            return f"{speaker['role']} {speaker['name']}"
+
         speaker_patterns = [
             r'(?:mayor|council\s*member|supervisor|commissioner|director)\s+([a-z]+)',
             r'([a-z]+)\s+(?:said|stated|announced)',
@@ -431,25 +438,12 @@ class MeetingAnalyzer:
         return agenda_items[:10]  # Limit to 10 items
 
     def _extract_participants(self, content):
-        """Extract participant information"""
-        participants = []
-
-        # Look for participant patterns
-        participant_patterns = [
-            r'(?:mayor|council\s*member|supervisor|commissioner)\s+([a-z\s]+?)(?:\s|,|$)',
-            r'(?:present:|attending:)\s*([^\n]+)',
+        """Extract participant information (titled names and roll calls, see utils/people.py)"""
+        participants = [
+            {'name': participant['name'], 'role': participant['role'] or 'Council Member', 'present': True}
+            for participant in extract_participants(content)
         ]
 
-        for pattern in participant_patterns:
-            matches = re.findall(pattern, content.lower())
-            for match in matches:
-                if isinstance(match, str) and len(match.strip()) > 2:
-                    participants.append({
-                        'name': match.strip().title(),
-                        'role': 'Council Member',
-                        'present': True
-                    })
-
         return participants[:15]  # Limit to 15 participants
 
     def _calculate_accuracy_score(self, content):
@@ -481,7 +475,7 @@ class MeetingAnalyzer:
         return {
             'title': 'Analysis Failed',
             'location': 'Unknown',
-            'date': datetime.now().strftime('%B %d, %Y'),
+            'date': datetime.now().strftime('%Y-%m-%d'),
             'topics': ['General'],
             'priority': 'low',
             'engagement_estimate': '0%',
@@ -0,0 +1,165 @@
+"""
+Transparent compression for large JSON blob columns.
+
+Blobs are compressed with zstd when the zstandard package is installed,
+optionally against a dictionary trained on stored payloads (analyses share
+most of their keys and phrasing, so a dictionary helps small blobs the most),
+and with zlib otherwise. Values are stored as raw frames; reads recognise zstd
+and zlib frames by their magic bytes and treat anything else as plain JSON
+text, so rows written before compression, or by a worker without zstandard,
+stay readable.
+
+Values are only decompressed when an accessor asks for them, never when a
+row is loaded.
+"""
+import threading
+import zlib
+
+from utils.serialization import dumps, load_column
+
+try:
+    import zstandard
+except ImportError:  # Falls back to zlib
+    zstandard = None
+
+DECOMPRESSION_ERRORS = (zlib.error,) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZLIB_HEADERS = (b'\x78\x01', b'\x78\x5e', b'\x78\x9c', b'\x78\xda')
+
+# Payloads smaller than this are stored as plain JSON; frame overhead would outweigh the savings
+MIN_COMPRESS_SIZE = 64
+
+DEFAULT_ZSTD_LEVEL = 3
+DEFAULT_ZLIB_LEVEL = 6
+DEFAULT_DICTIONARY_SIZE = 64 * 1024
+
+
+def require_zstandard():
+    if zstandard is None:
+        raise RuntimeError("zstd blobs require the zstandard package (pip install zstandard)")
+
+
+class BlobCodec:
+    """
+    Compress and decompress blob column values
+
+    Dictionaries are looked up by the id recorded in each zstd frame. The
+    optional ``loader`` returns the raw bytes of every stored dictionary,
+    oldest first; it is called on first use and again when a frame names a
+    dictionary this process has not seen (trained by another worker). The
+    newest dictionary is used for compression.
+    """
+
+    def __init__(self, level=None, loader=None, algorithm=None):
+        if algorithm == 'zstd':
+            require_zstandard()
+        self.algorithm = algorithm or ('zstd' if zstandard is not None else 'zlib')
+        self.level = level
+        self._loader = loader
+        self._loaded = False
+        self._dictionaries = {}  # dict_id -> ZstdCompressionDict
+        self._active = None
+        self._lock = threading.Lock()
+
+    @property
+    def dictionary_id(self):
+        """Id of the dictionary new blobs are compressed with, or None"""
+        self._ensure_loaded()
+        return self._active.dict_id() if self._active is not None else None
+
+    def set_loader(self, loader):
+        with self._lock:
+            self._loader = loader
+            self._loaded = False
+
+    def add_dictionary(self, data, activate=True):
+        """Register a trained dictionary (raw bytes) and return its id"""
+        require_zstandard()
+        dictionary = zstandard.ZstdCompressionDict(data)
+        dictionary.precompute_compress(level=self._zstd_level)
+        with self._lock:
+            self._dictionaries[dictionary.dict_id()] = dictionary
+            if activate:
+                self._active = dictionary
+        return dictionary.dict_id()
+
+    def compress(self, data):
+        """Compress ``data`` (bytes) unless it is too small to benefit"""
+        if len(data) < MIN_COMPRESS_SIZE:
+            return data
+        if self.algorithm == 'zlib':
+            return zlib.compress(data, self.level or DEFAULT_ZLIB_LEVEL)
+
+        self._ensure_loaded()
+        dictionary = self._active
+        if dictionary is not None:
+            compressor = zstandard.ZstdCompressor(dict_data=dictionary)
+        else:
+            compressor = zstandard.ZstdCompressor(level=self._zstd_level)
+        return compressor.compress(data)
+
+    def decompress(self, value):
+        """Return the original bytes (or text, for rows stored before compression)"""
+        if not value or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if value.startswith(ZSTD_MAGIC):
+            require_zstandard()
+            dict_id = zstandard.get_frame_parameters(value).dict_id
+            if dict_id:
+                return zstandard.ZstdDecompressor(dict_data=self._dictionary(dict_id)).decompress(value)
+            return zstandard.ZstdDecompressor().decompress(value)
+        if value[:2] in ZLIB_HEADERS:
+            return zlib.decompress(value)
+        return value
+
+    @property
+    def _zstd_level(self):
+        return self.level or DEFAULT_ZSTD_LEVEL
+
+    def _ensure_loaded(self, force=False):
+        if self._loader is None or (self._loaded and not force):
+            return
+        data = self._loader()
+        with self._lock:
+            self._loaded = True
+        for raw in data:
+            self.add_dictionary(raw)
+
+    def _dictionary(self, dict_id):
+        self._ensure_loaded()
+        if dict_id not in self._dictionaries:
+            self._ensure_loaded(force=True)
+        if dict_id not in self._dictionaries:
+            raise LookupError(f"Blob was compressed with unknown zstd dictionary {dict_id}")
+        return self._dictionaries[dict_id]
+
+
+def train_dictionary(samples, size=DEFAULT_DICTIONARY_SIZE):
+    """Train a zstd dictionary from sample payloads (bytes); returns its raw bytes"""
+    require_zstandard()
+    return zstandard.train_dictionary(size, list(samples)).as_bytes()
+
+
+blob_codec = BlobCodec()
+
+
+def dump_blob(obj, codec=None):
+    """Encode ``obj`` as JSON and compress it for a blob column"""
+    return (codec or blob_codec).compress(dumps(obj))
+
+
+def load_blob(value, empty, codec=None):
+    """Decompress and decode a blob column, falling back to ``empty`` for NULL or corrupt values"""
+    try:
+        data = (codec or blob_codec).decompress(value)
+    except DECOMPRESSION_ERRORS:
+        return empty
+    return load_column(data, empty)
+
+
+def blob_text(value, codec=None):
+    """Decompressed JSON text of a blob column, for exports that keep JSON as text"""
+    data = (codec or blob_codec).decompress(value)
+    return data.decode('utf-8') if isinstance(data, bytes) else data
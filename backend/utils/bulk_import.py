@@ -0,0 +1,112 @@
+"""
+Helpers for streaming bulk imports.
+
+NDJSON input is read line by line and grouped into fixed-size batches, so an
+import of any size holds only one batch in memory. Row validation and writes
+are left to the caller; ImportStats tracks counts, rejected lines and
+throughput for progress reporting.
+
+bulk_insert and bulk_update compile their statement once and pass plain
+tuples to the DBAPI's executemany, skipping SQLAlchemy's per-row parameter
+processing. They do not apply column defaults or fire ORM events.
+"""
+from itertools import islice
+import time
+
+from sqlalchemy import bindparam
+
+from utils.serialization import loads
+
+# Rejected lines kept for the final report; the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+def iter_ndjson_records(lines):
+    """
+    Decode NDJSON lines, skipping blank ones
+
+    Yields:
+        tuple: (line number, decoded value or None, error message or None)
+    """
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, loads(line), None
+        except ValueError as e:
+            yield line_number, None, f"invalid JSON: {e}"
+
+
+def batched(iterable, size):
+    """Yield lists of up to ``size`` items"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def bulk_insert(connection, table, columns, rows):
+    """Insert ``rows`` (dicts keyed by ``columns``) with one executemany"""
+    if rows:
+        _executemany(connection, table, table.insert(), columns, rows)
+
+
+def bulk_update(connection, table, key, columns, rows):
+    """Update ``columns`` of the rows matching each dict's ``key`` value with one executemany"""
+    if rows:
+        statement = table.update().where(table.c[key] == bindparam(f'match_{key}'))
+        _executemany(connection, table, statement, columns, rows, {f'match_{key}': key})
+
+
+def _executemany(connection, table, statement, columns, rows, renames=None):
+    compiled = statement.compile(dialect=connection.dialect, column_keys=list(columns))
+    names = [(renames or {}).get(name, name) for name in compiled.positiontup]
+    # dialect_impl: SQLite's DateTime processor lives on the dialect-specific type
+    processors = [table.c[name].type.dialect_impl(connection.dialect).bind_processor(connection.dialect) for name in names]
+    fields = list(zip(names, processors))
+    connection.exec_driver_sql(str(compiled), [
+        tuple(process(row[name]) if process else row[name] for name, process in fields)
+        for row in rows
+    ])
+
+
+class ImportStats:
+    """Counters and throughput of a running import"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.read = 0
+        self.inserted = 0
+        self.updated = 0
+        self.duplicates = 0  # Later lines of the same batch replacing an earlier one
+        self.rejected = 0
+        self.errors = []
+
+    def reject(self, line_number, message):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line_number, 'error': message})
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self):
+        """Rows read per second so far"""
+        elapsed = self.elapsed
+        return self.read / elapsed if elapsed else 0.0
+
+    def as_dict(self):
+        return {
+            'read': self.read,
+            'inserted': self.inserted,
+            'updated': self.updated,
+            'duplicates': self.duplicates,
+            'rejected': self.rejected,
+            'errors': self.errors,
+            'seconds': round(self.elapsed, 3),
+            'rows_per_second': round(self.rate, 1)
+        }
@@ -0,0 +1,162 @@
+"""
+In-process LRU cache for serialized API responses, with an optional shared
+(Redis) tier so several worker processes can reuse each other's entries.
+
+Entries carry the ETag they were rendered for, and the caller checks it
+against the current row or collection version before serving them. Stale
+entries are never served, even from workers that missed an invalidation.
+Writes also invalidate entries by tag, which frees their memory as soon as
+the data changes.
+"""
+from collections import OrderedDict, namedtuple
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+except ImportError:  # Shared tier is optional
+    redis = None
+
+CacheEntry = namedtuple('CacheEntry', ['body', 'etag', 'mimetype', 'encoding'])
+
+
+class ResponseCache:
+    """Size-bounded LRU of serialized response bodies with hit/miss counters"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, shared_url=None, shared_ttl=300, namespace='civicscoop'):
+        self.max_bytes = max_bytes
+        self.shared_ttl = shared_ttl
+        self.namespace = namespace
+        self._entries = OrderedDict()  # key -> (CacheEntry, tags)
+        self._tags = {}  # tag -> set of keys
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'shared_hits': 0, 'evictions': 0, 'invalidations': 0}
+
+        self._shared = None
+        if shared_url:
+            if redis is None:
+                logger.warning("CACHE_REDIS_URL is set but the redis package is not installed; using the local cache only")
+            else:
+                self._shared = redis.Redis.from_url(shared_url)
+
+    def get(self, key):
+        """Return the cached CacheEntry for ``key`` or None"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return item[0]
+
+        entry = self._shared_get(key)
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['shared_hits'] += 1
+        self._store(key, entry, ())
+        return entry
+
+    def set(self, key, body, etag, tags=(), mimetype='application/json', encoding=None):
+        """Cache ``body`` (bytes) rendered for ``etag`` under ``key``"""
+        entry = CacheEntry(body, etag, mimetype, encoding)
+        self._store(key, entry, tags)
+        self._shared_set(key, entry)
+
+    def invalidate_tags(self, tags):
+        """Drop every entry registered under any of ``tags``"""
+        keys = set()
+        with self._lock:
+            for tag in tags:
+                keys.update(self._tags.pop(tag, ()))
+            for key in keys:
+                self._discard(key)
+            self._stats['invalidations'] += len(keys)
+        self._shared_delete(keys)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['shared_hits'] + self._stats['misses']
+            return dict(
+                self._stats,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hit_ratio=round((self._stats['hits'] + self._stats['shared_hits']) / lookups, 4) if lookups else 0.0,
+                shared=self._shared is not None
+            )
+
+    def _store(self, key, entry, tags):
+        size = len(entry.body)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (entry, tuple(tags))
+            self._bytes += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self._stats['evictions'] += 1
+
+    def _discard(self, key):
+        """Remove one key; the caller holds the lock"""
+        item = self._entries.pop(key, None)
+        if item is None:
+            return
+        entry, tags = item
+        self._bytes -= len(entry.body)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _shared_key(self, key):
+        return f'{self.namespace}:response:{key}'
+
+    def _shared_get(self, key):
+        if self._shared is None:
+            return None
+        try:
+            raw = self._shared.get(self._shared_key(key))
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        etag, mimetype, encoding, body = raw.split(b'\n', 3)
+        return CacheEntry(body, etag.decode(), mimetype.decode(), encoding.decode() or None)
+
+    def _shared_set(self, key, entry):
+        if self._shared is None:
+            return
+        try:
+            header = '\n'.join([entry.etag, entry.mimetype, entry.encoding or '']).encode()
+            self._shared.set(self._shared_key(key), header + b'\n' + entry.body, ex=self.shared_ttl)
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache write failed: {e}")
+
+    def _shared_delete(self, keys):
+        if self._shared is None or not keys:
+            return
+        try:
+            self._shared.delete(*(self._shared_key(key) for key in keys))
+        except redis.RedisError as e:
+            logger.warning(f"Shared cache delete failed: {e}")
@@ -0,0 +1,99 @@
+"""
+Columnar (Parquet / Arrow IPC) dataset writer, built on the optional pyarrow
+package.
+
+Rows are buffered per partition and written in row groups, into hive-style
+``<column>=<value>/part-0.<ext>`` directories that pyarrow.dataset, DuckDB,
+Polars and Spark discover directly. Arrow IPC files are written uncompressed
+so readers can memory-map them.
+"""
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Columnar export is optional
+    pa = None
+    pq = None
+
+COLUMNAR_FORMATS = {'parquet': 'parquet', 'arrow': 'arrow'}
+
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+
+def require_pyarrow():
+    if pa is None:
+        raise RuntimeError("Columnar export requires the pyarrow package (pip install pyarrow)")
+
+
+class PartitionedWriter:
+    """Write rows (dicts) into one file per partition value, a row group at a time"""
+
+    def __init__(self, root, schema, fmt='parquet', partition_column=None, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        require_pyarrow()
+        if fmt not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format '{fmt}'")
+        self.root = root
+        self.schema = schema
+        self.fmt = fmt
+        self.partition_column = partition_column
+        self.row_group_size = row_group_size
+        self._buffers = {}  # partition -> {column: [values]}
+        self._writers = {}  # partition -> (writer, sink)
+        self.rows = {}  # partition -> rows written
+
+    def write(self, row, partition=None):
+        buffer = self._buffers.get(partition)
+        if buffer is None:
+            buffer = self._buffers[partition] = {name: [] for name in self.schema.names}
+        for name, values in buffer.items():
+            values.append(row.get(name))
+        if len(buffer[self.schema.names[0]]) >= self.row_group_size:
+            self._flush(partition)
+
+    def close(self):
+        """Flush remaining rows and close every file; returns {path: rows}"""
+        for partition in list(self._buffers):
+            self._flush(partition)
+        if not self._writers:
+            # An empty dataset still gets one (unpartitioned) file carrying its schema
+            self._writer(None)
+            self.rows[None] = 0
+        written = {}
+        for partition, (writer, sink) in self._writers.items():
+            writer.close()
+            if sink is not None:
+                sink.close()
+            written[self._path(partition)] = self.rows[partition]
+        self._writers.clear()
+        return written
+
+    def _flush(self, partition):
+        buffer = self._buffers.pop(partition)
+        count = len(buffer[self.schema.names[0]])
+        if not count:
+            return
+        batch = pa.RecordBatch.from_pydict(buffer, schema=self.schema)
+        writer, _ = self._writer(partition)
+        if self.fmt == 'parquet':
+            writer.write_batch(batch, row_group_size=self.row_group_size)
+        else:
+            writer.write_batch(batch)
+        self.rows[partition] = self.rows.get(partition, 0) + count
+
+    def _writer(self, partition):
+        if partition not in self._writers:
+            path = self._path(partition)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if self.fmt == 'parquet':
+                self._writers[partition] = (pq.ParquetWriter(path, self.schema, compression='zstd'), None)
+            else:
+                sink = pa.OSFile(path, 'wb')
+                self._writers[partition] = (pa.ipc.new_file(sink, self.schema), sink)
+        return self._writers[partition]
+
+    def _path(self, partition):
+        directory = self.root
+        if self.partition_column is not None and partition is not None:
+            directory = os.path.join(directory, f'{self.partition_column}={partition}')
+        return os.path.join(directory, f'part-0.{COLUMNAR_FORMATS[self.fmt]}')
@@ -0,0 +1,97 @@
+"""
+Meeting date normalization.
+
+Recognizes the date formats found on council meeting pages ("August 15,
+2024", "Aug. 15 2024", "08/15/2024", "8-15-2024", "2024-08-15") and turns
+them into datetimes, so meeting dates can be stored in an indexed DateTime
+column and range-queried.
+"""
+from datetime import datetime, timedelta
+import re
+
+MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ('january', 'jan'), ('february', 'feb'), ('march', 'mar'), ('april', 'apr'), ('may',),
+        ('june', 'jun'), ('july', 'jul'), ('august', 'aug'), ('september', 'sep', 'sept'),
+        ('october', 'oct'), ('november', 'nov'), ('december', 'dec')
+    ], 1)
+    for name in names
+}
+
+# In priority order, like MeetingAnalyzer._extract_date: written-out dates are the most reliable
+_MONTH_NAME_PATTERN = re.compile(
+    r'\b(' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b',
+    re.IGNORECASE
+)
+_US_NUMERIC_PATTERN = re.compile(r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{4})\b')
+_ISO_PATTERN = re.compile(r'\b(\d{4})-(\d{2})-(\d{2})\b')
+
+
+def _month_name_date(match):
+    return MONTHS[match.group(1).lower()], int(match.group(2)), int(match.group(3))
+
+
+def _us_numeric_date(match):
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def _iso_date(match):
+    return int(match.group(2)), int(match.group(3)), int(match.group(1))
+
+
+_PATTERNS = (
+    (_MONTH_NAME_PATTERN, _month_name_date),
+    (_US_NUMERIC_PATTERN, _us_numeric_date),
+    (_ISO_PATTERN, _iso_date),
+)
+
+
+def find_meeting_date(text):
+    """
+    Return the first valid date found in ``text`` as a datetime, or None
+
+    Patterns are tried in priority order; matches that are not real
+    calendar dates (such as 13/45/2024) are skipped.
+    """
+    for pattern, extract in _PATTERNS:
+        for match in pattern.finditer(text or ''):
+            month, day, year = extract(match)
+            try:
+                return datetime(year, month, day)
+            except ValueError:
+                continue
+    return None
+
+
+def parse_meeting_date(value):
+    """Normalize a stored or user-supplied date string (any supported format) to a datetime, or None"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.strip())
+    except ValueError:
+        return find_meeting_date(value)
+
+
+def parse_range_bound(value, end=False):
+    """
+    Parse a ``from``/``to`` query parameter
+
+    A bare date used as an ``end`` bound covers that whole day, so
+    ``to=2024-08-15`` includes meetings at any time on the 15th.
+
+    Returns:
+        datetime or None; the caller treats ``end`` bounds as exclusive
+
+    Raises:
+        ValueError: if the value is not a recognizable date
+    """
+    if not value:
+        return None
+    parsed = parse_meeting_date(value)
+    if parsed is None:
+        raise ValueError(f"Unrecognized date '{value}'")
+    if end and ':' not in value:
+        parsed += timedelta(days=1)
+    return parsed
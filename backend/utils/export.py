@@ -0,0 +1,64 @@
+"""
+Streaming NDJSON and CSV encoders for table exports.
+
+Both take an iterable of rows (anything indexable by position, such as
+SQLAlchemy rows) and yield encoded chunks of roughly ``chunk_size`` bytes.
+Only one chunk is held in memory at a time, however many rows there are.
+"""
+import csv
+from datetime import date, datetime
+import io
+
+from utils.serialization import dumps, dumps_text, load_column
+
+CHUNK_SIZE = 64 * 1024
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+
+def iter_ndjson(rows, fields, json_fields=(), chunk_size=CHUNK_SIZE):
+    """
+    Yield NDJSON bytes, one object per row
+
+    ``json_fields`` hold JSON text in the database and are embedded decoded.
+    """
+    decode = [field in json_fields for field in fields]
+    buffer = bytearray()
+    for row in rows:
+        record = {
+            field: load_column(value, None) if is_json else value
+            for field, value, is_json in zip(fields, row, decode)
+        }
+        buffer += dumps(record)
+        buffer += b'\n'
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_csv(rows, fields, chunk_size=CHUNK_SIZE):
+    """Yield UTF-8 CSV with a header row; JSON columns are kept as JSON text"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return dumps_text(value)
+    return value
@@ -0,0 +1,179 @@
+"""
+Memoized decoding of JSON columns on model instances.
+
+``memoized`` decodes a column once per instance and hands back the same
+list or dict on every later call, so repeated ``get_*`` calls skip JSON
+parsing and decompression. Callers may mutate the returned value in place:
+it is built from ``TrackedList`` and ``TrackedDict`` containers (at every
+nesting level) that mark their cache entry dirty when changed, in the
+manner of SQLAlchemy's MutableList/MutableDict. The first change also flags
+the instance dirty in its session, so autoflush and commit run the flush
+hook. ``flush_mutations``, run before each flush, writes dirty entries back
+through the model's setter and skips clean ones with a flag check, without
+decoding or encoding anything.
+
+Entries are dropped by the model's ``set_*`` (``forget``) and whenever the
+instance is expired or refreshed, so a cache never outlives the row
+version it was decoded from.
+"""
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import flag_dirty
+
+MEMO_ATTRIBUTE = '_decoded_columns'
+
+
+class MemoEntry:
+    """Cached value of one column, and whether it was mutated since it was decoded"""
+    __slots__ = ('instance', 'value', 'store', 'dirty')
+
+    def __init__(self, instance, value, store):
+        self.instance = instance
+        self.value = value
+        self.store = store
+        self.dirty = False
+
+    def changed(self):
+        if self.dirty:
+            return
+        self.dirty = True
+        if inspect(self.instance, raiseerr=False) is not None:  # Mapped: make the session flush
+            flag_dirty(self.instance)
+
+
+def track(value, entry):
+    """Copy of ``value`` whose lists and dicts, however deeply nested, mark ``entry`` dirty when mutated"""
+    if isinstance(value, dict):
+        return TrackedDict(entry, value)
+    if isinstance(value, list):
+        return TrackedList(entry, value)
+    return value
+
+
+def _changes(method):
+    def changed(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._entry.changed()
+        return result
+    changed.__name__ = method.__name__
+    return changed
+
+
+class TrackedList(list):
+    """list that marks its memo entry dirty on every in-place change"""
+
+    def __init__(self, entry, items=()):
+        self._entry = entry
+        super().__init__(track(item, entry) for item in items)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [track(item, self._entry) for item in value]
+        else:
+            value = track(value, self._entry)
+        super().__setitem__(index, value)
+        self._entry.changed()
+
+    def append(self, value):
+        super().append(track(value, self._entry))
+        self._entry.changed()
+
+    def insert(self, index, value):
+        super().insert(index, track(value, self._entry))
+        self._entry.changed()
+
+    def extend(self, values):
+        super().extend(track(value, self._entry) for value in values)
+        self._entry.changed()
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    __delitem__ = _changes(list.__delitem__)
+    __imul__ = _changes(list.__imul__)
+    pop = _changes(list.pop)
+    remove = _changes(list.remove)
+    clear = _changes(list.clear)
+    sort = _changes(list.sort)
+    reverse = _changes(list.reverse)
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+
+class TrackedDict(dict):
+    """dict that marks its memo entry dirty on every in-place change"""
+
+    def __init__(self, entry, items=()):
+        self._entry = entry
+        super().__init__((key, track(value, entry)) for key, value in dict(items).items())
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, track(value, self._entry))
+        self._entry.changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    __delitem__ = _changes(dict.__delitem__)
+    pop = _changes(dict.pop)
+    popitem = _changes(dict.popitem)
+    clear = _changes(dict.clear)
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self),)
+
+
+def memoized(instance, field, decode, store):
+    """
+    Return the cached decoded value of ``field``, decoding it on first use
+
+    Args:
+        decode: zero-argument callable returning the value decoded from the
+            stored column
+        store: callable writing a value back, the model's ``set_*`` method
+    """
+    cache = instance.__dict__.setdefault(MEMO_ATTRIBUTE, {})
+    entry = cache.get(field)
+    if entry is None:
+        entry = cache[field] = MemoEntry(instance, None, store)
+        entry.value = track(decode(), entry)
+    return entry.value
+
+
+def forget(instance, fields=None):
+    """Drop cached values (all of them when ``fields`` is None)"""
+    cache = instance.__dict__.get(MEMO_ATTRIBUTE)
+    if not cache:
+        return
+    if fields is None:
+        cache.clear()
+    else:
+        for field in fields:
+            cache.pop(field, None)
+
+
+def flush_mutations(session):
+    """Write back cached values that were mutated in place; returns how many were written"""
+    written = 0
+    for instance in list(session.identity_map.values()) + list(session.new):
+        cache = instance.__dict__.get(MEMO_ATTRIBUTE)
+        if not cache:
+            continue
+        for field, entry in [(field, entry) for field, entry in cache.items() if entry.dirty]:
+            entry.store(entry.value)
+            # The setter forgets the entry; keep it, now matching the column, so references stay tracked
+            entry.dirty = False
+            cache[field] = entry
+            written += 1
+    return written
@@ -0,0 +1,168 @@
+"""
+Lightweight schema migrations for the CivicScoop database.
+
+Migrations are plain functions registered with an increasing version number.
+Applied versions are recorded in the ``schema_migrations`` table, so running
+``upgrade`` against an existing production database only applies what is
+missing and upgrades it in place.
+
+A migration that needs to rebuild derived data (rollups, search indexes...)
+through the application's models returns that rebuild function instead of
+calling it. Rebuilds run once, after every pending migration has brought the
+schema up to date, and the migrations requesting them are only recorded as
+applied once the rebuild has succeeded. Migrations must therefore be safe to
+re-run.
+"""
+from datetime import datetime
+import logging
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, text
+
+logger = logging.getLogger(__name__)
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    'schema_migrations', _metadata,
+    Column('version', Integer, primary_key=True),
+    Column('description', String(200), nullable=False),
+    Column('applied_at', DateTime, nullable=False, default=datetime.utcnow)
+)
+
+
+class Migrations:
+    """Ordered registry of schema migrations"""
+
+    def __init__(self):
+        self._migrations = {}
+
+    def register(self, version, description):
+        """Decorator registering ``fn(session)`` as migration ``version``"""
+        def decorator(fn):
+            if version in self._migrations:
+                raise ValueError(f"Duplicate migration version {version}")
+            self._migrations[version] = (description, fn)
+            return fn
+        return decorator
+
+    @property
+    def latest_version(self):
+        return max(self._migrations, default=0)
+
+    def applied_versions(self, session):
+        """Return the set of migration versions recorded in the database"""
+        schema_migrations.create(session.connection(), checkfirst=True)
+        return {row.version for row in session.execute(schema_migrations.select())}
+
+    def pending(self, session):
+        """List (version, description) for migrations not yet applied"""
+        applied = self.applied_versions(session)
+        return [
+            (version, self._migrations[version][0])
+            for version in sorted(self._migrations)
+            if version not in applied
+        ]
+
+    def upgrade(self, session, stamp_only=False):
+        """
+        Apply pending migrations in version order
+
+        Args:
+            session: SQLAlchemy session bound to the target database
+            stamp_only (bool): record migrations as applied without running them,
+                used for databases freshly created from the current models
+
+        Returns:
+            list: versions that were applied
+        """
+        applied = []
+        deferred = []  # (version, description) waiting on a post-upgrade rebuild
+        rebuilds = []
+
+        for version, description in self.pending(session):
+            rebuild = None
+            if not stamp_only:
+                logger.info(f"Applying migration {version}: {description}")
+                rebuild = self._migrations[version][1](session)
+
+            if rebuild is None:
+                self._record(session, version, description)
+                applied.append(version)
+            else:
+                session.commit()
+                deferred.append((version, description))
+                if rebuild not in rebuilds:
+                    rebuilds.append(rebuild)
+
+        for rebuild in rebuilds:
+            logger.info(f"Running post-migration rebuild {rebuild.__name__}")
+            rebuild()
+        for version, description in deferred:
+            self._record(session, version, description)
+            applied.append(version)
+
+        return sorted(applied)
+
+    def _record(self, session, version, description):
+        session.execute(schema_migrations.insert().values(
+            version=version, description=description, applied_at=datetime.utcnow()
+        ))
+        session.commit()
+
+
+def has_table(connection, table_name):
+    return inspect(connection).has_table(table_name)
+
+
+def has_column(connection, table_name, column_name):
+    return any(column['name'] == column_name for column in inspect(connection).get_columns(table_name))
+
+
+def add_column(connection, table, column_name):
+    """Add ``table.c[column_name]`` to an existing table unless it is already there"""
+    if has_column(connection, table.name, column_name):
+        return False
+
+    column = table.c[column_name]
+    column_type = column.type.compile(dialect=connection.dialect)
+    ddl = f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+    if column.default is not None and column.default.is_scalar:
+        ddl += f" DEFAULT {_literal(column.default.arg)}"
+    connection.execute(text(ddl))
+    return True
+
+
+def drop_column(connection, table_name, column_name):
+    """Drop a column (SQLite 3.35+) unless it is already gone"""
+    if not has_column(connection, table_name, column_name):
+        return False
+    connection.execute(text(f'ALTER TABLE {table_name} DROP COLUMN {column_name}'))
+    return True
+
+
+def create_indexes(connection, table, names=None):
+    """
+    Create the table's declared indexes that are missing
+
+    Args:
+        names (iterable, optional): restrict to these index names, so a migration
+            keeps creating the same indexes as models gain new ones later
+    """
+    existing = {index['name'] for index in inspect(connection).get_indexes(table.name)}
+    wanted = set(names) if names is not None else None
+    created = []
+    for index in sorted(table.indexes, key=lambda index: index.name):
+        if wanted is not None and index.name not in wanted:
+            continue
+        if index.name not in existing:
+            index.create(connection)
+            created.append(index.name)
+    return created
+
+
+def _literal(value):
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    return str(value)
@@ -0,0 +1,81 @@
+"""
+MinHash signatures and LSH banding for near-duplicate page detection.
+
+A page is reduced to the set of its word shingles (runs of SHINGLE_SIZE
+words), and the set to NUM_PERM minimum hash values. The fraction of equal
+positions in two signatures estimates the Jaccard similarity of the two
+shingle sets, so mirrors of one agenda (print views, HTML and PDF twins)
+match even when their navigation and boilerplate differ.
+
+For lookup the signature is cut into BANDS bands of ROWS values, and each
+band is hashed to a bucket key. Pages that share any bucket are candidates;
+with 16 bands of 8 rows a pair at similarity 0.85 shares one with
+probability 0.99, a pair at 0.5 with probability 0.06. Candidates are then
+checked against their full signatures, so a lookup reads a few index
+entries instead of every stored signature.
+"""
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Fixed seed: signatures are stored, so the permutations must never change
+_rng = np.random.RandomState(1)
+_A = _rng.randint(1, 1 << 31, size=NUM_PERM).astype(np.uint64)
+_B = _rng.randint(0, 1 << 31, size=NUM_PERM).astype(np.uint64)
+
+_CHUNK = 4096
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def shingles(text):
+    """32-bit hashes of the word shingles of ``text``"""
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        words = words + [''] * (SHINGLE_SIZE - len(words))
+    return {
+        zlib.crc32(' '.join(words[i:i + SHINGLE_SIZE]).encode('utf-8'))
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def signature(text):
+    """MinHash signature of ``text``, as a uint32 array of NUM_PERM values"""
+    hashes = np.fromiter(shingles(text), dtype=np.uint64)
+    result = np.full(NUM_PERM, _MAX_HASH, dtype=np.uint64)
+    for start in range(0, len(hashes), _CHUNK):  # Bounds the (shingles x NUM_PERM) matrix on long pages
+        # (a * x + b) mod p for every permutation and shingle; a, x < 2**32 so nothing overflows
+        permuted = (np.outer(hashes[start:start + _CHUNK], _A) + _B) % _MERSENNE_PRIME & _MAX_HASH
+        np.minimum(result, permuted.min(axis=0), out=result)
+    return result.astype(np.uint32)
+
+
+def similarity(first, second):
+    """Estimated Jaccard similarity of the pages behind two signatures"""
+    return float(np.count_nonzero(first == second)) / NUM_PERM
+
+
+def band_keys(sig):
+    """(band, bucket) pairs indexing ``sig``; buckets are signed 64-bit ints"""
+    return [
+        (band, int.from_bytes(hashlib.blake2b(sig[band * ROWS:(band + 1) * ROWS].tobytes(), digest_size=8).digest(),
+                              'little', signed=True))
+        for band in range(BANDS)
+    ]
+
+
+def encode_signature(sig):
+    return np.asarray(sig, dtype='<u4').tobytes()
+
+
+def decode_signature(data):
+    return np.frombuffer(data, dtype='<u4')
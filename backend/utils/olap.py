@@ -0,0 +1,198 @@
+"""
+Embedded analytical query engine over columnar snapshots of the database.
+
+Predefined metrics run in DuckDB (optional dependency) against the Parquet
+datasets written by ``export_columnar``: ``meetings``, ``meeting_topics`` and
+``analytics_rollup``. Scans are columnar and vectorized, so aggregations over
+years of meetings stay interactive, and they never touch the SQLite database
+that serves writes. The snapshot is refreshed by swapping in a new directory;
+the engine notices the swap and reopens its views.
+"""
+from datetime import date, datetime
+import os
+import threading
+import time
+
+try:
+    import duckdb
+except ImportError:  # The analytics engine is optional
+    duckdb = None
+
+DATASETS = ('meetings', 'meeting_topics', 'analytics_rollup')
+SNAPSHOT_MARKER = '_SNAPSHOT'  # Written last; holds the snapshot's creation time
+
+GRANULARITIES = ('day', 'week', 'month', 'quarter', 'year')
+
+
+class AnalyticsUnavailable(Exception):
+    """DuckDB is not installed or no snapshot has been built yet"""
+
+
+class MetricError(ValueError):
+    """Unknown metric or invalid metric parameters"""
+
+
+def _filters(params, table='m'):
+    """WHERE clause and parameters for the filters shared by every metric"""
+    clauses, values = [], []
+    if params.get('from'):
+        clauses.append(f'{table}.date >= ?')
+        values.append(params['from'])
+    if params.get('to'):
+        clauses.append(f'{table}.date < ?')
+        values.append(params['to'])
+    if params.get('location'):
+        clauses.append(f'{table}.location = ?')
+        values.append(params['location'])
+    if params.get('priority'):
+        clauses.append(f'{table}.priority = ?')
+        values.append(params['priority'])
+    if params.get('topic'):
+        clauses.append(f'{table}.id IN (SELECT meeting_id FROM meeting_topics WHERE topic = ?)')
+        values.append(params['topic'])
+    return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', values
+
+
+def _kpis(params):
+    where, values = _filters(params)
+    return (
+        "SELECT count(*) AS meetings, count(DISTINCT m.location) AS locations, "
+        "round(avg(m.ai_accuracy), 2) AS avg_ai_accuracy, round(avg(m.engagement), 2) AS avg_engagement, "
+        f"round(avg(m.priority_score), 2) AS avg_priority_score FROM meetings m{where}",
+        values
+    )
+
+
+def _trend(params):
+    granularity = params.get('granularity') or 'month'
+    if granularity not in GRANULARITIES:
+        raise MetricError(f"granularity must be one of {', '.join(GRANULARITIES)}")
+    where, values = _filters(params)
+    return (
+        f"SELECT CAST(date_trunc('{granularity}', m.date) AS DATE) AS period, count(*) AS meetings, "
+        "round(avg(m.engagement), 2) AS avg_engagement, round(avg(m.ai_accuracy), 2) AS avg_ai_accuracy "
+        f"FROM meetings m{where} GROUP BY period ORDER BY period",
+        values
+    )
+
+
+def _topic_distribution(params):
+    where, values = _filters(params)
+    return (
+        "SELECT t.topic, count(DISTINCT t.meeting_id) AS meetings "
+        f"FROM meeting_topics t JOIN meetings m ON m.id = t.meeting_id{where} "
+        "GROUP BY t.topic ORDER BY meetings DESC, t.topic LIMIT ?",
+        values + [params.get('limit') or 20]
+    )
+
+
+def _heatmap(params):
+    # ``date`` has no time of day; ``created_at`` is when the meeting was added
+    where, values = _filters(params)
+    return (
+        "SELECT isodow(m.created_at) AS day_of_week, hour(m.created_at) AS hour, count(*) AS meetings "
+        f"FROM meetings m{where} GROUP BY day_of_week, hour ORDER BY day_of_week, hour",
+        values
+    )
+
+
+def _location_performance(params):
+    where, values = _filters(params)
+    return (
+        "SELECT m.location, count(*) AS meetings, round(avg(m.engagement), 2) AS avg_engagement, "
+        "round(avg(m.ai_accuracy), 2) AS avg_ai_accuracy, round(avg(m.priority_score), 2) AS avg_priority_score "
+        f"FROM meetings m{where} GROUP BY m.location ORDER BY meetings DESC, m.location LIMIT ?",
+        values + [params.get('limit') or 20]
+    )
+
+
+def _priority_engagement(params):
+    where, values = _filters(params)
+    return (
+        "SELECT m.id, m.title, m.location, m.priority, m.priority_score, m.engagement "
+        f"FROM meetings m{where} ORDER BY m.date DESC LIMIT ?",
+        values + [params.get('limit') or 500]
+    )
+
+
+# name -> builder(params) returning (sql, parameters)
+METRICS = {
+    'kpis': _kpis,
+    'trend': _trend,
+    'topic_distribution': _topic_distribution,
+    'heatmap': _heatmap,
+    'location_performance': _location_performance,
+    'priority_engagement': _priority_engagement
+}
+
+
+class AnalyticsEngine:
+    """Runs predefined metrics against the snapshot in ``snapshot_dir``"""
+
+    def __init__(self, snapshot_dir):
+        self.snapshot_dir = snapshot_dir
+        self._lock = threading.Lock()
+        self._connection = None
+        self._snapshot_stamp = None
+
+    def snapshot_info(self):
+        """Creation time of the current snapshot, or None if there is none"""
+        try:
+            with open(os.path.join(self.snapshot_dir, SNAPSHOT_MARKER)) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def query(self, metric, params):
+        """
+        Run ``metric`` with filter ``params``
+
+        Returns:
+            dict: metric name, column names, rows, snapshot time and elapsed ms
+        """
+        builder = METRICS.get(metric)
+        if builder is None:
+            raise MetricError(f"Unknown metric '{metric}'; available: {', '.join(sorted(METRICS))}")
+        sql, values = builder(params)
+
+        start = time.perf_counter()
+        cursor = self._cursor()
+        try:
+            result = cursor.execute(sql, values)
+            columns = [column[0] for column in result.description]
+            rows = [[_to_builtin(value) for value in row] for row in result.fetchall()]
+        finally:
+            cursor.close()
+        return {
+            'metric': metric,
+            'columns': columns,
+            'rows': rows,
+            'snapshot': self._snapshot_stamp,
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 2)
+        }
+
+    def _cursor(self):
+        """A per-query cursor on a connection whose views match the current snapshot"""
+        if duckdb is None:
+            raise AnalyticsUnavailable("The analytics engine requires the duckdb package (pip install duckdb)")
+        stamp = self.snapshot_info()
+        if stamp is None:
+            raise AnalyticsUnavailable("No analytics snapshot yet; run `flask --app app analytics snapshot`")
+
+        with self._lock:
+            if self._connection is None or stamp != self._snapshot_stamp:
+                connection = duckdb.connect()
+                for dataset in DATASETS:
+                    pattern = os.path.join(self.snapshot_dir, dataset, '**', '*.parquet').replace("'", "''")
+                    connection.execute(
+                        f"CREATE VIEW {dataset} AS SELECT * FROM read_parquet('{pattern}', hive_partitioning = false)"
+                    )
+                self._connection = connection  # Cursors still open on the old one keep it alive
+                self._snapshot_stamp = stamp
+            return self._connection.cursor()
+
+
+def _to_builtin(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
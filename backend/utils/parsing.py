@@ -0,0 +1,29 @@
+"""
+Parsers for the numeric values the analyzer stores as display strings,
+such as "85.3% high engagement" or "22:15 high segments".
+"""
+import re
+
+_PERCENT_PATTERN = re.compile(r'(-?\d+(?:\.\d+)?)\s*%')
+_DURATION_PATTERN = re.compile(r'(\d+):(\d{1,2})(?::(\d{1,2}))?')
+
+
+def parse_percent(text):
+    """Return the first percentage in ``text`` as a float, or None"""
+    match = _PERCENT_PATTERN.search(text or '')
+    return float(match.group(1)) if match else None
+
+
+def parse_duration(text):
+    """
+    Return the first m:ss (or h:mm:ss) duration in ``text`` in seconds, or None
+
+    "22:15 high segments" is 22 minutes 15 seconds.
+    """
+    match = _DURATION_PATTERN.search(text or '')
+    if not match:
+        return None
+    first, second, third = match.groups()
+    if third is None:
+        return int(first) * 60 + int(second)
+    return int(first) * 3600 + int(second) * 60 + int(third)
@@ -0,0 +1,212 @@
+"""
+Names of council members, officials and speakers found in meeting pages.
+
+Names are taken from titled mentions ("Council Member Jane Smith", "Mayor
+Adler") and roll calls ("Present: ..."), and normalized before they are
+compared: titles, honorifics and punctuation are dropped and case folded,
+so "Councilmember J. Smith" keys as "j smith".
+
+Matching a name against known people only looks at its block, the people
+whose surname starts with the same two letters, so resolution reads a
+handful of rows however many people are stored. Within the block two names
+match when their surnames are at least NAME_MATCH_CUTOFF similar (difflib,
+which absorbs OCR and spelling slips such as "Smyth") and their given names
+are compatible: equal, an initial of one another, similar by the same
+cutoff, or missing from one of them ("Smith" and "Jane Smith").
+"""
+import difflib
+import re
+
+NAME_MATCH_CUTOFF = 0.8
+
+# Participants kept per meeting
+MAX_PARTICIPANTS = 50
+
+# Title as written (lowercased, spaces collapsed) -> role
+ROLES = {
+    'mayor pro tem': 'Mayor Pro Tem',
+    'deputy mayor': 'Deputy Mayor',
+    'vice mayor': 'Vice Mayor',
+    'mayor': 'Mayor',
+    'council member': 'Council Member',
+    'councilmember': 'Council Member',
+    'councilman': 'Council Member',
+    'councilwoman': 'Council Member',
+    'councilor': 'Council Member',
+    'councillor': 'Council Member',
+    'alderman': 'Alderperson',
+    'alderwoman': 'Alderperson',
+    'alderperson': 'Alderperson',
+    'supervisor': 'Supervisor',
+    'commissioner': 'Commissioner',
+    'vice chair': 'Vice Chair',
+    'chairman': 'Chair',
+    'chairwoman': 'Chair',
+    'chairperson': 'Chair',
+    'chair': 'Chair',
+    'city manager': 'City Manager',
+    'city attorney': 'City Attorney',
+    'city clerk': 'City Clerk',
+    'director': 'Director',
+}
+
+_TITLE = (r'(?i:mayor\s+pro\s+tem|deputy\s+mayor|vice\s+mayor|mayor|council\s*(?:member|man|woman)s?|'
+          r'council+ors?|alder(?:man|men|woman|women|persons?)|supervisors?|commissioners?|vice\s+chair|'
+          r'chair(?:man|woman|person)?|city\s+(?:manager|attorney|clerk)|directors?)')
+_NAME_WORD = r"[A-Z][A-Za-z'\-]*[a-z]"
+_NAME = rf"(?:(?:{_NAME_WORD}|[A-Z]\.)[ \t]+){{0,2}}{_NAME_WORD}"
+
+_TITLED_NAME = re.compile(rf'\b(?P<title>{_TITLE})[ \t]+(?P<name>{_NAME})')
+_SPEECH_VERB = re.compile(r'\s+(?:said|says|stated|asked|noted|added|announced|argued|explained|replied|'
+                          r'remarked|emphasized|urged|warned)\b')
+_ROLL_CALL = re.compile(r'(?i:present|attending|in attendance|roll call)[ \t]*:[ \t]*(?P<names>[^\n]+)')
+_ROLL_CALL_SEPARATOR = re.compile(r'\s*(?:[,;]|\band\b)\s*')
+_BARE_NAME = re.compile(rf'(?P<title>{_TITLE})?[ \t]*(?P<name>{_NAME})$')
+_HONORIFICS = re.compile(r"^(?:(?:mr|mrs|ms|dr|hon)\.?\s+)+", re.IGNORECASE)
+_LEADING_TITLE = re.compile(rf'^{_TITLE}\s+')
+_SUFFIXES = frozenset(('jr', 'sr', 'ii', 'iii', 'iv'))
+_NON_NAME = re.compile(r"[^\w'\- ]+")
+
+# Capitalized words that end a name: headings and agenda vocabulary that follows titled names
+_STOP_WORDS = frozenset("""
+absent abstain abstained agenda and aye ayes city council item meeting motion moved nay nays no present
+seconded staff the vote voted yes
+""".split())
+
+
+def role_for(title):
+    """Role for a title as written, e.g. "Councilwoman" -> "Council Member" """
+    title = ' '.join(title.lower().split())
+    if title not in ROLES and title.endswith('s'):  # Plural titles in roll calls
+        title = {'aldermen': 'alderman', 'alderwomen': 'alderwoman'}.get(title, title[:-1])
+    return ROLES.get(title, title.title())
+
+
+def normalize_name(name):
+    """Display form of a name: titles, honorifics, suffixes and stray punctuation removed, whitespace collapsed"""
+    name = _HONORIFICS.sub('', _LEADING_TITLE.sub('', _HONORIFICS.sub('', name.strip())))
+    words = []
+    for word in _NON_NAME.sub(' ', name.replace('.', '. ')).split():
+        if word.lower().strip("'-") in _STOP_WORDS:
+            break
+        if word.lower() not in _SUFFIXES:
+            words.append(word)
+    # An initial keeps its period: "J. Smith"
+    return ' '.join(f'{word}.' if len(word) == 1 else word for word in words)
+
+
+def name_key(name):
+    """Case-folded, punctuation-free form of a normalized name, what people are matched on"""
+    return ' '.join(word.strip("'-") for word in name.lower().replace('.', ' ').split())
+
+
+def name_block(key):
+    """Blocking key of a name key: the first two letters of its surname"""
+    return ''.join(letter for letter in key.split()[-1] if letter.isalpha())[:2]
+
+
+def _given_names_match(first, second):
+    for one, other in zip(first, second):
+        if one == other or (len(one) == 1 and other.startswith(one)) or (len(other) == 1 and one.startswith(other)):
+            continue
+        if min(len(one), len(other)) == 1 or difflib.SequenceMatcher(None, one, other).ratio() < NAME_MATCH_CUTOFF:
+            return False
+    return True
+
+
+def name_similarity(key, other):
+    """
+    How closely two name keys match, from 0 to 1
+
+    Returns:
+        float: 1.0 for equal keys, the difflib ratio of the two keys when they
+        match (see the module docstring), 0.0 when they do not
+    """
+    if key == other:
+        return 1.0
+    first, second = key.split(), other.split()
+    if difflib.SequenceMatcher(None, first[-1], second[-1]).ratio() < NAME_MATCH_CUTOFF:
+        return 0.0
+    if not _given_names_match(first[:-1], second[:-1]):
+        return 0.0
+    return difflib.SequenceMatcher(None, key, other).ratio()
+
+
+def _participant(title, name):
+    name = normalize_name(name)
+    if not name or len(name_key(name).split()[-1]) < 2:
+        return None
+    return {'name': name, 'role': role_for(title) if title else None}
+
+
+def extract_participants(content):
+    """
+    People named in a page, in order of first mention
+
+    Returns:
+        list: {'name', 'role'} dicts, one per distinct name key, at most
+        MAX_PARTICIPANTS; ``role`` is None for untitled roll call entries
+    """
+    found = {}
+
+    def add(participant):
+        if participant is None:
+            return
+        key = name_key(participant['name'])
+        if key not in found:
+            found[key] = participant
+        elif found[key]['role'] is None:
+            found[key]['role'] = participant['role']
+
+    for match in _TITLED_NAME.finditer(content):
+        add(_participant(match.group('title'), match.group('name')))
+    for match in _ROLL_CALL.finditer(content):
+        title = None  # Roll calls group names under one title: "Council Members Lee, Wu and Diaz"
+        for entry in _ROLL_CALL_SEPARATOR.split(match.group('names').strip(' .')):
+            bare = _HONORIFICS.sub('', entry.strip())
+            if bare != entry.strip():  # "Ms. Diaz" is not under the preceding title
+                title = None
+            entry = _BARE_NAME.match(bare)
+            if entry is not None:
+                title = entry.group('title') or title
+                add(_participant(title, entry.group('name')))
+    return list(found.values())[:MAX_PARTICIPANTS]
+
+
+def find_speaker(sentence):
+    """
+    Who ``sentence`` quotes: the titled name followed by a speech verb
+    ("Council Member Smith said"), else the first titled name
+
+    Returns:
+        dict: {'name', 'role'}, or None when the sentence names nobody
+    """
+    first = None
+    for match in _TITLED_NAME.finditer(sentence):
+        participant = _participant(match.group('title'), match.group('name'))
+        if participant is not None:
+            if _SPEECH_VERB.match(sentence, match.end()):
+                return participant
+            first = first or participant
+    return first
+
+
+def clean_participants(items):
+    """
+    Participants from an untrusted list (an imported analysis), normalized
+
+    Entries that are not objects with a usable ``name`` are dropped.
+
+    Returns:
+        list: {'name', 'role', 'quoted'} dicts, at most MAX_PARTICIPANTS
+    """
+    participants = []
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict) or not isinstance(item.get('name'), str):
+            continue
+        name = normalize_name(item['name'])
+        if name_key(name):
+            role = item.get('role')
+            participants.append({'name': name, 'role': role if isinstance(role, str) else None,
+                                 'quoted': bool(item.get('quoted'))})
+    return participants[:MAX_PARTICIPANTS]
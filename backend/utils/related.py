@@ -0,0 +1,46 @@
+"""
+Term weighting for the "related meetings" TF-IDF index.
+
+Documents are reduced to sparse vectors of (1 + log tf) term weights; idf is
+applied from the current document frequencies when a document is indexed
+(for its norm) and when a query is scored, so adding documents never
+requires rewriting the postings of others. Similarity is the cosine of the
+two tf-idf vectors, computed only over the postings of the query's terms.
+"""
+import math
+import re
+from collections import Counter
+
+_TOKEN_PATTERN = re.compile(r'[^\W\d_]{3,}')
+
+STOPWORDS = frozenset("""
+about above after again against all also and any are because been before being below between both but
+can could did does doing down during each few for from further had has have having her here hers herself
+him himself his how into its itself just more most not now off once only other our ours out over own
+same she should some such than that the their theirs them then there these they this those through too
+under until very was were what when where which while who whom why will with would you your yours
+meeting meetings council city agenda item items
+""".split())
+
+# Query terms kept, highest weighted first; the rest add little but cost postings reads
+MAX_QUERY_TERMS = 24
+
+
+def tokenize(text):
+    """Lowercased words of three or more letters, without stopwords"""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def term_weights(text):
+    """Sparse (1 + log tf) weights of ``text``, as {term: weight}"""
+    return {term: 1.0 + math.log(count) for term, count in Counter(tokenize(text)).items()}
+
+
+def idf(df, documents):
+    """Smoothed inverse document frequency"""
+    return math.log((1 + documents) / (1 + df)) + 1.0
+
+
+def vector_norm(weights, dfs, documents):
+    """L2 norm of a document's tf-idf vector; ``dfs`` maps each term to its document frequency"""
+    return math.sqrt(sum((weight * idf(dfs[term], documents)) ** 2 for term, weight in weights.items())) or 1.0
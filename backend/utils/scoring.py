@@ -0,0 +1,156 @@
+"""
+Meeting feature vectors and the model that scores them.
+
+The analyzer reduces each page to a short vector of numeric features
+(keyword counts, length, structure flags), stored per meeting as packed
+float32. Priority score and engagement are a linear model over that vector,
+squashed into each score's display range:
+
+    score = low + (high - low) * sigmoid(bias + weights . features)
+
+Scoring a batch is one matrix product, so when the weights change every
+stored meeting can be rescored from its vector without fetching or parsing
+its page again.
+"""
+import json
+import math
+import re
+
+import numpy as np
+
+# Bump when FEATURES or extract_features change; vectors of another version
+# are not rescored until the meeting is re-analyzed
+FEATURE_VERSION = 1
+
+# Keyword groups counted as features, matched as whole words (with plurals)
+TERM_GROUPS = {
+    'critical_terms': ['emergency', 'crisis', 'urgent', 'immediate', 'critical'],
+    'high_terms': ['important', 'significant', 'major', 'priority'],
+    'housing_terms': ['housing', 'affordable', 'homeless', 'rent', 'development'],
+    'budget_terms': ['budget', 'funding', 'finance', 'allocation', 'spending'],
+    'climate_terms': ['climate', 'environment', 'green', 'sustainability', 'carbon'],
+    'transit_terms': ['transit', 'transportation', 'bus', 'rail', 'traffic'],
+    'safety_terms': ['police', 'safety', 'crime', 'emergency', 'security'],
+    'education_terms': ['school', 'education', 'student', 'teacher', 'learning'],
+}
+_TERM_PATTERNS = {
+    name: re.compile(r'\b(?:' + '|'.join(words) + r')(?:e?s)?\b')
+    for name, words in TERM_GROUPS.items()
+}
+_SENTENCE_PATTERN = re.compile(r'[.!?]+')
+_AGENDA_ITEM_PATTERN = re.compile(r'^\s*(?:item\s+)?\d+[.)]\s', re.MULTILINE)
+_MONEY_PATTERN = re.compile(r'\$\s?\d')
+_PUBLIC_COMMENT_PATTERN = re.compile(r'\bpublic (?:comment|hearing|testimony)')
+_VOTE_PATTERN = re.compile(r'\b(?:vote|ordinance|resolution|motion)s?\b')
+
+# Column order of every stored vector
+FEATURES = (
+    'log_words', 'log_sentences', 'title_words', 'log_agenda_items', 'log_money_mentions',
+    'public_comment', 'vote', *TERM_GROUPS
+)
+
+# Display strings derived from each score
+SCORES = ('priority_score', 'engagement')
+
+DEFAULT_WEIGHTS = {
+    'priority_score': {
+        'range': [20, 95],
+        'bias': -2.0,
+        'weights': {
+            'critical_terms': 0.9, 'high_terms': 0.4, 'public_comment': 0.5, 'vote': 0.4,
+            'log_money_mentions': 0.3, 'housing_terms': 0.15, 'budget_terms': 0.15,
+            'safety_terms': 0.15, 'title_words': 0.05
+        }
+    },
+    'engagement': {
+        'range': [25, 85],
+        'bias': -4.0,
+        'weights': {
+            'log_words': 0.5, 'log_agenda_items': 0.3, 'public_comment': 0.6,
+            'housing_terms': 0.1, 'transit_terms': 0.1, 'education_terms': 0.1
+        }
+    }
+}
+
+
+def extract_features(title, text):
+    """Feature vector (list of floats, in FEATURES order) of a meeting page"""
+    lower = text.lower()
+    words = len(text.split())
+    sentences = len([part for part in _SENTENCE_PATTERN.split(text) if part.strip()])
+    values = {
+        'log_words': math.log1p(words),
+        'log_sentences': math.log1p(sentences),
+        'title_words': len(title.split()),
+        'log_agenda_items': math.log1p(len(_AGENDA_ITEM_PATTERN.findall(lower))),
+        'log_money_mentions': math.log1p(len(_MONEY_PATTERN.findall(text))),
+        'public_comment': 1.0 if _PUBLIC_COMMENT_PATTERN.search(lower) else 0.0,
+        'vote': 1.0 if _VOTE_PATTERN.search(lower) else 0.0,
+    }
+    for name, pattern in _TERM_PATTERNS.items():
+        values[name] = math.log1p(len(pattern.findall(lower)))
+    return [float(values[name]) for name in FEATURES]
+
+
+def encode_features(vector):
+    """Pack a feature vector for storage"""
+    return np.asarray(vector, dtype='<f4').tobytes()
+
+
+def decode_features(blobs):
+    """Matrix (rows x FEATURES) of packed vectors, decoded in one pass"""
+    return np.frombuffer(b''.join(blobs), dtype='<f4').reshape(-1, len(FEATURES))
+
+
+def format_priority_score(value):
+    return f"{value:.0f}%"
+
+
+def format_engagement(value):
+    return f"{value:.1f}%"
+
+
+class ScoringModel:
+    """
+    Linear scores over feature vectors
+
+    ``weights`` maps each name in SCORES to ``{'range': [low, high], 'bias':
+    float, 'weights': {feature: float}}``; features without a weight count
+    zero. Defaults to DEFAULT_WEIGHTS.
+    """
+
+    def __init__(self, weights=None):
+        self.weights = weights or DEFAULT_WEIGHTS
+        missing = [name for name in SCORES if name not in self.weights]
+        if missing:
+            raise ValueError(f"Scoring weights are missing: {', '.join(missing)}")
+
+        self.matrix = np.zeros((len(FEATURES), len(SCORES)))
+        self.bias = np.zeros(len(SCORES))
+        self.low = np.zeros(len(SCORES))
+        self.span = np.zeros(len(SCORES))
+        for column, name in enumerate(SCORES):
+            spec = self.weights[name]
+            unknown = sorted(set(spec.get('weights', {})) - set(FEATURES))
+            if unknown:
+                raise ValueError(f"Unknown features in {name} weights: {', '.join(unknown)}")
+            for feature, weight in spec.get('weights', {}).items():
+                self.matrix[FEATURES.index(feature), column] = weight
+            self.bias[column] = spec.get('bias', 0.0)
+            low, high = spec['range']
+            self.low[column], self.span[column] = low, high - low
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def score(self, features):
+        """Scores of a (rows x FEATURES) matrix, as a (rows x SCORES) matrix"""
+        z = features @ self.matrix + self.bias
+        return self.low + self.span / (1.0 + np.exp(-z))
+
+    def score_one(self, vector):
+        """Scores of one feature vector, as a dict keyed by SCORES"""
+        values = self.score(np.asarray([vector], dtype=np.float64))[0]
+        return dict(zip(SCORES, values.tolist()))
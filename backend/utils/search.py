@@ -0,0 +1,87 @@
+"""
+SQLite FTS5 full-text index over meeting content.
+
+The index is a regular (content-storing) FTS5 table keyed by the meeting id,
+so ranked queries and highlighted snippets never touch the meetings table.
+"""
+import re
+
+from sqlalchemy import text
+
+SEARCH_TABLE = 'meeting_search'
+SEARCH_COLUMNS = ('title', 'location', 'topics', 'quotes', 'summary')
+
+# bm25 column weights, in SEARCH_COLUMNS order: title and topic hits rank highest
+COLUMN_WEIGHTS = (10.0, 2.0, 5.0, 1.0, 1.0)
+
+_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def create_search_table(connection):
+    """Create the FTS5 virtual table if it does not exist yet"""
+    connection.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+        f"USING fts5({', '.join(SEARCH_COLUMNS)}, tokenize='porter unicode61')"
+    ))
+
+
+def index_document(connection, doc_id, fields):
+    """Insert or replace the indexed text for one meeting"""
+    index_documents(connection, [(doc_id, fields)])
+
+
+def index_documents(connection, documents):
+    """Insert or replace the indexed text for (doc_id, fields) pairs with two executemany calls"""
+    if not documents:
+        return
+    columns = ', '.join(SEARCH_COLUMNS)
+    placeholders = ', '.join('?' for _ in SEARCH_COLUMNS)
+    rows = [
+        (doc_id,) + tuple(fields.get(column) or '' for column in SEARCH_COLUMNS)
+        for doc_id, fields in documents
+    ]
+    connection.exec_driver_sql(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = ?", [(row[0],) for row in rows])
+    connection.exec_driver_sql(f"INSERT INTO {SEARCH_TABLE} (rowid, {columns}) VALUES (?, {placeholders})", rows)
+
+
+def remove_document(connection, doc_id):
+    """Drop one meeting from the index"""
+    connection.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid"), {'rowid': doc_id})
+
+
+def clear_index(connection):
+    connection.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+
+
+def build_match_query(user_query):
+    """
+    Turn free text into a safe FTS5 MATCH expression
+
+    Every word becomes a quoted prefix term, so punctuation or FTS operators
+    typed by users can never produce a syntax error.
+    """
+    terms = _TERM_PATTERN.findall(user_query or '')
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def search(connection, user_query, limit=20, offset=0):
+    """
+    Run a ranked full-text search
+
+    Returns:
+        list: dicts with the meeting ``id``, bm25 ``score`` (lower is better)
+        and a highlighted ``snippet``
+    """
+    match = build_match_query(user_query)
+    if not match:
+        return []
+
+    weights = ', '.join(str(weight) for weight in COLUMN_WEIGHTS)
+    rows = connection.execute(text(
+        f"SELECT rowid, bm25({SEARCH_TABLE}, {weights}) AS score, "
+        f"snippet({SEARCH_TABLE}, -1, '<mark>', '</mark>', '...', 12) AS snippet "
+        f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match "
+        f"ORDER BY score LIMIT :limit OFFSET :offset"
+    ), {'match': match, 'limit': limit, 'offset': offset})
+
+    return [{'id': row.rowid, 'score': row.score, 'snippet': row.snippet} for row in rows]
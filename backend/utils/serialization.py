@@ -0,0 +1,187 @@
+"""
+Typed payload schemas and fast encoders for the meeting API.
+
+JSON goes through orjson when it is installed (stdlib json otherwise).
+Clients that ask for ``application/msgpack`` get compact MessagePack, and
+large bodies are compressed with brotli or gzip according to Accept-Encoding.
+"""
+from collections import namedtuple
+from dataclasses import dataclass, field
+from datetime import date, datetime
+import gzip
+import json
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPES = ('application/msgpack', 'application/x-msgpack')
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 1024
+
+
+# JSON columns
+
+def loads(data):
+    """Decode JSON text or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj):
+    """Encode to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_to_builtin)
+    return json.dumps(obj, default=_to_builtin, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_text(obj):
+    """Encode to compact JSON text, for Text columns"""
+    return dumps(obj).decode('utf-8')
+
+
+def load_column(value, empty):
+    """Decode a JSON column, falling back to ``empty`` for NULL or corrupt values"""
+    if not value:
+        return empty
+    try:
+        return loads(value)
+    except ValueError:
+        return empty
+
+
+def _to_builtin(obj):
+    if hasattr(obj, '__dataclass_fields__'):
+        return obj.__dict__
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+# Payload schemas
+
+@dataclass
+class MeetingSummary:
+    """Listing fields of a meeting, as returned by /api/meetings"""
+    id: int
+    title: str
+    location: str
+    date: Optional[str]
+    priority: str
+    priority_score: str
+    engagement: str
+    topics: List[str]
+    status: str
+    url: str
+    priority_score_value: Optional[float]
+    engagement_value: Optional[float]
+    high_segment_seconds: Optional[int]
+
+    @classmethod
+    def summary_fields(cls, meeting):
+        return dict(
+            id=meeting.id,
+            title=meeting.title,
+            location=meeting.location,
+            date=meeting.date.strftime('%Y-%m-%d') if meeting.date else None,
+            priority=meeting.priority,
+            priority_score=meeting.priority_score,
+            engagement=meeting.engagement,
+            topics=load_column(meeting.topics, []),
+            status=meeting.status,
+            url=meeting.url,
+            priority_score_value=meeting.priority_score_value,
+            engagement_value=meeting.engagement_value,
+            high_segment_seconds=meeting.high_segment_seconds
+        )
+
+    @classmethod
+    def from_row(cls, meeting):
+        """Build from a Meeting instance or a row with the listing columns"""
+        return cls(**cls.summary_fields(meeting))
+
+
+@dataclass
+class MeetingDetail(MeetingSummary):
+    """Full meeting payload, as returned by /api/meeting/<id>"""
+    quotes: List[dict] = field(default_factory=list)
+    analysis: dict = field(default_factory=dict)
+    ai_accuracy: Optional[float] = None
+    participants: List[dict] = field(default_factory=list)
+
+    @classmethod
+    def from_meeting(cls, meeting):
+        return cls(
+            **cls.summary_fields(meeting),
+            quotes=meeting.get_quotes(),
+            analysis=meeting.get_analysis(),
+            ai_accuracy=meeting.ai_accuracy,
+            participants=meeting.get_participants()
+        )
+
+
+@dataclass
+class PersonMeeting(MeetingSummary):
+    """A meeting that names a person, as returned by /api/people/<id>/meetings"""
+    role: Optional[str] = None
+    quoted: bool = False
+
+    @classmethod
+    def from_row(cls, row):
+        """Build from a row with the listing columns plus the mention's role and quoted"""
+        return cls(**cls.summary_fields(row), role=row.role, quoted=row.quoted)
+
+
+# Content negotiation
+
+Variant = namedtuple('Variant', ['mimetype', 'encoding'])
+
+
+def negotiate(request):
+    """Pick the response media type and content encoding for a request"""
+    offered = [JSON_MIMETYPE] + (list(MSGPACK_MIMETYPES) if msgpack is not None else [])
+    mimetype = request.accept_mimetypes.best_match(offered, default=JSON_MIMETYPE)
+
+    codings = ['br', 'gzip'] if brotli is not None else ['gzip']
+    encoding = request.accept_encodings.best_match(codings)
+    return Variant(mimetype, encoding)
+
+
+def variant_tag(variant):
+    """Suffix that keeps ETags and cache keys distinct per representation"""
+    name = 'msgpack' if variant.mimetype in MSGPACK_MIMETYPES else 'json'
+    return f"{name}+{variant.encoding}" if variant.encoding else name
+
+
+def encode_body(payload, variant):
+    """
+    Serialize ``payload`` for the negotiated variant
+
+    Returns:
+        tuple: (body bytes, Content-Encoding or None)
+    """
+    if variant.mimetype in MSGPACK_MIMETYPES:
+        body = msgpack.packb(payload, default=_to_builtin, use_bin_type=True)
+    else:
+        body = dumps(payload)
+
+    if variant.encoding is None or len(body) < MIN_COMPRESS_SIZE:
+        return body, None
+    if variant.encoding == 'br':
+        return brotli.compress(body, quality=5), 'br'
+    return gzip.compress(body, compresslevel=6), 'gzip'
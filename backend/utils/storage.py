@@ -0,0 +1,30 @@
+"""
+Storage helpers for tuning the SQLite connection pool.
+"""
+from sqlalchemy import event
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """
+    Run ``PRAGMA name=value`` for every new pooled connection
+
+    Args:
+        engine: SQLAlchemy engine; non-SQLite engines are left untouched
+        pragmas (dict): pragma names to values, applied in order
+    """
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+
+
+def sqlite_pragma_values(connection, names):
+    """Read back the current value of each pragma, e.g. to verify the storage profile"""
+    return {name: connection.exec_driver_sql(f'PRAGMA {name}').scalar() for name in names}
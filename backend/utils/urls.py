@@ -0,0 +1,47 @@
+"""
+Meeting URL normalization.
+
+Two URLs that point at the same meeting page map to the same canonical form,
+which is what analyses are deduplicated on.
+"""
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Query parameters that only track where a link was shared
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src'}
+
+
+def normalize_url(url):
+    """
+    Return the canonical form of ``url``
+
+    The scheme and host are lowercased, default ports, fragments, tracking
+    parameters and trailing slashes are dropped, and the remaining query
+    parameters are sorted. A missing scheme defaults to https.
+    """
+    url = (url or '').strip()
+    if not url:
+        return url
+    if '://' not in url:
+        url = f'https://{url}'
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    netloc = host
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        netloc = f'{host}:{parts.port}'
+    if parts.username:
+        credentials = parts.username + (f':{parts.password}' if parts.password else '')
+        netloc = f'{credentials}@{netloc}'
+
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ))
+    return urlunsplit((scheme, netloc, path, query, ''))
@@ -4,6 +4,13 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import json
+import os
+from urllib.error import URLError
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+# Backend serving /api/analytics/query; the Analytics page falls back to sample data without it
+API_URL = os.environ.get('CIVICSCOOP_API_URL', 'http://localhost:5000')
 
 # Set page config
 st.set_page_config(
@@ -435,6 +442,17 @@ def load_meeting_data():
     ]
     return meetings
 
+@st.cache_data(ttl=60, show_spinner=False)
+def query_analytics(metric, **params):
+    """Run a backend analytics metric; returns a DataFrame, or None if the backend is unavailable"""
+    query = urlencode({'metric': metric, **{k: v for k, v in params.items() if v is not None}})
+    try:
+        with urlopen(f"{API_URL}/api/analytics/query?{query}", timeout=5) as response:
+            result = json.loads(response.read())
+    except (URLError, OSError, ValueError):
+        return None
+    return pd.DataFrame(result['rows'], columns=result['columns'])
+
 # Sidebar navigation with exact styling
 def create_sidebar():
     st.sidebar.markdown("""
@@ -991,13 +1009,23 @@ def analytics_page():
     </div>
     """, unsafe_allow_html=True)
 
+    kpis = query_analytics('kpis')
+    if kpis is None:
+        st.caption("Backend analytics unavailable; showing sample data.")
+
     # KPI metrics
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("📊 Total Meetings", "247", "↑ 12%")
+        if kpis is not None:
+            st.metric("📊 Total Meetings", f"{int(kpis['meetings'][0]):,}")
+        else:
+            st.metric("📊 Total Meetings", "247", "↑ 12%")
     with col2:
-        st.metric("🤖 AI Accuracy", "98.7%", "↑ 0.3%")
+        if kpis is not None and pd.notna(kpis['avg_ai_accuracy'][0]):
+            st.metric("🤖 AI Accuracy", f"{kpis['avg_ai_accuracy'][0]:.1f}%")
+        else:
+            st.metric("🤖 AI Accuracy", "98.7%", "↑ 0.3%")
     with col3:
         st.metric("📰 Stories Generated", "1,247", "↑ 23%")
     with col4:
@@ -1010,8 +1038,13 @@ def analytics_page():
 
     with col1:
         st.markdown("### 📈 Meeting Analysis Trends (Last 30 Days)")
-        dates = pd.date_range(start='2024-11-02', end='2024-12-02', freq='D')
-        meeting_counts = [5 + (i % 8) + (i // 7) for i in range(len(dates))]
+        since = (datetime.now() - timedelta(days=30)).date().isoformat()
+        trend = query_analytics('trend', granularity='day', **{'from': since})
+        if trend is not None:
+            dates, meeting_counts = pd.to_datetime(trend['period']), trend['meetings']
+        else:
+            dates = pd.date_range(start='2024-11-02', end='2024-12-02', freq='D')
+            meeting_counts = [5 + (i % 8) + (i // 7) for i in range(len(dates))]
 
         fig = px.line(
             x=dates,
@@ -1028,8 +1061,12 @@ def analytics_page():
 
     with col2:
         st.markdown("### 🏷️ Topic Distribution")
-        topics = ["Housing", "Budget", "Climate", "Transit", "Education", "Public Safety", "Development"]
-        counts = [45, 38, 32, 28, 24, 18, 15]
+        distribution = query_analytics('topic_distribution', limit=7)
+        if distribution is not None:
+            topics, counts = distribution['topic'], distribution['meetings']
+        else:
+            topics = ["Housing", "Budget", "Climate", "Transit", "Education", "Public Safety", "Development"]
+            counts = [45, 38, 32, 28, 24, 18, 15]
 
         fig = px.pie(
             values=counts,
@@ -1050,11 +1087,15 @@ def analytics_page():
 
     with col1:
         # AI Accuracy vs Engagement scatter
-        meetings_df = pd.DataFrame(load_meeting_data())
+        points = query_analytics('priority_engagement', limit=500)
+        if points is not None:
+            meetings_df = points.rename(columns={'priority_score': 'priority_numeric', 'engagement': 'engagement_numeric'})
+        else:
+            meetings_df = pd.DataFrame(load_meeting_data())
 
-        # Extract numeric values from engagement strings
-        meetings_df['engagement_numeric'] = meetings_df['engagement'].str.extract(r'(\d+\.?\d*)').astype(float)
-        meetings_df['priority_numeric'] = meetings_df['priorityScore'].str.extract(r'(\d+)').astype(int)
+            # Extract numeric values from engagement strings
+            meetings_df['engagement_numeric'] = meetings_df['engagement'].str.extract(r'(\d+\.?\d*)').astype(float)
+            meetings_df['priority_numeric'] = meetings_df['priorityScore'].str.extract(r'(\d+)').astype(int)
 
         fig = px.scatter(
             meetings_df,
@@ -1080,18 +1121,24 @@ def analytics_page():
         hours = list(range(24))
         days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
 
-        # Generate sample activity data
-        activity_data = []
-        for day in range(7):
-            day_data = []
-            for hour in range(24):
-                # Simulate meeting activity (higher during business hours)
-                if 9 <= hour <= 17:
-                    activity = 15 + (hour % 3) * 5 + day * 2
-                else:
-                    activity = 2 + (hour % 2) + day
-                day_data.append(activity)
-            activity_data.append(day_data)
+        heatmap = query_analytics('heatmap')
+        if heatmap is not None:
+            activity_data = [[0] * 24 for _ in range(7)]
+            for day, hour, count in heatmap.itertuples(index=False):
+                activity_data[int(day) - 1][int(hour)] = int(count)
+        else:
+            # Generate sample activity data
+            activity_data = []
+            for day in range(7):
+                day_data = []
+                for hour in range(24):
+                    # Simulate meeting activity (higher during business hours)
+                    if 9 <= hour <= 17:
+                        activity = 15 + (hour % 3) * 5 + day * 2
+                    else:
+                        activity = 2 + (hour % 2) + day
+                    day_data.append(activity)
+                activity_data.append(day_data)
 
         fig = go.Figure(data=go.Heatmap(
             z=activity_data,
@@ -1102,7 +1149,7 @@ def analytics_page():
         ))
 
         fig.update_layout(
-            title="Weekly Meeting Activity Pattern",
+            title="Meetings Added by Day and Hour" if heatmap is not None else "Weekly Meeting Activity Pattern",
             xaxis_title="Hour of Day",
             yaxis_title="Day of Week",
             plot_bgcolor='rgba(0,0,0,0)',
@@ -1114,6 +1161,18 @@ def analytics_page():
     # Performance metrics table
     st.markdown("### 📊 Detailed Performance Metrics")
 
+    performance = query_analytics('location_performance', limit=10)
+    if performance is not None:
+        performance_df = pd.DataFrame({
+            'Location': performance['location'],
+            'Meetings': performance['meetings'],
+            'Avg Engagement': performance['avg_engagement'].map(lambda value: f"{value:.1f}%"),
+            'AI Accuracy': performance['avg_ai_accuracy'].map(lambda value: f"{value:.1f}%"),
+            'Avg Priority Score': performance['avg_priority_score'].map(lambda value: f"{value:.0f}%")
+        })
+        st.dataframe(performance_df, use_container_width=True)
+        return
+
     performance_data = {
         'Location': ['Austin', 'Seattle', 'Miami-Dade', 'Denver', 'Richmond'],
         'Meetings': [15, 12, 8, 6, 4],